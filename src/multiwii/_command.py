@@ -1,4 +1,4 @@
-from struct import calcsize
+from struct import Struct
 from typing import Final, NoReturn
 
 class _MspCommand(object):
@@ -9,6 +9,11 @@ class _MspCommand(object):
     It includes information about the command code, whether the command size is variable,
     if it is a set-command, and details about the structure format used for serializing and
     deserializing corresponding data values.
+
+    The data and payload structures are compiled to `struct.Struct` instances once, using
+    little-endian byte order without alignment padding as on the wire, and reused for every
+    message. Structures for the repetitions of variable-size commands are compiled on first
+    use and cached.
     """
     _code: Final[int]
 
@@ -16,21 +21,29 @@ class _MspCommand(object):
 
     _data_size: Final[int]
 
+    _data_struct: Final[Struct | None]
+
+    _data_struct_field_count: Final[int]
+
     _has_variable_size: Final[bool]
 
     _is_set_command: Final[bool]
 
+    _payload_struct: Final[Struct | None]
+
     _payload_struct_format: Final[str]
 
+    _variable_data_structs: Final[dict[int, Struct]]
+
     def __init__(self, code: int, data_format: str = None) -> NoReturn:
         """
         Initializes an instance using the provided code and struct format.
 
         Note
         ----
-        This constructor will use `struct.calcsize` to calculate the data size of the data
-        structure format, and to validate the format string itself. Invalid format strings
-        will cause `struct.calcsize` to raise an exception of type `struct.error`.
+        This constructor will compile the data structure format with `struct.Struct`, which
+        calculates the data size and validates the format string itself. Invalid format
+        strings will cause an exception of type `struct.error` to be raised.
 
         Parameters
         ----------
@@ -68,21 +81,35 @@ class _MspCommand(object):
 
         self._is_set_command = code >= 200
 
+        self._variable_data_structs = {}
+
         if not data_struct_format:
             self._data_field_count = 0
 
             self._data_size = 0
 
+            self._data_struct = None
+
+            self._data_struct_field_count = 0
+
+            self._payload_struct = None
+
             self._payload_struct_format = None 
 
             return
 
-        self._data_size = calcsize(f'<{data_struct_format}') 
+        self._data_struct = Struct(f'<{data_struct_format}')
+
+        self._data_struct_field_count = len(self._data_struct.unpack(bytes(self._data_struct.size)))
+
+        self._data_size = self._data_struct.size
 
         self._data_field_count = data_field_count
 
         self._payload_struct_format = f'<2B{data_struct_format}'
 
+        self._payload_struct = Struct(self._payload_struct_format)
+
     def __int__(self) -> int:
         """
         Returns the integer representation of the object, as the MSP command code.
@@ -92,7 +119,7 @@ class _MspCommand(object):
         int
             The MSP command code.
         """
-        self._code
+        return self._code
 
     def __repr__(self) -> str:
         """
@@ -171,6 +198,32 @@ class _MspCommand(object):
         """
         return self._data_size
 
+    @property
+    def data_struct(self) -> Struct | None:
+        """
+        Gets the compiled data structure.
+
+        Returns
+        -------
+        Struct | None
+            The compiled data structure for a single repetition of the data structure
+            format, or None if the command has no data.
+        """
+        return self._data_struct
+
+    @property
+    def data_struct_field_count(self) -> int:
+        """
+        Gets the number of values in a single repetition of the data structure.
+
+        Returns
+        -------
+        int
+            The number of values packed or unpacked by `data_struct`, which is used to
+            calculate the repetitions of variable-size commands.
+        """
+        return self._data_struct_field_count
+
     @property
     def data_struct_format(self) -> str:
         """
@@ -209,6 +262,19 @@ class _MspCommand(object):
         """
         return self._is_set_command
 
+    @property
+    def payload_struct(self) -> Struct | None:
+        """
+        Gets the compiled payload structure.
+
+        Returns
+        -------
+        Struct | None
+            The compiled structure of the data size, the command code and the data values,
+            or None if the command has no data.
+        """
+        return self._payload_struct
+
     @property
     def payload_struct_format(self) -> str:
         """
@@ -219,4 +285,37 @@ class _MspCommand(object):
         str
             The payload struct format string.
         """
-        return self._payload_struct_format
\ No newline at end of file
+        return self._payload_struct_format
+
+    def get_data_struct(self, count: int) -> Struct | None:
+        """
+        Gets the compiled data structure for a number of repetitions of the data format.
+
+        Parameters
+        ----------
+        count : int
+            The number of repetitions, which is ignored for commands with a fixed size.
+
+        Returns
+        -------
+        Struct | None
+            The compiled data structure, or None if the command has no data.
+        """
+        if not self._has_variable_size:
+            return self._data_struct
+
+        data_struct = self._variable_data_structs.get(count)
+
+        if data_struct is None:
+            data_struct_format = self.data_struct_format
+
+            if data_struct_format == 's':
+                data_struct_format = f'{count}s'
+            else:
+                data_struct_format *= count
+
+            data_struct = Struct(f'<{data_struct_format}')
+
+            self._variable_data_structs[count] = data_struct
+
+        return data_struct
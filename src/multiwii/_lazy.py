@@ -0,0 +1,60 @@
+from importlib import import_module
+
+# The `typing` module is not imported, since it takes longer to import than the packages that
+# use this module. Type checkers treat any `TYPE_CHECKING` constant as true.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+def _create_lazy_attribute_functions(
+    package_name:           str,
+    namespace:              'dict[str, Any]',
+    attribute_module_names: 'dict[str, str]',
+    submodule_names:        'frozenset[str]' = frozenset()
+) -> 'tuple[Callable[[str], Any], Callable[[], list[str]]]':
+    """
+    Creates the module `__getattr__` and `__dir__` functions of a package that imports its
+    attributes from their submodules on first access, as described in PEP 562.
+
+    Importing the package itself then does not import any of its submodules, so that
+    short-lived processes only pay for the parts they use. Each imported attribute is stored
+    in the package namespace, so that `__getattr__` is only called once per attribute.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, e.g. `multiwii`.
+    namespace : dict[str, Any]
+        The namespace of the package, as returned by `globals()`.
+    attribute_module_names : dict[str, str]
+        The names of the submodules that define the attributes of the package, relative to the
+        package and mapped by attribute name.
+    submodule_names : frozenset[str]
+        The names of the submodules that are imported on first access as an attribute of the
+        package.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The `__getattr__` and `__dir__` functions of the package.
+    """
+    def __getattr__(name: str) -> 'Any':
+        if name in submodule_names:
+            return import_module(f'.{name}', package_name)
+
+        module_name = attribute_module_names.get(name)
+
+        if module_name is None:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        value = getattr(import_module(f'.{module_name}', package_name), name)
+
+        namespace[name] = value
+
+        return value
+
+    def __dir__() -> 'list[str]':
+        return sorted(namespace.keys() | attribute_module_names.keys() | submodule_names)
+
+    return __getattr__, __dir__
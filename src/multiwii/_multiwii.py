@@ -0,0 +1,1387 @@
+from ._command import _MspCommand
+
+from .commands import (
+    MSP_ACC_CALIBRATION,
+    MSP_BIND,
+    MSP_EEPROM_WRITE,
+    MSP_RESET_CONF,
+    MSP_SELECT_SETTING,
+    MSP_SET_BOX,
+    MSP_SET_HEAD,
+    MSP_SET_MISC,
+    MSP_SET_MOTOR,
+    MSP_SET_PID,
+    MSP_SET_RAW_GPS,
+    MSP_SET_RAW_RC,
+    MSP_SET_RC_TUNING,
+    MSP_SET_SERVO_CONF,
+    MSP_SET_WP
+)
+
+from .messaging import (
+    _create_request_message,
+    _MspFrame,
+    _MspFrameDecoder,
+    _MspResponseMessage,
+    _parse_response_message,
+    MspMessageError,
+    MspMessageTimeoutError
+)
+
+from collections import deque
+
+from threading import Lock
+
+from time import monotonic_ns, perf_counter, sleep
+
+from typing import Any, Final, NoReturn, Sequence, Type, TYPE_CHECKING
+
+# The reader and writer threads, the transports, pyserial, the data structure types and the
+# request messages are imported by the methods that use them, so that importing this module
+# does not import them.
+if TYPE_CHECKING:
+    from ._reader   import _MspReaderThread
+    from ._writer   import _MspWriterThread
+
+    from .data import (
+        MspBox,
+        MspMotor,
+        MspPid,
+        MspRawGps,
+        MspRc,
+        MspRcTuning,
+        MspServoConf,
+        MspSetMisc,
+        MspWaypoint
+    )
+
+    from .recorder  import FrameRecorder
+    from .store     import TelemetryStore
+    from .transport import Transport
+
+    from serial import Serial
+
+class MultiWii(object):
+    """
+    The main class for wiiproxy that handles communication with MultiWii flight controllers.
+    
+    This class requires an open serial port with a baudrate of 115200 to be passed at
+    instantiation.
+
+    Note
+    ----
+    This class supports MSP v1 and does not support any newer versions.
+
+    Note
+    ----
+    This class can be imported directly through the main module.
+    """
+    DEFAULT_MESSAGE_WRITE_READ_DELAY: Final[float] = 0.0
+    """float: The default delay in seconds between writing and reading messages."""
+
+    DEFAULT_RESPONSE_TIMEOUT: Final[float] = 1.0
+    """float: The default time in seconds to wait for a response message."""
+
+    DEFAULT_WRITE_BATCH_SIZE: Final[int] = 62
+    """int: The default size in bytes at which coalesced messages are written, which fits a
+    single full-speed USB packet of common USB-serial adapters."""
+
+    DEFAULT_WRITE_MAX_DELAY: Final[float] = 0.002
+    """float: The default maximum time in seconds a coalesced message waits to be written."""
+
+    MSP_VERSION: Final[int] = 1
+    """int: The supported MultiWii Serial Protocol version."""
+
+    _frame_decoder: Final[_MspFrameDecoder]
+
+    _message_write_read_delay: float
+
+    _persistent_stream: bool
+
+    _reader_thread: '_MspReaderThread | None'
+
+    _recorder: 'FrameRecorder | None'
+
+    _response_timeout: float
+
+    _serial_port: 'Final[Serial | None]'
+
+    _telemetry_store: 'TelemetryStore | None'
+
+    _transport: 'Final[Transport]'
+
+    _write_lock: Final[Lock]
+
+    _writer_thread: '_MspWriterThread | None'
+
+    def __init__(self, serial_port: 'Serial | Transport') -> NoReturn:
+        """
+        Initializes an instance using the provided serial port.
+
+        This constructor initializes a new instance of the MultiWii class using the provided
+        serial port for communication with the FC. It sets up the initial state of the object,
+        including the activation status, command write-read delay and serial port configuration.
+        Additionally, it ensures that the provided serial port is of the correct type (Serial
+        or Transport). If the serial port is not of the expected type, a TypeError is raised.
+
+        Parameters
+        ----------
+        serial : Serial | Transport
+            The serial port instance used for communication with the FC. This should be an
+            instance of the `Serial` class from the `pyserial` library, which provides the
+            interface for serial communication, or any other implementation of the `Transport`
+            protocol (e.g. a `TcpTransport` for Wi-Fi MSP bridges).
+
+        Raises
+        ------
+        TypeError
+            If the provided serial port instance is not an instance of the `Serial` class and
+            does not implement the `Transport` protocol.
+        """
+        from ._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+        from .transport import _create_transport, SerialTransport
+
+        transport = _create_transport(serial_port)
+
+        self._command_to_data_structure_type_map = dict(_COMMAND_TO_DATA_STRUCTURE_TYPE_MAP)
+
+        self._frame_decoder = _MspFrameDecoder()
+
+        self._message_write_read_delay = self.DEFAULT_MESSAGE_WRITE_READ_DELAY
+
+        self._persistent_stream = False
+
+        self._reader_thread = None
+
+        self._recorder = None
+
+        self._response_timeout = self.DEFAULT_RESPONSE_TIMEOUT
+
+        self._serial_port = serial_port if isinstance(transport, SerialTransport) else None
+
+        self._telemetry_store = None
+
+        self._transport = transport
+
+        self._write_lock = Lock()
+
+        self._writer_thread = None
+
+    @property
+    def command_to_data_structure_type_map(self) -> dict[_MspCommand, Type]:
+        """
+        Gets the command to data structure type dictionary.
+
+        Returns
+        -------
+        dict[_MspCommand, Type]
+            A instance with a copy of the map.
+        """
+        return dict(self._command_to_data_structure_type_map)
+    
+    @property
+    def message_write_read_delay(self) -> float:
+        """
+        Gets the delay (in seconds) between each write and read message.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        return self._message_write_read_delay
+
+    @property
+    def recorder(self) -> 'FrameRecorder | None':
+        """
+        Gets the recorder that sent and received frames are appended to.
+
+        Returns
+        -------
+        FrameRecorder | None
+            The recorder, or None if frames are not recorded.
+        """
+        return self._recorder
+
+    @property
+    def response_timeout(self) -> float:
+        """
+        Gets the default time (in seconds) to wait for a response message.
+
+        Returns
+        -------
+        float
+            The timeout in seconds.
+        """
+        return self._response_timeout
+
+    @property
+    def resync_count(self) -> int:
+        """
+        Gets the number of times corrupt received bytes were skipped to find the next frame.
+
+        Returns
+        -------
+        int
+            The number of resynchronizations.
+        """
+        return self._frame_decoder.resync_count
+
+    @property
+    def serial_port(self) -> 'Serial | None':
+        """
+        Gets the serial port instance.
+
+        Returns
+        -------
+        Serial | None
+            The serial port instance, or None if a different transport is used.
+        """
+        return self._serial_port
+
+    @property
+    def telemetry_store(self) -> 'TelemetryStore | None':
+        """
+        Gets the store that the data values of received telemetry frames are appended to.
+
+        Returns
+        -------
+        TelemetryStore | None
+            The telemetry store, or None if data values are not stored.
+        """
+        return self._telemetry_store
+
+    @property
+    def transport(self) -> 'Transport':
+        """
+        Gets the transport instance used for communication with the FC.
+
+        Returns
+        -------
+        Transport
+            The transport instance.
+        """
+        return self._transport
+
+    @property
+    def uses_background_reader(self) -> bool:
+        """
+        Gets a value indicative whether a background reader thread owns the serial port reads.
+
+        Returns
+        -------
+        bool
+            True if the background reader is running, False if it has not been started, has
+            been stopped, or was terminated by a transport error.
+        """
+        return self._reader_thread is not None and self._reader_thread.is_alive()
+
+    @property
+    def uses_persistent_stream(self) -> bool:
+        """
+        Gets a value indicative whether the serial port is used as a continuous byte stream.
+
+        Returns
+        -------
+        bool
+            True if the serial port buffers are not reset after each message, False otherwise.
+        """
+        return self._persistent_stream
+
+    @property
+    def uses_write_coalescing(self) -> bool:
+        """
+        Gets a value indicative whether outgoing messages are coalesced into fewer writes.
+
+        Returns
+        -------
+        bool
+            True if the write coalescing is enabled, False otherwise.
+        """
+        return self._writer_thread is not None
+
+    @message_write_read_delay.setter
+    def message_write_read_delay(self, value: float) -> NoReturn:
+        """
+        Sets the delay (in seconds) between each write and read command.
+
+        This property controls the delay between each write message followed by a read message
+        sent to the FC. A message with empty data values is sent first, followed by a delay,
+        and then a read message to retrieve information from the FC.
+
+        Note
+        ----
+        Response messages are read as soon as they arrive, so the delay is disabled by default.
+        It is only needed for FCs that must not receive any bytes while they are busy.
+
+        Parameters
+        ----------
+        value : float
+            The delay in seconds.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a float.
+        ValueError
+            If the value is a negative number.
+        """
+        if not isinstance(value, float):
+            raise TypeError('Value must be a float.')
+
+        if value < 0:
+            raise ValueError('Value must be a non-negative number.')
+            
+        self._message_write_read_delay = value
+
+    @recorder.setter
+    def recorder(self, value: 'FrameRecorder | None') -> NoReturn:
+        """
+        Sets the recorder that sent and received frames are appended to.
+
+        Sent frames are recorded when they are passed to the transport, or queued if the write
+        coalescing is enabled. Received frames are recorded when they are decoded, including
+        frames that are not awaited by any request.
+
+        Note
+        ----
+        The recorder is not closed when it is replaced or removed.
+
+        Parameters
+        ----------
+        value : FrameRecorder | None
+            The recorder, or None to stop recording.
+        """
+        self._recorder = value
+
+        self._update_frame_observer()
+
+    @response_timeout.setter
+    def response_timeout(self, value: float) -> NoReturn:
+        """
+        Sets the default time (in seconds) to wait for a response message.
+
+        Parameters
+        ----------
+        value : float
+            The timeout in seconds.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a float.
+        ValueError
+            If the value is not a positive number.
+        """
+        if not isinstance(value, float):
+            raise TypeError('Value must be a float.')
+
+        if value <= 0:
+            raise ValueError('Value must be a positive number.')
+
+        self._response_timeout = value
+
+    @telemetry_store.setter
+    def telemetry_store(self, value: 'TelemetryStore | None') -> NoReturn:
+        """
+        Sets the store that the data values of received telemetry frames are appended to.
+
+        The data values of every received frame of a stored command are written to the
+        columns of the store as the frame is decoded, without creating any data structure
+        instances. This includes frames that are not awaited by any request.
+
+        Parameters
+        ----------
+        value : TelemetryStore | None
+            The telemetry store, or None to stop storing data values.
+        """
+        self._telemetry_store = value
+
+        self._update_frame_observer()
+
+    @uses_persistent_stream.setter
+    def uses_persistent_stream(self, value: bool) -> NoReturn:
+        """
+        Sets a value indicative whether the serial port is used as a continuous byte stream.
+
+        By default, the input buffer is reset after each read and the output buffer after each
+        write, which discards any bytes left over from an earlier exchange at the cost of two
+        extra system calls per message. Resetting the output buffer may also discard bytes of a
+        request that have not been transmitted yet.
+
+        In the persistent-stream mode, the buffers are reset only once when the mode is
+        enabled. Received bytes are kept in the frame decoder between calls, and responses are
+        matched to requests by their command code, while frames with other codes are skipped.
+
+        Note
+        ----
+        A late response to a request that timed out is still received, and it is matched to
+        the next request with the same command code. Use the background reader if requests
+        may time out and responses must never be mismatched.
+
+        Parameters
+        ----------
+        value : bool
+            True to enable the persistent-stream mode, False to disable it.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a bool.
+        """
+        if not isinstance(value, bool):
+            raise TypeError('Value must be a bool.')
+
+        if value and not self._persistent_stream and self._reader_thread is None:
+            self._frame_decoder.reset()
+
+            self._transport.reset_input_buffer()
+
+        self._persistent_stream = value
+
+    def _await_response_frames(
+        self,
+        commands: Sequence[_MspCommand],
+        deadline: float
+    ) -> list[_MspFrame]:
+        """
+        Sends request messages for the MSP commands and awaits the responses from the
+        background reader thread.
+
+        The futures for the responses are registered before the requests are written, so that
+        no response can be missed by the reader thread.
+
+        Parameters
+        ----------
+        commands : Sequence[_MspCommand]
+            A sequence of `_MspCommand` instances representing the MSP commands to read.
+        deadline : float
+            The `perf_counter` value after which the responses are no longer awaited.
+
+        Raises
+        ------
+        Exception
+            The exception that terminated the background reader thread, e.g. a transport error,
+            if it is no longer running.
+        MspMessageError
+            If an error message is returned from the FC.
+        MspMessageTimeoutError
+            If not all response messages are received before the deadline.
+
+        Returns
+        -------
+        list[_MspFrame]
+            A list of the response frames, in the same order as the commands.
+        """
+        from ._registry import _get_request_messages
+
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        reader_thread = self._reader_thread
+
+        if reader_thread.exception is not None:
+            raise reader_thread.exception
+
+        futures = [reader_thread.add_pending_future(command.code) for command in commands]
+
+        try:
+            self._write_message(_get_request_messages(tuple(commands)), flush=True)
+
+            frames = [future.result(max(deadline - perf_counter(), 0)) for future in futures]
+        except FutureTimeoutError:
+            raise MspMessageTimeoutError('No response message was received from the FC.')
+        finally:
+            for command, future in zip(commands, futures):
+                if not future.done():
+                    reader_thread.remove_pending_future(command.code, future)
+
+        return frames
+
+    def _get_deadline(self, timeout: float | None) -> float:
+        """
+        Gets the `perf_counter` deadline for a response message.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The time in seconds to wait, or None to use the default response timeout.
+
+        Returns
+        -------
+        float
+            The deadline as a `perf_counter` value.
+        """
+        if timeout is None:
+            timeout = self._response_timeout
+
+        return perf_counter() + timeout
+
+    def _observe_frame(self, frame: memoryview) -> NoReturn:
+        """
+        Passes a decoded raw frame to the recorder and the telemetry store, if set.
+
+        Parameters
+        ----------
+        frame : memoryview
+            The raw frame, including the header and the checksum.
+        """
+        if self._recorder is not None:
+            self._recorder.record_received(frame)
+
+        if self._telemetry_store is not None:
+            self._telemetry_store.append_frame(monotonic_ns(), frame)
+
+    def _read_response_frame(
+        self,
+        command: _MspCommand,
+        timeout: float | None = None
+    ) -> _MspFrame:
+        """
+        Reads the frame of a response message from the FC using the MSP command.
+
+        Note
+        ----
+        This method sends a write message with empty values to the FC in order to retrieve a
+        response message. Ensure that the FC is ready to to respond to the command code sent.
+        Frames with other command codes, such as late acknowledgements of set-commands, are
+        skipped.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to read the message.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+
+        Raises
+        ------
+        MspMessageError
+            If an error message is returned from the FC.
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+
+        Returns
+        -------
+        _MspFrame
+            The checksum-verified response frame, with the unparsed payload.
+        """
+        deadline = self._get_deadline(timeout)
+
+        if self._reader_thread is not None:
+            return self._await_response_frames((command,), deadline)[0]
+
+        try:
+            self._send_request_message(command, flush=True)
+
+            if self._message_write_read_delay:
+                sleep(self._message_write_read_delay)
+
+            while True:
+                for frame in self._receive_frames(deadline):
+                    if frame.code != command.code:
+                        continue
+
+                    if frame.is_error:
+                        raise MspMessageError('An error has occured.')
+
+                    return frame
+        finally:
+            self._reset_input()
+
+    def _read_response_message(
+        self,
+        command: _MspCommand,
+        timeout: float | None = None
+    ) -> _MspResponseMessage:
+        """
+        Reads a response message from the FC using the MSP command and parses its data values.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to read the message.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+
+        Raises
+        ------
+        MspMessageError
+            If an error message is returned from the FC.
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+
+        Returns
+        -------
+        _MspResponseMessage
+            A named tuple with the command, parsed data and additional information.
+        """
+        frame = self._read_response_frame(command, timeout)
+
+        return _parse_response_message(command, frame.payload)
+
+    def _receive_frames(self, deadline: float) -> list[_MspFrame]:
+        """
+        Reads bytes from the serial port until at least one frame has been decoded.
+
+        Each read requests the bytes that are waiting in the input buffer, or the number of
+        bytes still needed to complete the next frame if that is more. The read therefore
+        returns as soon as the frame is complete. The bytes are read directly into the
+        reusable receive buffer of the frame decoder.
+
+        Note
+        ----
+        A single read blocks for at most the read timeout of the transport, which means that
+        the deadline is enforced with the granularity of that timeout. Open the serial port
+        with a finite `timeout` for the deadline to be honored.
+
+        Parameters
+        ----------
+        deadline : float
+            The `perf_counter` value after which no more bytes will be awaited.
+
+        Raises
+        ------
+        MspMessageError
+            If the frame decoder detects an invalid frame.
+        MspMessageTimeoutError
+            If no complete frame is received before the deadline.
+
+        Returns
+        -------
+        list[_MspFrame]
+            A non-empty list of the frames that were decoded, in the order they were received.
+        """
+        frames = ()
+
+        while not frames:
+            if perf_counter() >= deadline:
+                raise MspMessageTimeoutError('No response message was received from the FC.')
+
+            frames = self._frame_decoder.read_from(self._transport)
+
+        return frames
+
+    def _reset_input(self) -> NoReturn:
+        """
+        Discards the received bytes that have not been decoded yet, unless the persistent-stream
+        mode is enabled.
+        """
+        if self._persistent_stream:
+            return
+
+        self._frame_decoder.reset()
+
+        self._transport.reset_input_buffer()
+
+    def _send_request_message(
+        self,
+        command: _MspCommand,
+        data:    tuple[int] = (),
+        flush:   bool       = False
+    ) -> NoReturn:
+        """
+        Sends a request message to the FC using the provided MSP command and data values.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to write the message.
+        data : tuple[int]
+            Data values to serialize and include in the message payload.
+        flush : bool
+            True if a response to the message is awaited, which writes any coalesced messages
+            immediately.
+        """
+        from ._registry import _get_request_message
+
+        if data:
+            self._write_message(_create_request_message(command, data), flush)
+        else:
+            self._write_message(_get_request_message(command), flush)
+
+    def _update_frame_observer(self) -> NoReturn:
+        """
+        Sets the frame observer of the frame decoder if any received frames are observed.
+        """
+        if self._recorder is None and self._telemetry_store is None:
+            self._frame_decoder.frame_observer = None
+        else:
+            self._frame_decoder.frame_observer = self._observe_frame
+
+    def _write_message(
+        self,
+        message:              bytes,
+        flush:                bool = False,
+        resets_output_buffer: bool = True
+    ) -> NoReturn:
+        """
+        Writes a serialized message to the FC while holding the write lock.
+
+        If the write coalescing is enabled, the message is queued instead, and it is written
+        together with other queued messages.
+
+        Parameters
+        ----------
+        message : bytes
+            The full message in bytes.
+        flush : bool
+            True if a response to the message is awaited, which writes any queued messages
+            immediately.
+        resets_output_buffer : bool
+            True to reset the output buffer after the write if neither the background reader
+            nor the persistent stream is used, False to keep any bytes that have not been
+            transmitted yet.
+        """
+        with self._write_lock:
+            if self._recorder is not None:
+                self._recorder.record_sent(message)
+
+            if self._writer_thread is not None:
+                self._writer_thread.enqueue(message, flush)
+
+                return
+
+            try:
+                self._transport.write(message)
+            finally:
+                if (
+                    resets_output_buffer and
+                    self._reader_thread is None and
+                    not self._persistent_stream
+                ):
+                    self._transport.reset_output_buffer()
+
+    def arm(self) -> NoReturn:
+        """
+        Arms the vehicle.
+
+        This method prepares the vehicle for operation by simulating the arming sequence
+        performed by physical transmitters. It sets the throttle value to its minimum, and
+        the yaw value to its maximum, for a few seconds simultaneously to initiate the arming
+        process. This ensures that the vehicle is ready for further commands and a safe flight.
+
+        Note
+        ----
+        Ensure that the vehicle is in a safe enviornment and that conditions are suitable for
+        arming before invoking this method.
+        """
+        from .data import MspRc
+
+        data = MspRc(
+            roll=1500,
+            pitch=1500,
+            yaw=2000,
+            throttle=1000,
+            aux1=0,
+            aux2=0,
+            aux3=0,
+            aux4=0
+        )
+
+        start_time = perf_counter()
+
+        elapsed_time = 0
+
+        while elapsed_time < 0.5:
+            self.set_raw_rc(data)
+
+            sleep(0.05)
+
+            elapsed_time = perf_counter() - start_time
+
+    def bind_transmitter_and_receiver(self) -> NoReturn:
+        """
+        Sends an MSP_BIND command to the FC using the provided data values.
+
+        This command initiates the binding process between the transmitter (radio controller)
+        and the receiver connected to the FC. Binding establishes a secure communication link
+        between the transmitter (TX) and the receiver (RX).
+
+        Note
+        ----
+        Ensure that the FC is ready to receive the bind command and that the transmitter is in
+        binding mode before calling this method.
+        """
+        self._send_request_message(MSP_BIND)
+
+    def calibrate_accelerometer(self) -> NoReturn:
+        """
+        Sends an MSP_ACC_CALIBRATION command to the FC using the provided data values.
+
+        This command initiates the accelerometer calibration process on the FC. Accelerometer
+        calibration is essential for accurate attitude estimation and stabilization of the
+        aircraft.
+
+        Note
+        ----
+        The FC should be placed on a level surface during the calibration to ensure accurate
+        results. Avoid moving or disturbing the FC during the process.
+        """
+        self._send_request_message(MSP_ACC_CALIBRATION)
+
+    def calibrate_magnetometer(self) -> NoReturn:
+        """
+        Sends an MSP_MAG_CALIBRATION command to the FC using the provided data values.
+
+        This command initiates the magnetometer (compass) calibration process on the FC.
+        Magnetometer calibration is crucial for accurate heading estimation and navigation,
+        especially in GPS-assisted flight modes.
+
+        Note
+        ----
+        The FC should be rotated along all three axes (roll, pitch, yaw) in a smooth and
+        consistent manner to ensure accurate results. Avoid any magnetic interference or
+        disturbances during the process.
+        """
+        self._send_request_message(MSP_ACC_CALIBRATION)
+
+    def disarm(self) -> NoReturn:
+        """
+        Disarms the vehicle.
+
+        This method safely disarms the vehicle by resetting the yaw and throttle to their minimum
+        values. This process simulates the disarming sequence used by physical transmitters,
+        ensuring that the vehicle is no longer ready for flight, and that the vehicle is in a
+        more safe state.
+
+        Note
+        ----
+        Always ensure that the vehicle is on the ground and stationary before invoking this
+        method to avoid accidental movement or damage.
+        """
+        from .data import MspRc
+
+        data = MspRc(
+            roll=1500,
+            pitch=1500,
+            yaw=1000,
+            throttle=1000,
+            aux1=0,
+            aux2=0,
+            aux3=0,
+            aux4=0
+        )
+
+        start_time = perf_counter()
+
+        elapsed_time = 0
+
+        while elapsed_time < 0.5:
+            self.set_raw_rc(data)
+
+            sleep(0.05)
+
+            elapsed_time = perf_counter() - start_time
+
+    def flush_writes(self) -> NoReturn:
+        """
+        Writes all coalesced messages that are still queued, if the write coalescing is enabled.
+        """
+        with self._write_lock:
+            if self._writer_thread is not None:
+                self._writer_thread.flush()
+
+    def get_data(
+        self,
+        command: _MspCommand,
+        timeout: float | None = None,
+        lazy:    bool = False,
+        out:     Any = None
+    ) -> Any:
+        """
+        Sends a given command to the FC and parses the retrieved data values.
+
+        The method returns as soon as the complete response message has been received.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command to get corresponding data
+            values for.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+        lazy : bool
+            True to return a `MspResponseView` over the payload that decodes each field only
+            when it is first read, False to parse all fields at once. Commands with a variable
+            size are always parsed at once.
+        out : Any
+            An existing instance of the data structure type of the command to parse the data
+            values into, e.g. to reuse a single instance in a polling loop, or None to create
+            a new instance. Only the instance itself is reused, as its field values are still
+            created anew.
+
+        Raises
+        ------
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+        TypeError
+            If `out` is not an instance of the data structure type of the command.
+        ValueError
+            If both `lazy` and `out` are specified.
+
+        Returns
+        -------
+        Any
+            An instance of a corresponding data structure type for the given command, which is
+            `out` if specified, or a view with the same fields if `lazy` is True.
+        """
+        data_structure_type = self._command_to_data_structure_type_map[command]
+
+        if out is not None:
+            if lazy:
+                raise ValueError('Cannot parse a lazy view into an existing instance.')
+
+            if not isinstance(out, data_structure_type):
+                raise TypeError(
+                    f'Expected an instance of {data_structure_type.__name__}, got '
+                    f'{type(out).__name__}.'
+                )
+
+        if lazy:
+            from .views import create_response_view
+
+            frame = self._read_response_frame(command, timeout)
+
+            return create_response_view(command, frame.payload)
+
+        data = self._read_response_message(command, timeout).data
+
+        if out is not None:
+            return data_structure_type.parse_into(out, data)
+
+        return data_structure_type.parse(data)
+
+    def get_many(self, commands: Sequence[_MspCommand], timeout: float | None = None) -> tuple:
+        """
+        Sends the given commands to the FC in a single write and parses the retrieved data
+        values.
+
+        All request messages are written back-to-back without any delay, and the response
+        messages are matched to the requests by their command code as they arrive. Responses
+        for commands that were not requested (e.g. stale responses from earlier requests) are
+        ignored.
+
+        Parameters
+        ----------
+        commands : Sequence[_MspCommand]
+            A sequence of `_MspCommand` instances representing the MSP commands to get
+            corresponding data values for. A command may occur more than once.
+        timeout : float | None
+            The time in seconds to wait for all response messages, or None to use the default
+            response timeout.
+
+        Raises
+        ------
+        MspMessageError
+            If an error message is returned from the FC for any of the commands.
+        MspMessageTimeoutError
+            If not all response messages are received before the timeout expires.
+
+        Returns
+        -------
+        tuple
+            A tuple with instances of the corresponding data structure types for the given
+            commands, in the same order as the commands.
+        """
+        from ._registry import _get_request_messages
+
+        deadline = self._get_deadline(timeout)
+
+        if self._reader_thread is not None:
+            frames = self._await_response_frames(commands, deadline)
+
+            return tuple(
+                self._command_to_data_structure_type_map[command].parse(
+                    _parse_response_message(command, frame.payload).data
+                )
+                for command, frame in zip(commands, frames)
+            )
+
+        pending = {}
+
+        for index, command in enumerate(commands):
+            pending.setdefault(command.code, deque()).append((index, command))
+
+        results = [None] * len(commands)
+
+        remaining = len(commands)
+
+        try:
+            # The output buffer is deliberately not reset here, as that would discard the
+            # part of the requests that has not been transmitted yet.
+            message = _get_request_messages(tuple(commands))
+
+            with self._write_lock:
+                if self._recorder is not None:
+                    self._recorder.record_sent(message)
+
+                if self._writer_thread is not None:
+                    self._writer_thread.enqueue(message, True)
+                else:
+                    self._transport.write(message)
+
+            while remaining:
+                for frame in self._receive_frames(deadline):
+                    requests = pending.get(frame.code)
+
+                    if not requests:
+                        continue
+
+                    index, command = requests.popleft()
+
+                    if frame.is_error:
+                        raise MspMessageError(f'An error has occured for {command!r}.')
+
+                    data = _parse_response_message(command, frame.payload).data
+
+                    results[index] = self._command_to_data_structure_type_map[command].parse(data)
+
+                    remaining -= 1
+        finally:
+            self._reset_input()
+
+        return tuple(results)
+
+    def reset_config(self) -> NoReturn:
+        """
+        Sends an MSP_RESET_CONF command to the FC using the provided data values.
+
+        This command resets the configuration settings on the FC to their default values.
+        It effectively restores the FC to its initial configuration state, clearing any
+        customized settings or adjustments made by the user.
+
+        Note
+        ----
+        Resetting the config should be done with caution, as it will revert all settings to
+        their defaults. Make sure to reconfigure the FC according to your requirements after
+        executing this command to the FC using the provided data values.
+        """
+        self._send_request_message(MSP_RESET_CONF)
+
+    def save_config_to_eeprom(self) -> NoReturn:
+        """
+        Sends an MSP_EEPROM_WRITE command to the FC using the provided data values.
+
+        This command writes the current configuration settings to the EEPROM of the FC. 
+
+        Note
+        ----
+        Writing to EEPROM should be done with caution, as it modifies the stored config
+        directly. Ensure that the values written are valid and intended, as incorrect
+        values could lead to unexpected behavior or instability.
+        """
+        self._send_request_message(MSP_EEPROM_WRITE)
+
+    def select_setting(self, value: int) -> NoReturn:
+        """
+        Sends an MSP_SELECT_SETTING command to the FC using the provided data values.
+
+        Selects the "setting configuration" with different PID and rate values using the given
+        range value.
+
+        Parameters
+        ----------
+        value : int
+            A value of 0, 1 or 2.
+
+        Raises
+        ------
+        ValueError
+            If the provided value is not 0, 1 or 2.
+        """
+        if not value in (0, 1, 2):
+            raise ValueError('Value must be 0, 1 or 2.')
+
+        self._send_request_message(MSP_SELECT_SETTING, data=(value,))
+
+    def send_message(self, message: bytes) -> NoReturn:
+        """
+        Writes a complete, serialized message to the FC without awaiting a response.
+
+        This method is intended for messages that are encoded once and sent repeatedly, such
+        as the MSP_SET_RAW_RC messages of `RcStreamer`. The message is recorded and coalesced
+        like any other message, but the output buffer is never reset after the write, so the
+        message is always transmitted completely, even at high send rates.
+
+        Parameters
+        ----------
+        message : bytes
+            The full message in bytes, including the header and the checksum.
+        """
+        self._write_message(message, resets_output_buffer=False)
+
+    def set_boxes(self, data: 'MspBox') -> NoReturn:
+        """
+        Sends an MSP_SET_BOX command to the FC using the provided data values.
+
+        Sets the flight modes (or "boxes") config on the FC. Flight modes define the behavior
+        of the aircraft based on various inputs from the transmitter or other sources.
+
+        Parameters
+        ----------
+        data : tuple[MspBoxItem]
+            A tuple of non-null `MspBoxItem` values.
+        """
+        self._send_request_message(MSP_SET_BOX, data.as_serializable())
+
+    def set_head(self, value: int) -> NoReturn:
+        """
+        Sends an MSP_SET_HEAD command to the FC using the provided data values.
+
+        Sets the heading (yaw) direction reference on the FC with a value range of -180 to 180.
+        It is used to define the forward direction of the aircraft relative to its orientation.
+
+        Parameters
+        ----------
+        range : int
+            The heading direction value within a range of -180 and 180.
+
+        Raises
+        ------
+        ValueError
+            If the provided range value is less than -180 or greater than 180.
+        """
+        if not -180 <= value <= 180:
+            raise ValueError('Value must be within the range of -180 and 180.')
+
+        self._send_request_message(MSP_SET_HEAD, data=(value,))
+
+    def set_misc_config(self, data: 'MspSetMisc') -> NoReturn:
+        """
+        Sends an MSP_SET_MISC command to the FC using the provided data values.
+
+        Sets miscellaneous config parameters on the FC—such as battery voltage scaling, failsafe
+        behavior, or other settings not covered by specific MSP commands.
+
+        Parameters
+        ----------
+        data : MspSetMisc
+            An instance of the `MspSetMisc` class populated with values.
+        """
+        self._send_request_message(MSP_SET_MISC, data.as_serializable())
+
+    def set_motors(self, data: 'MspMotor') -> NoReturn:
+        """
+        Sends an MSP_SET_MOTOR command to the FC using the provided data values.
+
+        Sets the motor output values on the FC. Motor output values determine the throttle level
+        for each motor, controlling the rotation speed and thrust generated by the motors.
+
+        Parameters
+        ----------
+        data : MspMotor
+            An instance of the `MspMotor` class populated with values.
+        """
+        self._send_request_message(MSP_SET_MOTOR, data.as_serializable())
+
+    def set_pid_values(self, data: 'MspPid') -> NoReturn:
+        """
+        Sends an MSP_SET_PID command to the FC using the provided data values.
+
+        Sets the PID values on the FC. PID values are used to adjust the stability and response
+        characteristics of the aircraft.
+
+        Parameters
+        ----------
+        data : MspPid
+            An instance of the `MspPid` class populated with values.
+        """
+        self._send_request_message(MSP_SET_PID, data.as_serializable())
+
+    def set_raw_gps(self, data: 'MspRawGps') -> NoReturn:
+        """
+        Sends an MSP_SET_RAW_GPS command to the FC using the provided data values.
+
+        Sets the raw GPS data on the FC—such as the latitude, longitude, altitude, and other
+        GPS-related information.
+
+        Parameters
+        ----------
+        data : MspRawGps
+            An instance of the `MspRawGps` class populated with values.
+        """
+        # The ground course is not part of the MSP_SET_RAW_GPS payload.
+        data_values = data.as_serializable()[:MSP_SET_RAW_GPS.data_field_count]
+
+        self._send_request_message(MSP_SET_RAW_GPS, data_values)
+
+    def set_raw_rc(self, data: 'MspRc') -> NoReturn:
+        """
+        Sends an MSP_SET_RAW_RC command to the FC using the provided data values.
+
+        Sets the raw receiver (RC/RX) channel data on the FC. Raw FC data includes the pulse
+        width values received from the transmitter for each channel, typically representing
+        control inputs such as throttle, pitch, roll, and yaw.
+
+        Parameters
+        ----------
+        data : MspRc
+            An instance of the `MspRc` class populated with values.
+        """
+        self._send_request_message(MSP_SET_RAW_RC, data.as_serializable())
+    
+    def set_rc_tuning(self, data: 'MspRcTuning') -> NoReturn:
+        """
+        Sends an MSP_SET_RC_TUNING command to the FC using the provided data values.
+
+        Sets RC tuning parameters on the FC—such as expo, rates, and other settings related to
+        RC control response and behavior.
+
+        Parameters
+        ----------
+        data : MspRcTuning
+            An instance of the `MspRcTuning` class populated with values.
+        """
+        self._send_request_message(MSP_SET_RC_TUNING, data.as_serializable())
+
+    def set_servo_config(self, data: 'MspServoConf') -> NoReturn:
+        """
+        Sends an MSP_SET_SERVO_CONF command to the FC using the provided data values.
+
+        Sets servo config parameters on the FC—such as servo mapping, direction, endpoints, and
+        other settings related to servo control.
+        
+        Parameters
+        ----------
+        data : tuple[MspServoConfItem]
+            A tuple with instances of the `MspServoConfItem` class populated with values.
+        """
+        self._send_request_message(MSP_SET_SERVO_CONF, data.as_serializable())
+
+    def set_waypoint(self, data: 'MspWaypoint') -> NoReturn:
+        """
+        Sends an MSP_SET_WP command to the FC using the provided data values.
+
+        Dispatches a command to set a waypoint on the FC, providing specific latitude, longitude,
+        altitude, heading, duration and navigation flags for precise navigation and waypoint
+        management.
+
+        Parameters
+        ----------
+        data : MsWaypoint
+            An instance of the `MspWaypoint` class populated with values.
+        """
+        self._send_request_message(MSP_SET_WP, data.as_serializable())
+
+    def start_background_reader(self) -> NoReturn:
+        """
+        Starts a dedicated thread that owns all reads from the serial port.
+
+        While the background reader is running, the thread decodes frames continuously and
+        completes per-request futures keyed by command code. Any number of threads can then
+        call `get_data` and `get_many` concurrently without consuming each other's responses,
+        and the serial port buffers are no longer reset after each message.
+
+        Note
+        ----
+        The serial port should be opened with a finite read `timeout` on platforms where
+        pending reads cannot be cancelled, as stopping the reader waits for the current read.
+        A reader that was terminated by a transport error is replaced by a new one.
+        """
+        if self.uses_background_reader:
+            return
+
+        self._frame_decoder.reset()
+
+        self._transport.reset_input_buffer()
+
+        from ._reader import _MspReaderThread
+
+        self._reader_thread = _MspReaderThread(self._transport, self._frame_decoder)
+
+        self._reader_thread.start()
+
+    def stop_background_reader(self) -> NoReturn:
+        """
+        Stops the background reader thread, if running.
+
+        Requests that are still awaiting a response fail with an `MspMessageError`.
+        """
+        reader_thread = self._reader_thread
+
+        if reader_thread is None:
+            return
+
+        self._reader_thread = None
+
+        reader_thread.stop()
+
+    def start_write_coalescing(
+        self,
+        batch_size: int   = DEFAULT_WRITE_BATCH_SIZE,
+        max_delay:  float = DEFAULT_WRITE_MAX_DELAY
+    ) -> NoReturn:
+        """
+        Starts coalescing outgoing messages into fewer writes.
+
+        While the write coalescing is enabled, messages that do not await a response, such as
+        MSP_SET_RAW_RC and MSP_SET_HEAD, are queued instead of being written one by one. The
+        queued messages are written together in a single write, which uses a gathered
+        `os.writev` call where the transport supports it, as soon as:
+
+        - their total size reaches the batch size,
+        - the oldest of them has waited for the maximum delay,
+        - a request that awaits a response is sent, e.g. by `get_data`, or
+        - `flush_writes` is called.
+
+        Coalescing reduces the number of system calls and, for USB-serial adapters, the number
+        of USB transfers, at the cost of delaying set-commands by up to the maximum delay. The
+        output buffer of the serial port is not reset after coalesced writes.
+
+        Parameters
+        ----------
+        batch_size : int
+            The total size in bytes of the queued messages at which they are written.
+        max_delay : float
+            The maximum time in seconds a queued message waits before it is written.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is not a positive number, or the maximum delay is negative.
+        """
+        if batch_size <= 0:
+            raise ValueError('Batch size must be a positive number.')
+
+        if max_delay < 0:
+            raise ValueError('Maximum delay must be a non-negative number.')
+
+        if self._writer_thread is not None:
+            return
+
+        from ._writer import _MspWriterThread
+
+        writer_thread = _MspWriterThread(self._transport, self._write_lock, batch_size, max_delay)
+
+        writer_thread.start()
+
+        with self._write_lock:
+            self._writer_thread = writer_thread
+
+    def stop_write_coalescing(self) -> NoReturn:
+        """
+        Writes the queued messages and stops coalescing outgoing messages, if enabled.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed delayed write that has not been raised yet.
+        """
+        writer_thread = None
+
+        try:
+            # The queue is written before direct writes are resumed, to preserve the order.
+            with self._write_lock:
+                writer_thread = self._writer_thread
+
+                self._writer_thread = None
+
+                if writer_thread is not None:
+                    writer_thread.flush()
+        finally:
+            if writer_thread is not None:
+                writer_thread.stop()
@@ -0,0 +1,192 @@
+from .messaging import _MspFrame, _MspFrameDecoder, MspMessageError
+from .transport import Transport
+
+from collections        import deque
+from concurrent.futures import Future
+from threading          import Event, Lock, Thread
+from typing             import Final, NoReturn
+
+class _MspReaderThread(Thread):
+    """
+    Represents a dedicated I/O thread that owns all reads from a transport.
+
+    The thread continuously decodes frames from the transport and completes the pending
+    futures that were registered for their command codes. Futures for the same command code
+    are completed in the order they were registered.
+
+    A transport error or EOF terminates the thread. The exception is kept, so that requests
+    made afterwards fail with it immediately instead of waiting for their deadline.
+    """
+    _exception: Exception | None
+
+    _frame_decoder: Final[_MspFrameDecoder]
+
+    _lock: Final[Lock]
+
+    _pending_futures: Final[dict[int, deque[Future]]]
+
+    _stop_event: Final[Event]
+
+    _transport: Final[Transport]
+
+    def __init__(self, transport: Transport, frame_decoder: _MspFrameDecoder) -> NoReturn:
+        """
+        Initializes an instance using the provided transport and frame decoder.
+
+        Parameters
+        ----------
+        transport : Transport
+            The transport instance to read from.
+        frame_decoder : _MspFrameDecoder
+            The frame decoder to decode received bytes with, which is owned by the thread
+            while it is running.
+        """
+        super().__init__(name='MultiWiiReader', daemon=True)
+
+        self._exception = None
+
+        self._frame_decoder = frame_decoder
+
+        self._lock = Lock()
+
+        self._pending_futures = {}
+
+        self._stop_event = Event()
+
+        self._transport = transport
+
+    @property
+    def exception(self) -> Exception | None:
+        """
+        Gets the exception that terminated the thread.
+
+        Returns
+        -------
+        Exception | None
+            The exception that pending and later requests fail with, or None if the thread
+            has not terminated.
+        """
+        return self._exception
+
+    def _dispatch_frame(self, frame: _MspFrame) -> NoReturn:
+        """
+        Completes the oldest pending future for the command code of the frame.
+
+        Frames for which no future is pending are discarded.
+
+        Parameters
+        ----------
+        frame : _MspFrame
+            The decoded frame.
+        """
+        with self._lock:
+            futures = self._pending_futures.get(frame.code)
+
+            future = futures.popleft() if futures else None
+
+        if future is None:
+            return
+
+        if frame.is_error:
+            future.set_exception(MspMessageError('An error has occured.'))
+        else:
+            future.set_result(frame)
+
+    def _terminate(self, exception: Exception) -> NoReturn:
+        """
+        Stores the exception that terminated the thread and completes all pending futures
+        with it.
+
+        Parameters
+        ----------
+        exception : Exception
+            The exception to set on the futures.
+        """
+        with self._lock:
+            self._exception = exception
+
+            futures = [future for queue in self._pending_futures.values() for future in queue]
+
+            self._pending_futures.clear()
+
+        for future in futures:
+            future.set_exception(exception)
+
+    def add_pending_future(self, code: int) -> Future:
+        """
+        Registers and returns a future for the next frame with the given command code.
+
+        Parameters
+        ----------
+        code : int
+            The command code of the awaited frame.
+
+        Raises
+        ------
+        Exception
+            The exception that terminated the thread, if it is no longer running.
+
+        Returns
+        -------
+        Future
+            A future that is completed with the `_MspFrame` once it has been received.
+        """
+        future = Future()
+
+        with self._lock:
+            if self._exception is not None:
+                raise self._exception
+
+            self._pending_futures.setdefault(code, deque()).append(future)
+
+        return future
+
+    def remove_pending_future(self, code: int, future: Future) -> NoReturn:
+        """
+        Unregisters a future that is no longer awaited, e.g. after a timeout.
+
+        Parameters
+        ----------
+        code : int
+            The command code the future was registered for.
+        future : Future
+            The future to unregister.
+        """
+        with self._lock:
+            futures = self._pending_futures.get(code)
+
+            if futures and future in futures:
+                futures.remove(future)
+
+    def run(self) -> NoReturn:
+        """
+        Reads and dispatches frames until the thread is stopped.
+        """
+        transport = self._transport
+
+        while not self._stop_event.is_set():
+            try:
+                for frame in self._frame_decoder.read_from(transport):
+                    self._dispatch_frame(frame)
+            except Exception as exception:
+                self._terminate(exception)
+
+                return
+
+        self._terminate(MspMessageError('The background reader was stopped.'))
+
+    def stop(self) -> NoReturn:
+        """
+        Stops the thread and waits for it to finish.
+
+        Any read that is in progress is cancelled if the transport supports it. Otherwise,
+        stopping takes up to the read timeout of the transport.
+        """
+        self._stop_event.set()
+
+        cancel_read = getattr(self._transport, 'cancel_read', None)
+
+        if cancel_read is not None:
+            cancel_read()
+
+        self.join()
@@ -0,0 +1,136 @@
+from ._command import _MspCommand
+
+from .commands import (
+    MSP_ALTITUDE,
+    MSP_ANALOG,
+    MSP_ATTITUDE,
+    MSP_BOX,
+    MSP_BOXIDS,
+    MSP_BOXNAMES,
+    MSP_COMP_GPS,
+    MSP_IDENT,
+    MSP_MISC,
+    MSP_MOTOR,
+    MSP_MOTOR_PINS,
+    MSP_PID,
+    MSP_PIDNAMES,
+    MSP_RAW_GPS,
+    MSP_RAW_IMU,
+    MSP_RC,
+    MSP_RC_TUNING,
+    MSP_SERVO,
+    MSP_SERVO_CONF,
+    MSP_STATUS,
+    MSP_WP
+)
+
+from .data import (
+    MspAltitude,
+    MspAnalog,
+    MspAttitude,
+    MspBox,
+    MspBoxIds,
+    MspBoxNames,
+    MspCompGps,
+    MspIdent,
+    MspMisc,
+    MspMotor,
+    MspMotorPins,
+    MspPid,
+    MspPidNames,
+    MspRawGps,
+    MspRawImu,
+    MspRc,
+    MspRcTuning,
+    MspServo,
+    MspServoConf,
+    MspStatus,
+    MspWaypoint
+)
+
+from .messaging import _create_request_message
+
+from functools import lru_cache
+from typing    import Final, Sequence, Type
+
+_COMMAND_TO_DATA_STRUCTURE_TYPE_MAP: Final[dict[_MspCommand, Type]] = {
+    MSP_ALTITUDE:   MspAltitude,
+    MSP_ANALOG:     MspAnalog,
+    MSP_ATTITUDE:   MspAttitude,
+    MSP_BOX:        MspBox,
+    MSP_BOXIDS:     MspBoxIds,
+    MSP_BOXNAMES:   MspBoxNames,
+    MSP_COMP_GPS:   MspCompGps,
+    MSP_IDENT:      MspIdent,
+    MSP_MISC:       MspMisc,
+    MSP_MOTOR:      MspMotor,
+    MSP_MOTOR_PINS: MspMotorPins,
+    MSP_PID:        MspPid,
+    MSP_PIDNAMES:   MspPidNames,
+    MSP_RAW_GPS:    MspRawGps,
+    MSP_RAW_IMU:    MspRawImu,
+    MSP_RC:         MspRc,
+    MSP_RC_TUNING:  MspRcTuning,
+    MSP_SERVO:      MspServo,
+    MSP_SERVO_CONF: MspServoConf,
+    MSP_STATUS:     MspStatus,
+    MSP_WP:         MspWaypoint
+}
+"""dict[_MspCommand, Type]: The data structure types for all commands that return data values."""
+
+_CODE_TO_COMMAND_MAP: Final[dict[int, _MspCommand]] = {
+    command.code: command for command in _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+}
+"""dict[int, _MspCommand]: The commands that return data values, by their command codes."""
+
+_COMMAND_TO_REQUEST_MESSAGE_MAP: Final[dict[_MspCommand, bytes]] = {}
+"""dict[_MspCommand, bytes]: The request messages without data, which are created on first use
+of each command."""
+
+_REQUEST_MESSAGES_CACHE_SIZE: Final[int] = 64
+"""int: The maximum number of cached request message sequences."""
+
+def _get_request_message(command: _MspCommand) -> bytes:
+    """
+    Gets the request message without data for a command.
+
+    The message is created on first use of the command and cached.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        An instance of `_MspCommand` representing the requested MSP command.
+
+    Returns
+    -------
+    bytes
+        The full, immutable message in bytes.
+    """
+    message = _COMMAND_TO_REQUEST_MESSAGE_MAP.get(command)
+
+    if message is None:
+        message = _create_request_message(command, ())
+
+        _COMMAND_TO_REQUEST_MESSAGE_MAP[command] = message
+
+    return message
+
+@lru_cache(maxsize=_REQUEST_MESSAGES_CACHE_SIZE)
+def _get_request_messages(commands: Sequence[_MspCommand]) -> bytes:
+    """
+    Gets the concatenated request messages without data for a sequence of commands.
+
+    The result is cached per sequence, so that a fixed polling plan is sent as the same
+    buffer every time.
+
+    Parameters
+    ----------
+    commands : Sequence[_MspCommand]
+        A hashable sequence, e.g. a tuple, of the requested MSP commands.
+
+    Returns
+    -------
+    bytes
+        The concatenated messages in bytes, in the same order as the commands.
+    """
+    return b''.join(map(_get_request_message, commands))
@@ -0,0 +1,201 @@
+from .transport import _write_buffers, Transport
+
+from threading import Condition, Lock, Thread
+from time      import perf_counter
+from typing    import Final, NoReturn
+
+class _MspWriterThread(Thread):
+    """
+    Represents a dedicated thread that coalesces queued messages into single writes.
+
+    Messages can be queued by any thread. The queued messages are written together, in the
+    order they were queued, as soon as their total size reaches the batch size, a flush is
+    requested, or the oldest queued message has waited for the maximum delay. Writes that are
+    triggered by the batch size or a flush request are performed by the queueing thread, so
+    that any write error is raised to the caller. Only the writes that are triggered by the
+    maximum delay are performed by this thread.
+    """
+    _batch_size: Final[int]
+
+    _condition: Final[Condition]
+
+    _deadline: float
+
+    _exception: Exception | None
+
+    _max_delay: Final[float]
+
+    _queue: Final[list[bytes]]
+
+    _queued_size: int
+
+    _stop_requested: bool
+
+    _transport: Final[Transport]
+
+    _write_count: int
+
+    def __init__(
+        self,
+        transport:  Transport,
+        lock:       Lock,
+        batch_size: int,
+        max_delay:  float
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided transport, lock and flush limits.
+
+        Parameters
+        ----------
+        transport : Transport
+            The transport instance to write to.
+        lock : Lock
+            The lock that serializes all writes to the transport.
+        batch_size : int
+            The total size in bytes of the queued messages at which they are written.
+        max_delay : float
+            The maximum time in seconds a queued message waits before it is written.
+        """
+        super().__init__(name='MultiWiiWriter', daemon=True)
+
+        self._batch_size = batch_size
+
+        self._condition = Condition(lock)
+
+        self._deadline = 0.0
+
+        self._exception = None
+
+        self._max_delay = max_delay
+
+        self._queue = []
+
+        self._queued_size = 0
+
+        self._stop_requested = False
+
+        self._transport = transport
+
+        self._write_count = 0
+
+    @property
+    def write_count(self) -> int:
+        """
+        Gets the number of coalesced writes that have been performed.
+
+        Returns
+        -------
+        int
+            The number of writes.
+        """
+        return self._write_count
+
+    def _write_queue(self) -> NoReturn:
+        """
+        Writes and clears the queued messages. The lock must be held by the caller.
+        """
+        if not self._queue:
+            return
+
+        messages = tuple(self._queue)
+
+        self._queue.clear()
+
+        self._queued_size = 0
+
+        self._write_count += 1
+
+        _write_buffers(self._transport, messages)
+
+    def enqueue(self, message: bytes, flush: bool = False) -> NoReturn:
+        """
+        Queues a message and writes the queue if the batch size is reached or a flush is
+        requested. The lock must be held by the caller.
+
+        Parameters
+        ----------
+        message : bytes
+            The full message in bytes.
+        flush : bool
+            True to write the queue immediately, e.g. because a response is awaited.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed delayed write, which is raised once.
+        """
+        exception = self._exception
+
+        if exception is not None:
+            self._exception = None
+
+            raise exception
+
+        if not self._queue:
+            self._deadline = perf_counter() + self._max_delay
+
+            self._condition.notify()
+
+        self._queue.append(message)
+
+        self._queued_size += len(message)
+
+        if flush or self._queued_size >= self._batch_size:
+            self._write_queue()
+
+    def flush(self) -> NoReturn:
+        """
+        Writes the queued messages immediately. The lock must be held by the caller.
+        """
+        self._write_queue()
+
+    def run(self) -> NoReturn:
+        """
+        Writes the queued messages whenever the oldest one has waited for the maximum delay.
+        """
+        condition = self._condition
+
+        with condition:
+            while not self._stop_requested:
+                if not self._queue:
+                    condition.wait()
+
+                    continue
+
+                remaining_time = self._deadline - perf_counter()
+
+                if remaining_time > 0:
+                    condition.wait(remaining_time)
+
+                    continue
+
+                try:
+                    self._write_queue()
+                except Exception as exception:
+                    self._exception = exception
+
+    def stop(self) -> NoReturn:
+        """
+        Writes the queued messages, stops the thread and waits for it to finish.
+
+        Raises
+        ------
+        Exception
+            The exception of a failed delayed write that has not been raised yet.
+        """
+        try:
+            with self._condition:
+                self._stop_requested = True
+
+                self._condition.notify()
+
+                exception = self._exception
+
+                self._exception = None
+
+                self._write_queue()
+        finally:
+            self.join()
+
+        if exception is not None:
+            raise exception
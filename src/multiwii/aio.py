@@ -0,0 +1,814 @@
+from ._command  import _MspCommand
+from ._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP, _get_request_message
+
+from .commands import (
+    MSP_ACC_CALIBRATION,
+    MSP_BIND,
+    MSP_EEPROM_WRITE,
+    MSP_MAG_CALIBRATION,
+    MSP_RESET_CONF,
+    MSP_SELECT_SETTING,
+    MSP_SET_BOX,
+    MSP_SET_HEAD,
+    MSP_SET_MISC,
+    MSP_SET_MOTOR,
+    MSP_SET_PID,
+    MSP_SET_RAW_GPS,
+    MSP_SET_RAW_RC,
+    MSP_SET_RC_TUNING,
+    MSP_SET_SERVO_CONF,
+    MSP_SET_WP
+)
+
+from .data import (
+    MspBox,
+    MspMotor,
+    MspPid,
+    MspRawGps,
+    MspRc,
+    MspRcTuning,
+    MspServoConf,
+    MspSetMisc,
+    MspWaypoint
+)
+
+from .messaging import (
+    _create_request_message,
+    _MspFrame,
+    _MspFrameDecoder,
+    _MspResponseMessage,
+    _parse_response_message,
+    MspMessageError,
+    MspMessageTimeoutError
+)
+
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Queue,
+    TimeoutError,
+    get_running_loop,
+    sleep,
+    wait_for
+)
+
+from .transport import _create_transport, SerialTransport, Transport
+
+from .views import create_response_view
+
+from collections import deque
+from serial      import Serial
+from typing      import Any, AsyncIterator, Final, NoReturn, Self
+
+class AsyncMultiWii(object):
+    """
+    The asyncio counterpart of the `MultiWii` class.
+
+    This class registers the file descriptor of an open serial port with the running event
+    loop, and decodes response messages whenever the port becomes readable. Awaiting a command
+    therefore never blocks the event loop, and any number of commands can be awaited
+    concurrently, as responses are dispatched to the waiting callers by their command code.
+
+    Note
+    ----
+    The serial port or transport must expose a file descriptor through `fileno`, which is the
+    case for serial ports, pseudo-terminals and sockets on POSIX systems.
+
+    Note
+    ----
+    The instance must be opened, either with `open` or with an `async with` statement, before
+    any commands are sent.
+    """
+    DEFAULT_RESPONSE_TIMEOUT: Final[float] = 1.0
+    """float: The default time in seconds to wait for a response message."""
+
+    DEFAULT_STREAM_QUEUE_SIZE: Final[int] = 1
+    """int: The default number of unconsumed values a telemetry stream buffers."""
+
+    _file_descriptor: int | None
+
+    _frame_decoder: Final[_MspFrameDecoder]
+
+    _loop: AbstractEventLoop | None
+
+    _pending_futures: Final[dict[int, deque[Future]]]
+
+    _response_timeout: float
+
+    _serial_port: Final[Serial | None]
+
+    _transport: Final[Transport]
+
+    def __init__(self, serial_port: Serial | Transport) -> NoReturn:
+        """
+        Initializes an instance using the provided serial port.
+
+        Parameters
+        ----------
+        serial_port : Serial | Transport
+            The open serial port instance, or any other implementation of the `Transport`
+            protocol, used for communication with the FC.
+
+        Raises
+        ------
+        TypeError
+            If the provided serial port instance is not an instance of the `Serial` class and
+            does not implement the `Transport` protocol.
+        """
+        transport = _create_transport(serial_port)
+
+        self._file_descriptor = None
+
+        self._frame_decoder = _MspFrameDecoder()
+
+        self._loop = None
+
+        self._pending_futures = {}
+
+        self._response_timeout = self.DEFAULT_RESPONSE_TIMEOUT
+
+        self._serial_port = serial_port if isinstance(transport, SerialTransport) else None
+
+        self._transport = transport
+
+    async def __aenter__(self) -> Self:
+        """
+        Opens the instance on the running event loop.
+
+        Returns
+        -------
+        AsyncMultiWii
+            The instance itself.
+        """
+        await self.open()
+
+        return self
+
+    async def __aexit__(self, *args) -> NoReturn:
+        """
+        Closes the instance.
+        """
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Gets a value indicative whether the instance is registered with an event loop.
+
+        Returns
+        -------
+        bool
+            True if the instance is open, False otherwise.
+        """
+        return self._loop is not None
+
+    @property
+    def response_timeout(self) -> float:
+        """
+        Gets the default time (in seconds) to wait for a response message.
+
+        Returns
+        -------
+        float
+            The timeout in seconds.
+        """
+        return self._response_timeout
+
+    @property
+    def resync_count(self) -> int:
+        """
+        Gets the number of times corrupt received bytes were skipped to find the next frame.
+
+        Returns
+        -------
+        int
+            The number of resynchronizations.
+        """
+        return self._frame_decoder.resync_count
+
+    @property
+    def serial_port(self) -> Serial | None:
+        """
+        Gets the serial port instance.
+
+        Returns
+        -------
+        Serial | None
+            The serial port instance, or None if a different transport is used.
+        """
+        return self._serial_port
+
+    @property
+    def transport(self) -> Transport:
+        """
+        Gets the transport instance used for communication with the FC.
+
+        Returns
+        -------
+        Transport
+            The transport instance.
+        """
+        return self._transport
+
+    @response_timeout.setter
+    def response_timeout(self, value: float) -> NoReturn:
+        """
+        Sets the default time (in seconds) to wait for a response message.
+
+        Parameters
+        ----------
+        value : float
+            The timeout in seconds.
+
+        Raises
+        ------
+        TypeError
+            If the value is not a float.
+        ValueError
+            If the value is not a positive number.
+        """
+        if not isinstance(value, float):
+            raise TypeError('Value must be a float.')
+
+        if value <= 0:
+            raise ValueError('Value must be a positive number.')
+
+        self._response_timeout = value
+
+    def _close(self, exception: Exception) -> NoReturn:
+        """
+        Unregisters the transport from the event loop and fails all pending requests.
+
+        Parameters
+        ----------
+        exception : Exception
+            The exception to set on the pending response futures.
+        """
+        self._loop.remove_reader(self._file_descriptor)
+
+        self._file_descriptor = None
+
+        self._loop = None
+
+        self._fail_pending_futures(exception)
+
+        self._frame_decoder.reset()
+
+    def _fail_pending_futures(self, exception: Exception) -> NoReturn:
+        """
+        Completes all pending response futures with the given exception.
+
+        Parameters
+        ----------
+        exception : Exception
+            The exception to set on the futures.
+        """
+        for futures in self._pending_futures.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exception)
+
+        self._pending_futures.clear()
+
+    def _on_readable(self) -> NoReturn:
+        """
+        Reads all waiting bytes from the transport and dispatches the decoded frames.
+
+        This callback is invoked by the event loop whenever the transport is readable. Only
+        the bytes that are already waiting are read, so the callback never blocks.
+
+        If reading fails, or the transport is readable without any waiting bytes, which is
+        how the end of the connection is signaled, the instance is closed. Otherwise the
+        event loop would keep invoking the callback in a busy loop.
+        """
+        try:
+            size = self._transport.in_waiting
+
+            if not size:
+                self._close(MspMessageError('The connection was closed by the FC.'))
+
+                return
+
+            frames = self._frame_decoder.read_from(self._transport, size)
+        except OSError as exception:
+            self._close(exception)
+
+            return
+
+        for frame in frames:
+            futures = self._pending_futures.get(frame.code)
+
+            while futures:
+                future = futures.popleft()
+
+                if future.done():
+                    continue
+
+                if frame.is_error:
+                    future.set_exception(MspMessageError('An error has occured.'))
+                else:
+                    future.set_result(frame)
+
+                break
+
+    async def _read_response_frame(
+        self,
+        command: _MspCommand,
+        timeout: float | None
+    ) -> _MspFrame:
+        """
+        Sends a request message for the MSP command and awaits the frame of the response message.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to read the message.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+
+        Raises
+        ------
+        MspMessageError
+            If an error message is returned from the FC.
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+
+        Returns
+        -------
+        _MspFrame
+            The checksum-verified response frame, with the unparsed payload.
+        """
+        if not self.is_open:
+            raise RuntimeError('The instance must be opened before sending commands.')
+
+        if timeout is None:
+            timeout = self._response_timeout
+
+        future = self._loop.create_future()
+
+        self._pending_futures.setdefault(command.code, deque()).append(future)
+
+        try:
+            self._send_request_message(command)
+
+            frame = await wait_for(future, timeout)
+        except TimeoutError:
+            raise MspMessageTimeoutError('No response message was received from the FC.')
+        finally:
+            futures = self._pending_futures.get(command.code)
+
+            if futures and future in futures:
+                futures.remove(future)
+
+        return frame
+
+    async def _read_response_message(
+        self,
+        command: _MspCommand,
+        timeout: float | None
+    ) -> _MspResponseMessage:
+        """
+        Sends a request message for the MSP command and awaits the parsed response message.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to read the message.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+
+        Raises
+        ------
+        MspMessageError
+            If an error message is returned from the FC.
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+
+        Returns
+        -------
+        _MspResponseMessage
+            A named tuple with the command, parsed data and additional information.
+        """
+        frame = await self._read_response_frame(command, timeout)
+
+        return _parse_response_message(command, frame.payload)
+
+    def _send_request_message(self, command: _MspCommand, data: tuple[int] = ()) -> NoReturn:
+        """
+        Sends a request message to the FC using the provided MSP command and data values.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command used to write the message.
+        data : tuple[int]
+            Data values to serialize and include in the message payload.
+        """
+        if data:
+            message = _create_request_message(command, data)
+        else:
+            message = _get_request_message(command)
+
+        self._transport.write(message)
+
+    async def _stream_values(self, command: _MspCommand, period: float, queue: Queue) -> NoReturn:
+        """
+        Polls the MSP command at a fixed period and puts the values in the queue.
+
+        If the queue is full, the oldest value is dropped, so that a slow consumer always
+        receives the most recent values. Polls that time out are skipped, while any other
+        exception is put in the queue to be raised by the consumer.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The MSP command to poll.
+        period : float
+            The polling period in seconds.
+        queue : Queue
+            The bounded queue to put values in.
+        """
+        next_time = self._loop.time()
+
+        while True:
+            try:
+                value = await self.get_data(command)
+            except MspMessageTimeoutError:
+                value = None
+            except Exception as exception:
+                value = exception
+
+            if value is not None:
+                if queue.full():
+                    queue.get_nowait()
+
+                queue.put_nowait(value)
+
+                if isinstance(value, Exception):
+                    return
+
+            next_time = max(next_time + period, self._loop.time())
+
+            await sleep(next_time - self._loop.time())
+
+    def close(self) -> NoReturn:
+        """
+        Unregisters the transport from the event loop and fails all pending requests.
+        """
+        if not self.is_open:
+            return
+
+        self._close(MspMessageError('The connection was closed.'))
+
+    async def open(self) -> NoReturn:
+        """
+        Registers the transport with the running event loop.
+
+        Bytes that are already waiting in the input buffer are discarded, as they cannot belong
+        to any request sent through this instance.
+        """
+        if self.is_open:
+            return
+
+        self._transport.reset_input_buffer()
+
+        self._file_descriptor = self._transport.fileno()
+
+        self._loop = get_running_loop()
+
+        self._loop.add_reader(self._file_descriptor, self._on_readable)
+
+    async def arm(self) -> NoReturn:
+        """
+        Arms the vehicle without blocking the event loop.
+
+        See `MultiWii.arm` for a description of the arming sequence.
+        """
+        data = MspRc(
+            roll=1500,
+            pitch=1500,
+            yaw=2000,
+            throttle=1000,
+            aux1=0,
+            aux2=0,
+            aux3=0,
+            aux4=0
+        )
+
+        for _ in range(10):
+            await self.set_raw_rc(data)
+
+            await sleep(0.05)
+
+    async def bind_transmitter_and_receiver(self) -> NoReturn:
+        """
+        Sends an MSP_BIND command to the FC.
+        """
+        self._send_request_message(MSP_BIND)
+
+    async def calibrate_accelerometer(self) -> NoReturn:
+        """
+        Sends an MSP_ACC_CALIBRATION command to the FC.
+        """
+        self._send_request_message(MSP_ACC_CALIBRATION)
+
+    async def calibrate_magnetometer(self) -> NoReturn:
+        """
+        Sends an MSP_MAG_CALIBRATION command to the FC.
+        """
+        self._send_request_message(MSP_MAG_CALIBRATION)
+
+    async def disarm(self) -> NoReturn:
+        """
+        Disarms the vehicle without blocking the event loop.
+
+        See `MultiWii.disarm` for a description of the disarming sequence.
+        """
+        data = MspRc(
+            roll=1500,
+            pitch=1500,
+            yaw=1000,
+            throttle=1000,
+            aux1=0,
+            aux2=0,
+            aux3=0,
+            aux4=0
+        )
+
+        for _ in range(10):
+            await self.set_raw_rc(data)
+
+            await sleep(0.05)
+
+    async def get_data(
+        self,
+        command: _MspCommand,
+        timeout: float | None = None,
+        lazy:    bool = False,
+        out:     Any = None
+    ) -> Any:
+        """
+        Sends a given command to the FC and awaits the parsed data values.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command to get corresponding data
+            values for.
+        timeout : float | None
+            The time in seconds to wait for the response message, or None to use the default
+            response timeout.
+        lazy : bool
+            True to return a `MspResponseView` over the payload that decodes each field only
+            when it is first read, False to parse all fields at once.
+        out : Any
+            An existing instance of the data structure type of the command to parse the data
+            values into, e.g. to reuse a single instance in a polling loop, or None to create
+            a new instance. Only the instance itself is reused, as its field values are still
+            created anew.
+
+        Raises
+        ------
+        MspMessageTimeoutError
+            If the response message is not received before the timeout expires.
+        TypeError
+            If `out` is not an instance of the data structure type of the command.
+        ValueError
+            If both `lazy` and `out` are specified.
+
+        Returns
+        -------
+        Any
+            An instance of a corresponding data structure type for the given command, which is
+            `out` if specified, or a view with the same fields if `lazy` is True.
+        """
+        data_structure_type = _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP[command]
+
+        if out is not None:
+            if lazy:
+                raise ValueError('Cannot parse a lazy view into an existing instance.')
+
+            if not isinstance(out, data_structure_type):
+                raise TypeError(
+                    f'Expected an instance of {data_structure_type.__name__}, got '
+                    f'{type(out).__name__}.'
+                )
+
+        if lazy:
+            frame = await self._read_response_frame(command, timeout)
+
+            return create_response_view(command, frame.payload)
+
+        data = (await self._read_response_message(command, timeout)).data
+
+        if out is not None:
+            return data_structure_type.parse_into(out, data)
+
+        return data_structure_type.parse(data)
+
+    async def reset_config(self) -> NoReturn:
+        """
+        Sends an MSP_RESET_CONF command to the FC.
+        """
+        self._send_request_message(MSP_RESET_CONF)
+
+    async def save_config_to_eeprom(self) -> NoReturn:
+        """
+        Sends an MSP_EEPROM_WRITE command to the FC.
+        """
+        self._send_request_message(MSP_EEPROM_WRITE)
+
+    async def select_setting(self, value: int) -> NoReturn:
+        """
+        Sends an MSP_SELECT_SETTING command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        value : int
+            A value of 0, 1 or 2.
+
+        Raises
+        ------
+        ValueError
+            If the provided value is not 0, 1 or 2.
+        """
+        if not value in (0, 1, 2):
+            raise ValueError('Value must be 0, 1 or 2.')
+
+        self._send_request_message(MSP_SELECT_SETTING, data=(value,))
+
+    async def set_boxes(self, data: MspBox) -> NoReturn:
+        """
+        Sends an MSP_SET_BOX command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspBox
+            An instance of the `MspBox` class populated with values.
+        """
+        self._send_request_message(MSP_SET_BOX, data.as_serializable())
+
+    async def set_head(self, value: int) -> NoReturn:
+        """
+        Sends an MSP_SET_HEAD command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        value : int
+            The heading direction value within a range of -180 and 180.
+
+        Raises
+        ------
+        ValueError
+            If the provided value is less than -180 or greater than 180.
+        """
+        if not -180 <= value <= 180:
+            raise ValueError('Value must be within the range of -180 and 180.')
+
+        self._send_request_message(MSP_SET_HEAD, data=(value,))
+
+    async def set_misc_config(self, data: MspSetMisc) -> NoReturn:
+        """
+        Sends an MSP_SET_MISC command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspSetMisc
+            An instance of the `MspSetMisc` class populated with values.
+        """
+        self._send_request_message(MSP_SET_MISC, data.as_serializable())
+
+    async def set_motors(self, data: MspMotor) -> NoReturn:
+        """
+        Sends an MSP_SET_MOTOR command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspMotor
+            An instance of the `MspMotor` class populated with values.
+        """
+        self._send_request_message(MSP_SET_MOTOR, data.as_serializable())
+
+    async def set_pid_values(self, data: MspPid) -> NoReturn:
+        """
+        Sends an MSP_SET_PID command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspPid
+            An instance of the `MspPid` class populated with values.
+        """
+        self._send_request_message(MSP_SET_PID, data.as_serializable())
+
+    async def set_raw_gps(self, data: MspRawGps) -> NoReturn:
+        """
+        Sends an MSP_SET_RAW_GPS command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspRawGps
+            An instance of the `MspRawGps` class populated with values.
+        """
+        # The ground course is not part of the MSP_SET_RAW_GPS payload.
+        data_values = data.as_serializable()[:MSP_SET_RAW_GPS.data_field_count]
+
+        self._send_request_message(MSP_SET_RAW_GPS, data_values)
+
+    async def set_raw_rc(self, data: MspRc) -> NoReturn:
+        """
+        Sends an MSP_SET_RAW_RC command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspRc
+            An instance of the `MspRc` class populated with values.
+        """
+        self._send_request_message(MSP_SET_RAW_RC, data.as_serializable())
+
+    async def set_rc_tuning(self, data: MspRcTuning) -> NoReturn:
+        """
+        Sends an MSP_SET_RC_TUNING command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspRcTuning
+            An instance of the `MspRcTuning` class populated with values.
+        """
+        self._send_request_message(MSP_SET_RC_TUNING, data.as_serializable())
+
+    async def set_servo_config(self, data: MspServoConf) -> NoReturn:
+        """
+        Sends an MSP_SET_SERVO_CONF command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspServoConf
+            An instance of the `MspServoConf` class populated with values.
+        """
+        self._send_request_message(MSP_SET_SERVO_CONF, data.as_serializable())
+
+    async def set_waypoint(self, data: MspWaypoint) -> NoReturn:
+        """
+        Sends an MSP_SET_WP command to the FC using the provided data values.
+
+        Parameters
+        ----------
+        data : MspWaypoint
+            An instance of the `MspWaypoint` class populated with values.
+        """
+        self._send_request_message(MSP_SET_WP, data.as_serializable())
+
+    async def stream(
+        self,
+        command: _MspCommand,
+        hz:      float,
+        maxsize: int = DEFAULT_STREAM_QUEUE_SIZE
+    ) -> AsyncIterator[Any]:
+        """
+        Polls a given command at a fixed rate and yields the parsed data values.
+
+        The command is polled by a background task that puts the values in a bounded queue.
+        When the consumer falls behind, the oldest values are dropped rather than delaying the
+        polling. The background task is cancelled when the iteration stops.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing the MSP command to poll.
+        hz : float
+            The polling rate in hertz.
+        maxsize : int
+            The maximum number of unconsumed values to buffer.
+
+        Raises
+        ------
+        ValueError
+            If the polling rate or the queue size is not a positive number.
+
+        Yields
+        ------
+        Any
+            Instances of a corresponding data structure type for the given command.
+        """
+        if hz <= 0:
+            raise ValueError('Polling rate must be a positive number.')
+
+        if maxsize <= 0:
+            raise ValueError('Queue size must be a positive number.')
+
+        queue = Queue(maxsize)
+
+        task = get_running_loop().create_task(self._stream_values(command, 1 / hz, queue))
+
+        try:
+            while True:
+                value = await queue.get()
+
+                if isinstance(value, Exception):
+                    raise value
+
+                yield value
+        finally:
+            task.cancel()
@@ -0,0 +1,333 @@
+from ._command import _MspCommand
+
+from ._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+from .data._schema import _get_type_field_names, _get_value_count
+
+from .messaging import (
+    MESSAGE_HEADER_SIZE,
+    MESSAGE_INCOMING_HEADER,
+    MESSAGE_OVERHEAD_SIZE,
+    MspMessageError
+)
+
+from .recorder import DIRECTION_RECEIVED, read_records
+
+from re     import findall
+from typing import BinaryIO, Final, NoReturn, Sequence, TYPE_CHECKING
+
+import os
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from numpy import dtype, ndarray
+
+_STRUCT_FORMAT_CHAR_TO_DTYPE_MAP: Final[dict[str, str]] = {
+    'b': 'i1',
+    'B': 'u1',
+    'h': 'i2',
+    'H': 'u2',
+    'i': 'i4',
+    'I': 'u4',
+    'l': 'i4',
+    'L': 'u4',
+    'q': 'i8',
+    'Q': 'u8',
+    'f': 'f4',
+    'd': 'f8',
+    '?': '?'
+}
+"""dict[str, str]: The NumPy types of the `struct` format characters that can be converted,
+using the standard sizes of `struct` rather than the native sizes of NumPy."""
+
+def _get_columns(command: _MspCommand) -> tuple[tuple[str, float | None], ...]:
+    """
+    Gets the default names and scales of the columns of a command.
+
+    The columns are derived from the schema of the data structure type of the command, so
+    that they match the fields and scaling of its `parse` method. Fields with more than one
+    data value get one column per value, e.g. `coordinates_latitude` or `gyroscope_y`.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        The command.
+
+    Returns
+    -------
+    tuple[tuple[str, float | None], ...]
+        The name and scale of each column, in the order of the data values. Commands without
+        a schema get `value_<index>` names without scales.
+    """
+    fields = getattr(_COMMAND_TO_DATA_STRUCTURE_TYPE_MAP.get(command), '_FIELDS', None)
+
+    if fields is None:
+        return tuple(
+            (f'value_{index}', None) for index in range(command.data_struct_field_count)
+        )
+
+    columns = []
+
+    for field in fields:
+        count = _get_value_count(field.format)
+
+        type_field_names = _get_type_field_names(field.type)
+
+        if count == 1:
+            names = [field.name]
+        elif type_field_names is None:
+            names = [f'{field.name}_{index}' for index in range(count)]
+        elif count == len(type_field_names):
+            names = [f'{field.name}_{name}' for name in type_field_names]
+        else:
+            size = len(type_field_names)
+
+            names = [
+                f'{field.name}_{index // size}_{type_field_names[index % size]}'
+                for index in range(count)
+            ]
+
+        columns += [(name, field.scale) for name in names]
+
+    return tuple(columns)
+
+def _get_column_names(command: _MspCommand) -> tuple[str, ...]:
+    """
+    Gets the default column names of a command.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        The command.
+
+    Returns
+    -------
+    tuple[str, ...]
+        The column names derived from the schema of the data structure type, or
+        `value_<index>` names for commands without a schema.
+    """
+    return tuple(name for name, _ in _get_columns(command))
+
+def _require_numpy() -> NoReturn:
+    """
+    Ensures that NumPy can be used.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError(
+            'NumPy is required for columnar telemetry decoding and storage. '
+            'Install it with "pip install multiwii-proxy-python[numpy]".'
+        )
+
+def decode_frames(
+    command:      _MspCommand,
+    buffer:       bytes | bytearray | memoryview,
+    column_names: Sequence[str] | None = None,
+    scaled:       bool = True
+) -> dict[str, 'ndarray']:
+    """
+    Decodes many response frames of the same command at once into columns.
+
+    All frames are converted with a single `numpy.frombuffer` call, using a structured dtype
+    of the full frame. The headers, data sizes, command codes and checksums of all frames are
+    validated with vectorized operations.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        A command with fixed-size, numeric data values.
+    buffer : bytes | bytearray | memoryview
+        The response frames of the command, written back-to-back.
+    column_names : Sequence[str] | None
+        The names of the columns, or None to use the default column names.
+    scaled : bool
+        True to apply the same scaling as the `parse` method of the data structure type to the
+        columns, e.g. dividing the attitude angles by 10, False to keep the raw values.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    MspMessageError
+        If the buffer is not a whole number of valid frames of the command.
+    ValueError
+        If the data values of the command cannot be decoded into columns.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        A dictionary that maps each column name to a contiguous array with the values of all
+        frames, in the order of the frames. Scaled columns are of type `float64`.
+    """
+    data_dtype = get_data_dtype(command, column_names)
+
+    frame_size = MESSAGE_OVERHEAD_SIZE + command.data_size
+
+    if len(buffer) % frame_size:
+        raise MspMessageError(f'The buffer is not a whole number of {command!r} frames.')
+
+    frame_dtype = np.dtype([
+        ('header', f'S{MESSAGE_HEADER_SIZE}'),
+        ('size', 'u1'),
+        ('code', 'u1'),
+        ('data', data_dtype),
+        ('checksum', 'u1')
+    ])
+
+    frames = np.frombuffer(buffer, frame_dtype)
+
+    frame_bytes = np.frombuffer(buffer, np.uint8).reshape(-1, frame_size)
+
+    checksums = np.bitwise_xor.reduce(frame_bytes[:, MESSAGE_HEADER_SIZE:-1], axis=1)
+
+    is_valid = (
+        (frames['header'] == MESSAGE_INCOMING_HEADER) &
+        (frames['size'] == command.data_size) &
+        (frames['code'] == command.code) &
+        (frames['checksum'] == checksums)
+    )
+
+    if not is_valid.all():
+        raise MspMessageError(f'Frame {int(is_valid.argmin())} is not a valid {command!r} frame.')
+
+    scales = [scale for _, scale in _get_columns(command)] if scaled else []
+
+    columns = {}
+
+    for index, name in enumerate(data_dtype.names):
+        values = frames['data'][name]
+
+        if index < len(scales) and scales[index] is not None:
+            columns[name] = values / float(scales[index])
+        else:
+            columns[name] = values.astype(values.dtype.newbyteorder('='))
+
+    return columns
+
+def decode_recording(
+    file:         str | os.PathLike | BinaryIO,
+    command:      _MspCommand,
+    column_names: Sequence[str] | None = None,
+    scaled:       bool = True
+) -> dict[str, 'ndarray']:
+    """
+    Decodes all received response frames of a command in a recording at once into columns.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | BinaryIO
+        The path of a recording written by `FrameRecorder`, or a binary file object opened for
+        reading.
+    command : _MspCommand
+        A command with fixed-size, numeric data values.
+    column_names : Sequence[str] | None
+        The names of the columns, or None to use the default column names.
+    scaled : bool
+        True to apply the same scaling as the `parse` method of the data structure type to the
+        columns, False to keep the raw values.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the file is not a recording, or the data values of the command cannot be decoded
+        into columns.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        A dictionary with a `timestamp` column of `time.monotonic_ns` values, followed by
+        the columns of the data values, as returned by `decode_frames`.
+    """
+    _require_numpy()
+
+    frame_size = MESSAGE_OVERHEAD_SIZE + command.data_size
+
+    header_terminator = MESSAGE_INCOMING_HEADER[-1]
+
+    code_offset = MESSAGE_HEADER_SIZE + 1
+
+    frames = []
+
+    timestamps = []
+
+    for timestamp, direction, frame in read_records(file):
+        if (
+            direction == DIRECTION_RECEIVED and
+            len(frame) == frame_size and
+            frame[code_offset] == command.code and
+            frame[MESSAGE_HEADER_SIZE - 1] == header_terminator
+        ):
+            frames.append(frame)
+
+            timestamps.append(timestamp)
+
+    columns = decode_frames(command, b''.join(frames), column_names, scaled)
+
+    return {'timestamp': np.array(timestamps, np.int64), **columns}
+
+def get_data_dtype(command: _MspCommand, column_names: Sequence[str] | None = None) -> 'dtype':
+    """
+    Gets the NumPy structured dtype of the data values of a fixed-size command on the wire.
+
+    The dtype is derived from the `struct` format of the command, using little-endian byte
+    order without alignment padding as on the wire, so that serialized data values can be
+    converted with `numpy.frombuffer` directly.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        A command with fixed-size, numeric data values.
+    column_names : Sequence[str] | None
+        The field names of the dtype, in the order of the data values, or None to use the
+        names derived from the schema of the data structure type, e.g. `yaw_angle`, and
+        `value_<index>` for commands without a schema.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the command has a variable size or data values that cannot be converted, or if the
+        number of column names does not match the number of data values.
+
+    Returns
+    -------
+    numpy.dtype
+        A structured dtype with one field per data value.
+    """
+    _require_numpy()
+
+    if command.data_struct is None or command.has_variable_size:
+        raise ValueError(f'{command!r} does not have fixed-size data values.')
+
+    if column_names is None:
+        column_names = _get_column_names(command)
+
+    field_chars = ''
+
+    for count, char in findall(r'(\d*)(\D)', command.data_struct.format.lstrip('<')):
+        if char not in _STRUCT_FORMAT_CHAR_TO_DTYPE_MAP:
+            raise ValueError(f'{command!r} has data values that cannot be converted.')
+
+        field_chars += char * int(count or 1)
+
+    if len(column_names) != len(field_chars):
+        raise ValueError(
+            f'{command!r} has {len(field_chars)} data values, but '
+            f'{len(column_names)} column names were given.'
+        )
+
+    return np.dtype([
+        (name, '<' + _STRUCT_FORMAT_CHAR_TO_DTYPE_MAP[char])
+        for name, char in zip(column_names, field_chars)
+    ])
@@ -8,16 +8,16 @@ MSP_IDENT: Final[_MspCommand] = _MspCommand(100, '3BI:4:!')
 MSP_STATUS: Final[_MspCommand] = _MspCommand(101, '3HIB:5:!')
 """_MspCommand: An instance representing the MSP_STATUS (101) command."""
 
-MSP_RAW_IMU: Final[_MspCommand] = _MspCommand(102, '8h:8:!')
+MSP_RAW_IMU: Final[_MspCommand] = _MspCommand(102, '9h:9:!')
 """_MspCommand: An instance representing the MSP_RAW_IMU (102) command."""
 
-MSP_SERVO: Final[_MspCommand] = _MspCommand(103, '16H:16:!')
+MSP_SERVO: Final[_MspCommand] = _MspCommand(103, '8H:8:!')
 """_MspCommand: An instance representing the MSP_SERVO (103) command."""
 
-MSP_MOTOR: Final[_MspCommand] = _MspCommand(104, '16H:16:!')
+MSP_MOTOR: Final[_MspCommand] = _MspCommand(104, '8H:8:!')
 """_MspCommand: An instance representing the MSP_MOTOR (104) command."""
 
-MSP_RC: Final[_MspCommand] = _MspCommand(105, '16H:16:!')
+MSP_RC: Final[_MspCommand] = _MspCommand(105, '8H:8:!')
 """_MspCommand: An instance representing the MSP_RC (105) command."""
 
 MSP_RAW_GPS: Final[_MspCommand] = _MspCommand(106, '2B2I3H:7:!')
@@ -59,13 +59,13 @@ MSP_PIDNAMES: Final[_MspCommand] = _MspCommand(117, 's:1:?')
 MSP_WP: Final[_MspCommand] = _MspCommand(118, 'B3I2HB:7:!')
 """_MspCommand: An instance representing the MSP_WP (118) command."""
 
-MSP_BOXIDS: Final[_MspCommand] = _MspCommand(119, '3HB:4:?')
+MSP_BOXIDS: Final[_MspCommand] = _MspCommand(119, 'B:1:?')
 """_MspCommand: An instance representing the MSP_BOXIDS (119) command."""
 
 MSP_SERVO_CONF: Final[_MspCommand] = _MspCommand(120, '3HB'*8 + ':32:!')
 """_MspCommand: An instance representing the MSP_SERVO_CONF (120) command."""
 
-MSP_SET_RAW_RC: Final[_MspCommand] = _MspCommand(200, '16H:16:!')
+MSP_SET_RAW_RC: Final[_MspCommand] = _MspCommand(200, '8H:8:!')
 """_MspCommand: An instance representing the MSP_SET_RAW_RC (200) command."""
 
 MSP_SET_RAW_GPS: Final[_MspCommand] = _MspCommand(201, '2B2I2H:6:!')
@@ -104,7 +104,7 @@ MSP_SET_HEAD: Final[_MspCommand] = _MspCommand(211, 'h:1:!')
 MSP_SET_SERVO_CONF: Final[_MspCommand] = _MspCommand(212, '3HB'*8 + ':32:!')
 """_MspCommand: An instance representing the MSP_SET_SERVO_CONF (212) command."""
 
-MSP_SET_MOTOR: Final[_MspCommand] = _MspCommand(214, '16H:16:!')
+MSP_SET_MOTOR: Final[_MspCommand] = _MspCommand(214, '8H:8:!')
 """_MspCommand: An instance representing the MSP_SET_MOTOR (214) command."""
 
 MSP_BIND: Final[_MspCommand] = _MspCommand(240)
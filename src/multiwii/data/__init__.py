@@ -1,17 +1,81 @@
-from ._types import Coordinates, Pid, Point2D, Point3D
+from .._lazy import _create_lazy_attribute_functions
 
-from .box import MspBox, MspBoxIds, MspBoxItem, MspBoxNames
+# The data structure types are imported from their submodules on first access, so that using
+# a single type does not create all of them. See `multiwii.__getattr__`.
+TYPE_CHECKING = False
 
-from .info import MspAnalog, MspIdent, MspMisc, MspSetMisc, MspStatus
+if TYPE_CHECKING:
+    from typing import Final
 
-from .motor import MspMotor, MspMotorPins
+    from ._types import Coordinates, Pid, Point2D, Point3D
 
-from .navigation import MspCompGps, MspRawGps, MspWaypoint
+    from .box import MspBox, MspBoxIds, MspBoxItem, MspBoxNames
 
-from .pid import MspPid, MspPidNames
+    from .info import MspAnalog, MspIdent, MspMisc, MspSetMisc, MspStatus
 
-from .rc import MspRc, MspRcTuning
+    from .motor import MspMotor, MspMotorPins
 
-from .servo import MspServo, MspServoConf, MspServoConfItem
+    from .navigation import MspCompGps, MspRawGps, MspWaypoint
 
-from .telemetry import MspAltitude, MspAttitude, MspRawImu
\ No newline at end of file
+    from .pid import MspPid, MspPidNames
+
+    from .rc import MspRc, MspRcTuning
+
+    from .servo import MspServo, MspServoConf, MspServoConfItem
+
+    from .telemetry import MspAltitude, MspAttitude, MspRawImu
+
+_ATTRIBUTE_MODULE_NAMES: 'Final[dict[str, str]]' = {
+    'Coordinates': '_types',
+    'Pid': '_types',
+    'Point2D': '_types',
+    'Point3D': '_types',
+    'MspBox': 'box',
+    'MspBoxIds': 'box',
+    'MspBoxItem': 'box',
+    'MspBoxNames': 'box',
+    'MspAnalog': 'info',
+    'MspIdent': 'info',
+    'MspMisc': 'info',
+    'MspSetMisc': 'info',
+    'MspStatus': 'info',
+    'MspMotor': 'motor',
+    'MspMotorPins': 'motor',
+    'MspCompGps': 'navigation',
+    'MspRawGps': 'navigation',
+    'MspWaypoint': 'navigation',
+    'MspPid': 'pid',
+    'MspPidNames': 'pid',
+    'MspRc': 'rc',
+    'MspRcTuning': 'rc',
+    'MspServo': 'servo',
+    'MspServoConf': 'servo',
+    'MspServoConfItem': 'servo',
+    'MspAltitude': 'telemetry',
+    'MspAttitude': 'telemetry',
+    'MspRawImu': 'telemetry'
+}
+"""dict[str, str]: The names of the submodules that define the data structure types, mapped by
+type name."""
+
+_SUBMODULE_NAMES: 'Final[frozenset[str]]' = frozenset((
+    'box',
+    'info',
+    'motor',
+    'navigation',
+    'pid',
+    'rc',
+    'servo',
+    'telemetry'
+))
+"""frozenset[str]: The names of the submodules of the package, which are imported on first
+access as an attribute of the package."""
+
+__all__ = sorted(_ATTRIBUTE_MODULE_NAMES)
+
+__getattr__, __dir__ = _create_lazy_attribute_functions(
+    __name__,
+    globals(),
+    _ATTRIBUTE_MODULE_NAMES,
+    _SUBMODULE_NAMES
+)
@@ -0,0 +1,512 @@
+from dataclasses import fields as get_dataclass_fields, is_dataclass
+from enum        import IntEnum
+from re          import findall
+from typing      import Any, Callable, Final, NamedTuple, NoReturn, Type
+
+class _Field(NamedTuple):
+    """
+    Represents a single field of a data structure type and its serialized data values.
+
+    Attributes
+    ----------
+    name : str
+        The name of the field.
+    format : str
+        The `struct` format characters of the data values of the field, e.g. `h` or `2I`.
+    scale : float | None
+        The factor by which the field value is multiplied on the wire, e.g. 10.0 for values
+        that are sent in tenths, or None for values that are sent as is.
+    type : Callable | None
+        An `IntEnum` or `_Flags` type to map single data values to, a `NamedTuple` or dataclass
+        type that is constructed from the data values, or None for plain values. Data values
+        that are more than the fields of the type are grouped into a tuple of instances.
+    """
+    name: str
+
+    format: str
+
+    scale: float | None = None
+
+    type: Callable | None = None
+
+class _Flags(object):
+    """
+    Represents the mapping of a bitmask data value to a tuple of enumeration members.
+    """
+    _enum_type: Final[Type[IntEnum]]
+
+    _uses_bit_positions: Final[bool]
+
+    def __init__(self, enum_type: Type[IntEnum], uses_bit_positions: bool = False) -> NoReturn:
+        """
+        Initializes an instance using the provided enumeration type.
+
+        Parameters
+        ----------
+        enum_type : Type[IntEnum]
+            The enumeration type of the flags.
+        uses_bit_positions : bool
+            True if the member values are bit positions, False if they are bit masks.
+        """
+        self._enum_type = enum_type
+
+        self._uses_bit_positions = uses_bit_positions
+
+    def decode(self, value: int) -> tuple[IntEnum]:
+        """
+        Gets the members of which the bits are set in a bitmask.
+
+        Parameters
+        ----------
+        value : int
+            The bitmask.
+
+        Returns
+        -------
+        tuple[IntEnum]
+            The members, in definition order.
+        """
+        if self._uses_bit_positions:
+            return tuple(member for member in self._enum_type if value >> member & 1)
+
+        return tuple(member for member in self._enum_type if member & value == member)
+
+    def encode(self, members: tuple[IntEnum]) -> int:
+        """
+        Gets the bitmask of a tuple of members.
+
+        Parameters
+        ----------
+        members : tuple[IntEnum]
+            The members.
+
+        Returns
+        -------
+        int
+            The bitmask.
+        """
+        value = 0
+
+        for member in members:
+            value |= 1 << member if self._uses_bit_positions else member
+
+        return value
+
+def _get_value_count(format: str) -> int:
+    """
+    Gets the number of data values of a `struct` format.
+
+    Parameters
+    ----------
+    format : str
+        The format characters, without byte order.
+
+    Returns
+    -------
+    int
+        The number of data values, where each `s` string counts as one.
+    """
+    return sum(
+        1 if char == 's' else int(count or 1) for count, char in findall(r'(\d*)(\D)', format)
+    )
+
+def _get_type_field_names(value_type: Callable) -> tuple[str, ...] | None:
+    """
+    Gets the field names of a `NamedTuple` or dataclass type.
+
+    Parameters
+    ----------
+    value_type : Callable
+        The type.
+
+    Returns
+    -------
+    tuple[str, ...] | None
+        The field names, or None if the type has no fields.
+    """
+    if is_dataclass(value_type):
+        return tuple(field.name for field in get_dataclass_fields(value_type))
+
+    return getattr(value_type, '_fields', None)
+
+def _compile_field_decoder(
+    field:     _Field,
+    values:    list[str],
+    namespace: dict[str, Any]
+) -> str:
+    """
+    Gets the source code of the expression that decodes a field from its data values.
+
+    Parameters
+    ----------
+    field : _Field
+        The field.
+    values : list[str]
+        The names of the variables with the data values of the field.
+    namespace : dict[str, Any]
+        The namespace of the generated code, to which referenced types are added.
+
+    Returns
+    -------
+    str
+        The expression.
+    """
+    if field.scale is not None:
+        values = [f'{value} / {float(field.scale)!r}' for value in values]
+
+    if field.type is None:
+        return values[0] if len(values) == 1 else f'({", ".join(values)},)'
+
+    type_name = f'_{field.name}_type'
+
+    if isinstance(field.type, _Flags):
+        namespace[type_name] = field.type.decode
+
+        return f'{type_name}({values[0]})'
+
+    namespace[type_name] = field.type
+
+    size = len(_get_type_field_names(field.type) or values)
+
+    items = [
+        f'{type_name}({", ".join(values[index:index + size])})'
+        for index in range(0, len(values), size)
+    ]
+
+    return items[0] if len(values) == size else f'({", ".join(items)},)'
+
+def _compile_field_encoder(field: _Field, namespace: dict[str, Any]) -> list[str]:
+    """
+    Gets the source code of the expressions that encode a field to its data values.
+
+    Parameters
+    ----------
+    field : _Field
+        The field.
+    namespace : dict[str, Any]
+        The namespace of the generated code, to which referenced types are added.
+
+    Returns
+    -------
+    list[str]
+        The expressions, one per data value.
+    """
+    attribute = f'self.{field.name}'
+
+    count = _get_value_count(field.format)
+
+    is_enum = isinstance(field.type, type) and issubclass(field.type, IntEnum)
+
+    if isinstance(field.type, _Flags):
+        namespace[f'_{field.name}_type'] = field.type.encode
+
+        values = [f'_{field.name}_type({attribute})']
+    elif is_enum:
+        values = [f'int({attribute})']
+    elif field.type is None:
+        if count == 1:
+            values = [attribute]
+        else:
+            values = [f'{attribute}[{index}]' for index in range(count)]
+    else:
+        names = _get_type_field_names(field.type)
+
+        if count == len(names):
+            values = [f'{attribute}.{name}' for name in names]
+        else:
+            values = [
+                f'{attribute}[{index // len(names)}].{names[index % len(names)]}'
+                for index in range(count)
+            ]
+
+    if field.scale is not None:
+        values = [f'round({value} * {float(field.scale)!r})' for value in values]
+
+    return values
+
+def _compile_decoder(
+    data_structure_type: Type,
+    fields:              tuple[_Field, ...],
+    in_place:            bool = False
+) -> Callable[..., Any]:
+    """
+    Generates the straight-line `parse` or `parse_into` function of a data structure type.
+
+    Parameters
+    ----------
+    data_structure_type : Type
+        The data structure type.
+    fields : tuple[_Field, ...]
+        The fields of the data structure type, in the order of the data values.
+    in_place : bool
+        True to generate a `parse_into` function that assigns the fields of an existing
+        instance, False to generate a `parse` function that creates a new instance.
+
+    Returns
+    -------
+    Callable[..., Any]
+        A function that takes the data structure type, an existing instance if `in_place` is
+        True, and a tuple of unpacked data values, and returns the populated instance.
+    """
+    namespace = {}
+
+    field_values = []
+
+    index = 0
+
+    for field in fields:
+        count = _get_value_count(field.format)
+
+        values = [f'value_{index + offset}' for offset in range(count)]
+
+        field_values.append(_compile_field_decoder(field, values, namespace))
+
+        index += count
+
+    name = data_structure_type.__name__
+
+    variables = ', '.join(f'value_{offset}' for offset in range(index))
+
+    if in_place:
+        header = 'def parse_into(cls, instance, data):\n'
+
+        body = ''.join(
+            f'    instance.{field.name} = {value}\n' for field, value in zip(fields, field_values)
+        ) + '    return instance\n'
+    else:
+        header = 'def parse(cls, data):\n'
+
+        body = f'    return cls({", ".join(field_values)})\n'
+
+    source = (
+        header +
+        f'    if len(data) != {index}:\n'
+        f'        raise TypeError(f"{name} requires {index} data values, got {{len(data)}}.")\n'
+        f'    {variables}, = data\n' +
+        body
+    )
+
+    function_name = 'parse_into' if in_place else 'parse'
+
+    exec(compile(source, f'<{name}.{function_name}>', 'exec'), namespace)
+
+    return namespace[function_name]
+
+def _compile_encoder(
+    data_structure_type: Type,
+    fields:              tuple[_Field, ...]
+) -> Callable[[Any], tuple[int]]:
+    """
+    Generates the straight-line `as_serializable` function of a data structure type.
+
+    Parameters
+    ----------
+    data_structure_type : Type
+        The data structure type.
+    fields : tuple[_Field, ...]
+        The fields of the data structure type, in the order of the data values.
+
+    Returns
+    -------
+    Callable[[Any], tuple[int]]
+        A function that takes an instance of the data structure type and returns a tuple of
+        data values to be serialized.
+    """
+    namespace = {}
+
+    values = []
+
+    for field in fields:
+        values += _compile_field_encoder(field, namespace)
+
+    source = (
+        'def as_serializable(self):\n'
+        f'    return ({", ".join(values)},)\n'
+    )
+
+    exec(compile(source, f'<{data_structure_type.__name__}.as_serializable>', 'exec'), namespace)
+
+    return namespace['as_serializable']
+
+def _compile_field_function(field: _Field) -> Callable[..., Any]:
+    """
+    Generates a function that decodes a single field from its data values.
+
+    Parameters
+    ----------
+    field : _Field
+        The field.
+
+    Returns
+    -------
+    Callable[..., Any]
+        A function that takes the data values of the field as arguments and returns the field
+        value.
+    """
+    namespace = {}
+
+    values = [f'value_{index}' for index in range(_get_value_count(field.format))]
+
+    expression = _compile_field_decoder(field, values, namespace)
+
+    source = (
+        f'def decode_{field.name}({", ".join(values)}):\n'
+        f'    return {expression}\n'
+    )
+
+    exec(compile(source, f'<{field.name}>', 'exec'), namespace)
+
+    return namespace[f'decode_{field.name}']
+
+def _set_generated_method(
+    data_structure_type: Type,
+    name:                str,
+    compile_function:    Callable[[], Callable],
+    doc:                 str,
+    is_classmethod:      bool = False
+) -> NoReturn:
+    """
+    Sets a method of a data structure type that is generated on its first call, unless the
+    method is defined in the class body itself.
+
+    The method is set to a stub, which compiles the generated function, replaces itself with it
+    and calls it. Compiling on first use keeps the import of the data structure types fast,
+    while every later call goes to the generated function directly.
+
+    Parameters
+    ----------
+    data_structure_type : Type
+        The data structure type.
+    name : str
+        The name of the method.
+    compile_function : Callable[[], Callable]
+        A function that generates the function of the method.
+    doc : str
+        The docstring of the method.
+    is_classmethod : bool
+        True to set the function as a class method, False to set it as an instance method.
+    """
+    if name in data_structure_type.__dict__:
+        return
+
+    def set_function(function: Callable) -> NoReturn:
+        function.__doc__ = doc
+
+        function.__module__ = data_structure_type.__module__
+
+        function.__qualname__ = f'{data_structure_type.__qualname__}.{name}'
+
+        setattr(data_structure_type, name, classmethod(function) if is_classmethod else function)
+
+    def compile_and_call(*args: Any) -> Any:
+        function = compile_function()
+
+        set_function(function)
+
+        return function(*args)
+
+    compile_and_call.__name__ = name
+
+    set_function(compile_and_call)
+
+def _parse_into_by_copy(cls: Type, instance: Any, data: tuple) -> Any:
+    """
+    Parses a tuple of data values into an existing instance by copying the fields of a newly
+    parsed instance.
+
+    Parameters
+    ----------
+    cls : Type
+        The data structure type.
+    instance : Any
+        The instance to populate.
+    data : tuple
+        A tuple containing unpacked data values.
+
+    Returns
+    -------
+    Any
+        The populated instance.
+    """
+    parsed = cls.parse(data)
+
+    for field in get_dataclass_fields(cls):
+        setattr(instance, field.name, getattr(parsed, field.name))
+
+    return instance
+
+def _parses_into_by_copy(data_structure_type: Type) -> Type:
+    """
+    A class decorator that adds a `parse_into` method to a data structure type without a
+    schema, e.g. one with a variable number of data values.
+
+    The method parses the data values with `parse` and copies the fields to the existing
+    instance, so it allocates like `parse` itself but keeps references to the instance valid.
+
+    Parameters
+    ----------
+    data_structure_type : Type
+        The data structure type, which must be a dataclass with a `parse` class method.
+
+    Returns
+    -------
+    Type
+        The data structure type.
+    """
+    data_structure_type.parse_into = classmethod(_parse_into_by_copy)
+
+    return data_structure_type
+
+def _schema(*fields: _Field) -> Callable[[Type], Type]:
+    """
+    Creates a class decorator that generates the `parse`, `parse_into` and `as_serializable`
+    methods of a data structure type from the declarative schema of its fields.
+
+    The methods are compiled on their first call into straight-line code without loops or
+    lookups of the schema. Methods that are defined in the class body itself are kept, e.g.
+    to support additional parameters.
+
+    Parameters
+    ----------
+    fields : _Field
+        The fields of the data structure type, in the order of the data values.
+
+    Returns
+    -------
+    Callable[[Type], Type]
+        The class decorator.
+    """
+    def decorate(data_structure_type: Type) -> Type:
+        data_structure_type._FIELDS = fields
+
+        name = data_structure_type.__name__
+
+        _set_generated_method(
+            data_structure_type,
+            'parse',
+            lambda: _compile_decoder(data_structure_type, fields),
+            'Parses a tuple of data values obtained from `struct.unpack` and returns an '
+            f'instance of the `{name}` class.',
+            is_classmethod=True
+        )
+
+        _set_generated_method(
+            data_structure_type,
+            'parse_into',
+            lambda: _compile_decoder(data_structure_type, fields, in_place=True),
+            'Parses a tuple of data values obtained from `struct.unpack` into an existing '
+            f'instance of the `{name}` class. Only the instance itself is reused, as the field '
+            'values, including nested tuples such as `Point3D`, are created anew.',
+            is_classmethod=True
+        )
+
+        _set_generated_method(
+            data_structure_type,
+            'as_serializable',
+            lambda: _compile_encoder(data_structure_type, fields),
+            'Returns a tuple with integer values to be used for serialization.'
+        )
+
+        return data_structure_type
+
+    return decorate
@@ -1,10 +1,12 @@
+from ._schema import _parses_into_by_copy
+
 from ..config    import MultiWiiBox, MultiWiiBoxState
 from ..messaging import _decode_names
 
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@dataclass(slots=True)
 class MspBoxItem:
     """
     Represents data values for the MSP_SET_BOX command.
@@ -65,7 +67,8 @@ class MspBoxItem:
         """
         return self.aux1 | self.aux2 << 3 | self.aux3 << 6 | self.aux4 << 9
 
-@dataclass
+@_parses_into_by_copy
+@dataclass(slots=True)
 class MspBox:
     """
     Represents data values for the MSP_BOX command.
@@ -106,7 +109,8 @@ class MspBox:
         """
         return (box_item.compile() for box_item in self.values)
 
-@dataclass
+@_parses_into_by_copy
+@dataclass(slots=True)
 class MspBoxIds:
     """
     Represents data values for the MSP_BOXIDS command.
@@ -132,7 +136,8 @@ class MspBoxIds:
         """
         return cls(tuple(MultiWiiBox(value) for value in data))
 
-@dataclass
+@_parses_into_by_copy
+@dataclass(slots=True)
 class MspBoxNames:
     """
     Represents data values for the MSP_BOXNAMES command.
@@ -1,9 +1,16 @@
 from ..config import MultiWiiCapability, MultiWiiMultitype, MultiWiiSensor
 
+from ._schema import _Field, _Flags, _schema
+
 from dataclasses import dataclass
-from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('voltage', 'B', 10),
+    _Field('power_meter_sum', 'H'),
+    _Field('rssi', 'H'),
+    _Field('amperage', 'H')
+)
+@dataclass(slots=True)
 class MspAnalog:
     """
     Represents data values for the MSP_ANALOG command.
@@ -23,30 +30,13 @@ class MspAnalog:
     amperage: int
     """int: The current amperage drawn, measured in milliamps."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance
-        of the `MspAnalog` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspAnalog
-            An instance of the `MspAnalog` class populated with the parsed data.
-        """
-        return cls(
-            voltage=data[0] / 10.0,
-            power_meter_sum=data[1],
-            rssi=data[2],
-            amperage=data[3]
-        )
-
-@dataclass
+@_schema(
+    _Field('version', 'B'),
+    _Field('multitype', 'B', type=MultiWiiMultitype),
+    _Field('capabilities', 'B', type=_Flags(MultiWiiCapability)),
+    _Field('navigation_version', 'I')
+)
+@dataclass(slots=True)
 class MspIdent:
     """
     Represents data values for the MSP_IDENT command.
@@ -67,38 +57,21 @@ class MspIdent:
     navigation_version: int
     """The navigation version of the firmware."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspIdent` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspIdent
-            An instance of the `MspIdent` class populated with the parsed data.
-        """
-        capabilitites = ()
-
-        available_capabilities = data[2]
-
-        for capability in MultiWiiCapability:
-            if capability & available_capabilities == capability:
-                capabilities += (capability,)
-
-        return cls(
-            version=data[0],
-            multitype=MultiWiiMultitype(data[1]),
-            capabilities=capabilities,
-            navigation_version=data[3]
-        )
-
-@dataclass
+@_schema(
+    _Field('power_trigger', 'H'),
+    _Field('throttle_failsafe', 'H'),
+    _Field('throttle_idle', 'H'),
+    _Field('throttle_min', 'H'),
+    _Field('throttle_max', 'H'),
+    _Field('power_logger_arm', 'H'),
+    _Field('power_logger_lifetime', 'I'),
+    _Field('magnetometer_declination', 'H', 10),
+    _Field('battery_scale', 'B'),
+    _Field('battery_warning_1', 'B', 10),
+    _Field('battery_warning_2', 'B', 10),
+    _Field('battery_critical', 'B', 10)
+)
+@dataclass(slots=True)
 class MspMisc:
     """
     Represents data values for the MSP_MISC command.
@@ -143,38 +116,21 @@ class MspMisc:
     battery_critical: float
     """float: The critical battery level, measured in volts."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspMisc` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspMisc
-            An instance of the `MspMisc` class populated with the parsed data.
-        """
-        return cls(
-            power_trigger=data[0],
-            throttle_failsafe=data[1],
-            throttle_idle=data[2],
-            throttle_min=data[3],
-            throttle_max=data[4],
-            power_logger_arm=data[5],
-            power_logger_lifetime=data[6],
-            magnetometer_declination=data[7] / 10.0,
-            battery_scale=data[8],
-            battery_warning_1=data[9] / 10.0,
-            battery_warning_2=data[10] / 10.0,
-            battery_critical=data[11] / 10.0
-        )
-
-@dataclass
+@_schema(
+    _Field('power_trigger', 'H'),
+    _Field('throttle_min', 'H'),
+    _Field('throttle_max', 'H'),
+    _Field('min_command', 'H'),
+    _Field('throttle_failsafe', 'H'),
+    _Field('power_logger_arm', 'H'),
+    _Field('power_logger_lifetime', 'I'),
+    _Field('magnetometer_declination', 'H', 10),
+    _Field('battery_scale', 'B'),
+    _Field('battery_warning_1', 'B', 10),
+    _Field('battery_warning_2', 'B', 10),
+    _Field('battery_critical', 'B', 10)
+)
+@dataclass(slots=True)
 class MspSetMisc:
     """
     Represents data values for the MSP_SET_MISC command.
@@ -219,31 +175,14 @@ class MspSetMisc:
     battery_critical: float
     """float: The critical battery level, measured in volts."""
 
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (
-            self.power_trigger,
-            self.throttle_min,
-            self.throttle_max,
-            self.min_command,
-            self.throttle_failsafe,
-            self.power_logger_arm,
-            self.power_logger_lifetime,
-            int(self.magnetometer_declination * 10),
-            self.battery_scale,
-            int(self.battery_warning_1 * 10),
-            int(self.battery_warning_2 * 10),
-            int(self.battery_critical * 10)
-        )
-
-@dataclass
+@_schema(
+    _Field('cycle_time', 'H'),
+    _Field('i2c_errors', 'H'),
+    _Field('sensors', 'H', type=_Flags(MultiWiiSensor, uses_bit_positions=True)),
+    _Field('status_flag', 'I'),
+    _Field('global_config', 'B')
+)
+@dataclass(slots=True)
 class MspStatus:
     """
     Represents data values for the MSP_STATUS command.
@@ -264,36 +203,4 @@ class MspStatus:
     """int: The status flag."""
 
     global_config: int
-    """int: The global configuration value."""
-
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspStatus` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspStatus
-            An instance of the `MspStatus` class populated with the parsed data.
-        """
-        sensors = ()
-
-        available_sensors = data[2]
-
-        for sensor in MultiWiiSensor:
-            if sensor & available_sensors == sensor:
-                sensors += (sensor,)
-
-        return cls(
-            cycle_time=data[0],
-            i2c_errors=data[1],
-            sensors=sensors,
-            status_flag=data[3],
-            global_config=data[4]
-        )
\ No newline at end of file
+    """int: The global configuration value."""
\ No newline at end of file
@@ -1,7 +1,18 @@
+from ._schema import _Field, _schema
+
 from dataclasses import dataclass
-from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('motor1', 'H'),
+    _Field('motor2', 'H'),
+    _Field('motor3', 'H'),
+    _Field('motor4', 'H'),
+    _Field('motor5', 'H'),
+    _Field('motor6', 'H'),
+    _Field('motor7', 'H'),
+    _Field('motor8', 'H')
+)
+@dataclass(slots=True)
 class MspMotor:
     """
     Represents data values for the MSP_MOTOR command.
@@ -33,36 +44,17 @@ class MspMotor:
     motor8: int
     """int: The speed value for motor 8."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspMotor` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspMotor
-            An instance of the `MspMotor` class populated with the parsed data.
-        """
-        return cls(*data)
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (motor1, motor2, motor3, motor4, motor5, motor6, motor7, motor8)
-
-@dataclass
+@_schema(
+    _Field('motor1', 'B'),
+    _Field('motor2', 'B'),
+    _Field('motor3', 'B'),
+    _Field('motor4', 'B'),
+    _Field('motor5', 'B'),
+    _Field('motor6', 'B'),
+    _Field('motor7', 'B'),
+    _Field('motor8', 'B')
+)
+@dataclass(slots=True)
 class MspMotorPins(MspMotor):
     """
     Represents data values for the MSP_MOTOR_PINS command.
@@ -70,21 +62,4 @@ class MspMotorPins(MspMotor):
     This class extends `MspMotor` to provide the motor pin values for up to eight motors
     in a MultiWii flight controller. Each motor's pin value is represented as an integer
     value.
-    """
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspMotorPins` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspMotorPins
-            An instance of the `MspMotorPins` class populated with the parsed data.
-        """
-        return cls(*data)
\ No newline at end of file
+    """
\ No newline at end of file
@@ -1,9 +1,15 @@
 from . import Coordinates
 
+from ._schema import _Field, _schema
+
 from dataclasses import dataclass
-from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('distance_to_home', 'H'),
+    _Field('direction_to_home', 'H'),
+    _Field('update_status', 'B')
+)
+@dataclass(slots=True)
 class MspCompGps:
     """
     Represents data values for the MSP_COMP_GPS command.
@@ -21,25 +27,16 @@ class MspCompGps:
     update_status: int
     """int: The update status of the GPS data."""
     
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspCompGps` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspCompGps
-            An instance of the `MspCompGps` class populated with the parsed data.
-        """
-        return cls(*data)
-
-@dataclass
+
+@_schema(
+    _Field('fix', 'B'),
+    _Field('satellites', 'B'),
+    _Field('coordinates', '2I', 10000000, Coordinates),
+    _Field('altitude', 'H'),
+    _Field('speed', 'H'),
+    _Field('ground_course', 'H', 10)
+)
+@dataclass(slots=True)
 class MspRawGps:
     """
     Represents data values for the MSP_RAW_GPS command.
@@ -67,54 +64,16 @@ class MspRawGps:
     ground_course: float
     """float: The ground course in degrees."""
     
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspRawGps` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspRawGps
-            An instance of the `MspRawGps` class populated with the parsed data.
-        """
-        return cls(
-            fix=data[0],
-            satellites=data[1],
-            coordinates=Coordinates(
-                latitude=data[2] / 10000000.0,
-                longitude=data[3] / 10000000.0
-            ),
-            altitude=data[4],
-            speed=[5],
-            ground_course=data[6] / 10.0
-        )
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (
-            fix,
-            satellites,
-            int(coordinates.latitude * 10000000),
-            int(coordinates.longitude * 10000000),
-            altitude,
-            speed,
-            int(ground_course * 10)
-        )
-
-@dataclass
+
+@_schema(
+    _Field('number', 'B'),
+    _Field('coordinates', '2I', 10000000, Coordinates),
+    _Field('altitude_hold', 'I'),
+    _Field('heading', 'H'),
+    _Field('time_to_stay', 'H'),
+    _Field('status_flag', 'B')
+)
+@dataclass(slots=True)
 class MspWaypoint:
     """
     Represents data values for the MSP_WP command.
@@ -140,50 +99,4 @@ class MspWaypoint:
 
     status_flag: int
     """int: The waypoint flag indicating the waypoint's status or type."""
-    
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspWaypoint` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspWaypoint
-            An instance of the `MspWaypoint` class populated with the parsed data.
-        """
-        return cls(
-            number=data[0],
-            coordinates=Coordinates(
-                latitude=data[1] / 10000000.0,
-                longitude=data[2] / 10000000.0
-            ),
-            altitude_hold=data[3],
-            heading=data[4],
-            time_to_stay=data[5],
-            status_flag=data[6]
-        )
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (
-            number,
-            int(coordinates.latitude * 100000000),
-            int(coordinates.longitude * 100000000),
-            altitude_hold,
-            heading,
-            time_to_stay,
-            status_flag
-        )
\ No newline at end of file
+    
\ No newline at end of file
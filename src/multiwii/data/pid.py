@@ -1,11 +1,25 @@
 from . import Pid
 
+from ._schema import _Field, _parses_into_by_copy, _schema
+
 from ..messaging import _decode_names
 
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('roll', '3B', type=Pid),
+    _Field('pitch', '3B', type=Pid),
+    _Field('yaw', '3B', type=Pid),
+    _Field('altitude_hold', '3B', type=Pid),
+    _Field('position_hold', '3B', type=Pid),
+    _Field('position_rate', '3B', type=Pid),
+    _Field('navigation_rate', '3B', type=Pid),
+    _Field('level_mode', '3B', type=Pid),
+    _Field('magnetometer', '3B', type=Pid),
+    _Field('velocity', '3B', type=Pid)
+)
+@dataclass(slots=True)
 class MspPid:
     """
     Represents data values for the MSP_PID command.
@@ -43,87 +57,9 @@ class MspPid:
     velocity: Pid[int]
     """Pid[int]: PID values for the velocity."""
    
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspPid` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspPid
-            An instance of the `MspPid` class populated with the parsed data.
-        """
-        pid_collection = ()
-
-        for index in range(len(data), step=3):
-            pid = Pid(
-                p=data[index],
-                i=data[index + 1],
-                d=data[index + 2]
-            )
-
-            pid_collection += (pid,)
-
-        return cls(*pid_collection)
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (
-            roll.p,
-            roll.i,
-            roll.d,
-
-            pitch.p,
-            pitch.i,
-            pitch.d,
-
-            yaw.p,
-            yaw.i,
-            yaw.d,
-
-            altitude_hold.p,
-            altitude_hold.i,
-            altitude_hold.d,
-
-            position_hold.p,
-            position_hold.i,
-            position_hold.d,
-
-            position_rate.p,
-            position_rate.i,
-            position_rate.d,
-
-            navigation_rate.p,
-            navigation_rate.i,
-            navigation_rate.d,
-
-            level_mode.p,
-            level_mode.i,
-            level_mode.d,
-
-            magnetometer.p,
-            magnetometer.i,
-            magnetometer.d,
-
-            velocity.p,
-            velocity.i,
-            velocity.d
-        )
 
-@dataclass
+@_parses_into_by_copy
+@dataclass(slots=True)
 class MspPidNames:
     """
     Represents data values for the MSP_PIDNAMES command.
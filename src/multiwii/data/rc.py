@@ -1,7 +1,18 @@
+from ._schema import _Field, _schema
+
 from dataclasses import dataclass
-from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('roll', 'H'),
+    _Field('pitch', 'H'),
+    _Field('yaw', 'H'),
+    _Field('throttle', 'H'),
+    _Field('aux1', 'H'),
+    _Field('aux2', 'H'),
+    _Field('aux3', 'H'),
+    _Field('aux4', 'H')
+)
+@dataclass(slots=True)
 class MspRc:
     """
     Represents data values for the MSP_RC command.
@@ -33,36 +44,17 @@ class MspRc:
     aux4: int
     """int: The input value for the fourth auxiliary channel."""
     
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspRc` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspRc
-            An instance of the `MspRc` class populated with the parsed data.
-        """
-        return cls(*data)
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (roll, pitch, yaw, throttle, aux1, aux2, aux3, aux4)
-
-@dataclass
+
+@_schema(
+    _Field('rate', 'B'),
+    _Field('expo', 'B'),
+    _Field('roll_pitch_rate', 'B'),
+    _Field('yaw_rate', 'B'),
+    _Field('dynamic_throttle_pid', 'B'),
+    _Field('throttle_mid', 'B'),
+    _Field('throttle_expo', 'B')
+)
+@dataclass(slots=True)
 class MspRcTuning:
     """
     Represents data values for the MSP_RC_TUNING command.
@@ -90,41 +82,4 @@ class MspRcTuning:
     """int: The throttle mid-point value."""
 
     throttle_expo: int
-    """int: The throttle expo value."""
-
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspRcTuning` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspRcTuning
-            An instance of the `MspRcTuning` class populated with the parsed data.
-        """
-        return cls(*data)
-
-    def as_serializable(self) -> tuple[int]:
-        """
-        Returns a tuple with integer values to be used for serialization.
-
-        Returns
-        -------
-        tuple[int]
-            A tuple with serializable integer values.
-        """
-        return (
-            rate,
-            expo,
-            roll_pitch_rate,
-            yaw_rate,
-            dynamic_throttle_pid,
-            throttle_mid,
-            throttle_expo
-        )
\ No newline at end of file
+    """int: The throttle expo value."""
\ No newline at end of file
@@ -1,7 +1,12 @@
+from ._schema import _Field, _parses_into_by_copy, _schema
+
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('values', '8H')
+)
+@dataclass(slots=True)
 class MspServo:
     """
     Represents data values for the MSP_SERVO command.
@@ -11,25 +16,7 @@ class MspServo:
     values: tuple[int]
     """tuple[int]: The servo output values for each channel."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspServo` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspServo
-            An instance of the `MspServo` class populated with the parsed data.
-        """
-        return cls(*data)
-
-@dataclass
+@dataclass(slots=True)
 class MspServoConfItem:
     """
     Represents data values for the MSP_SET_SERVO_CONF command.
@@ -49,7 +36,8 @@ class MspServoConfItem:
     rate: int
     """int: The rate vlaue for the servo channel."""
 
-@dataclass
+@_parses_into_by_copy
+@dataclass(slots=True)
 class MspServoConf:
     """
     Represents data values for the MSP_SERVO_CONF command.
@@ -63,7 +51,7 @@ class MspServoConf:
     @classmethod
     def parse(cls, data: tuple) -> Self:
         """
-        Parses a tuple of data values obtained from `struct.unpack` and returns aninstance of
+        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
         the `MspServoConf` class.
 
         Parameters
@@ -76,12 +64,13 @@ class MspServoConf:
         MspServoConf
             An instance of the `MspServoConf` class populated with the parsed data.
         """
-        item_count = len(data) / 4
+        if len(data) % 4:
+            raise TypeError(f'MspServoConf requires a multiple of 4 data values, got {len(data)}.')
 
         values = ()
 
-        for index in range(item_count, step=4):
-            item = ServoConfItem(
+        for index in range(0, len(data), 4):
+            item = MspServoConfItem(
                 min=data[index],
                 max=data[index + 1],
                 middle=data[index + 2],
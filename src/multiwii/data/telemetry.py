@@ -1,9 +1,15 @@
 from . import Point3D
 
+from ._schema import _Field, _schema
+
 from dataclasses import dataclass
 from typing      import Self
 
-@dataclass
+@_schema(
+    _Field('estimation', 'i'),
+    _Field('pressure_variation', 'h')
+)
+@dataclass(slots=True)
 class MspAltitude:
     """
     Represents data values for the MSP_ALTITUDE command.
@@ -16,28 +22,12 @@ class MspAltitude:
     pressure_variation: int
     """int: The variation in pressure."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspAltitude` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspAltitude
-            An instance of the `MspAltitude` class populated with the parsed data.
-        """
-        return cls(
-            estimation=((data[3] << 24) | (data[2] << 16) | (data[1] << 8) | data[0]),
-            pressure_variation=((data[5] << 8) | data[4])
-        )
-
-@dataclass
+@_schema(
+    _Field('pitch_angle', 'h', 10),
+    _Field('roll_angle', 'h', 10),
+    _Field('yaw_angle', 'h')
+)
+@dataclass(slots=True)
 class MspAttitude:
     """
     Represents data values for the MSP_ATTITUDE command.
@@ -53,35 +43,26 @@ class MspAttitude:
     yaw_angle: int
     """int: The heading angle of the aircraft in degrees, ranging from 0 to 360."""
 
-    @classmethod
-    def parse(cls, data: tuple) -> Self:
-        """
-        Parses a tuple of data values obtained from `struct.unpack` and returns an instance of
-        the `MspAttitude` class.
-
-        Parameters
-        ----------
-        data : tuple
-            A tuple containing unpacked data values.
-
-        Returns
-        -------
-        MspAttitude
-            An instance of the `MspAttitude` class populated with the parsed data.
-        """
-        return cls(
-            pitch_angle=data[0] / 10.0,
-            roll_angle=data[1] / 10.0,
-            yaw_angle=data[3]
-        )
-
-@dataclass
+@_schema(
+    _Field('accelerometer', '3h', type=Point3D),
+    _Field('gyroscope', '3h', type=Point3D),
+    _Field('magnetometer', '3h', type=Point3D)
+)
+@dataclass(slots=True)
 class MspRawImu:
     """
     Represents data values for the MSP_RAW_IMU command.
 
     This class encapsulates raw IMU (Intertial Measurement Unit) data from a MultiWii
     flight controller.
+
+    Note
+    ----
+    Unlike the other data structure types, the `parse` and `parse_into` methods of this class
+    are written by hand instead of generated from the schema, since they take the unit
+    conversion factors of the sensors. Both allocate a new `Point3D` per sensor, as do the
+    generated methods for any `NamedTuple` field, so `parse_into` only saves the allocation
+    of the instance itself.
     """
     accelerometer: Point3D[float]
     """Point3D[float]: The accelerometer data."""
@@ -122,18 +103,70 @@ class MspRawImu:
         """
         return cls(
             accelerometer=Point3D(
-                x=data[0] / accelerometer_unit,
-                y=data[1] / accelerometer_unit,
-                z=data[2] / accelerometer_unit
+                data[0] / accelerometer_unit,
+                data[1] / accelerometer_unit,
+                data[2] / accelerometer_unit
             ),
             gyroscope=Point3D(
-                x=data[3] / gyroscope_unit,
-                y=data[4] / gyroscope_unit,
-                z=data[5] / gyroscope_unit
+                data[3] / gyroscope_unit,
+                data[4] / gyroscope_unit,
+                data[5] / gyroscope_unit
             ),
             magnetometer=Point3D(
-                x=data[6] / magnetometer_unit,
-                y=data[7] / magnetometer_unit,
-                z=data[8] / magnetometer_unit
+                data[6] / magnetometer_unit,
+                data[7] / magnetometer_unit,
+                data[8] / magnetometer_unit
             )
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def parse_into(
+        cls,
+        instance:           Self,
+        data:               tuple,
+        accelerometer_unit: int = 1.0,
+        gyroscope_unit:     int = 1.0,
+        magnetometer_unit:  int = 1.0
+    ) -> Self:
+        """
+        Parses a tuple of data values obtained from `struct.unpack` into an existing instance of
+        the `MspRawImu` class. Only the instance itself is reused, as a new `Point3D` is created
+        for each sensor.
+
+        Parameters
+        ----------
+        instance : MspRawImu
+            The instance to populate.
+        data : tuple
+            A tuple containing unpacked data values.
+        accelerometer_unit : int, optional
+            The unit conversion factor for the accelerometer data (default is 1.0).
+        gyroscope_unit : int, optional
+            The unit conversion factor for the gyroscope data (default is 1.0).
+        magnetometer_unit : int, optional
+            The unit conversion factor for the magnetometer data (default is 1.0).
+
+        Returns
+        -------
+        MspRawImu
+            The populated instance.
+        """
+        instance.accelerometer = Point3D(
+            data[0] / accelerometer_unit,
+            data[1] / accelerometer_unit,
+            data[2] / accelerometer_unit
+        )
+
+        instance.gyroscope = Point3D(
+            data[3] / gyroscope_unit,
+            data[4] / gyroscope_unit,
+            data[5] / gyroscope_unit
+        )
+
+        instance.magnetometer = Point3D(
+            data[6] / magnetometer_unit,
+            data[7] / magnetometer_unit,
+            data[8] / magnetometer_unit
+        )
+
+        return instance
\ No newline at end of file
@@ -0,0 +1,336 @@
+from .messaging import MESSAGE_HEADER_SIZE, MESSAGE_OVERHEAD_SIZE
+
+from queue     import SimpleQueue
+from struct    import error as StructError, Struct
+from threading import Thread
+from time      import monotonic_ns
+from typing    import Any, BinaryIO, Final, Iterator, NamedTuple, NoReturn, Self
+
+import os
+
+DIRECTION_RECEIVED: Final[int] = 1
+"""int: The direction flag of frames received from the FC."""
+
+DIRECTION_SENT: Final[int] = 0
+"""int: The direction flag of frames sent to the FC."""
+
+RECORD_FILE_MAGIC: Final[bytes] = b'MSPREC'
+"""bytes: The magic bytes at the start of every recording file."""
+
+RECORD_FILE_VERSION: Final[int] = 1
+"""int: The version of the record format that is written by `FrameRecorder`."""
+
+_FILE_HEADER_STRUCT: Final[Struct] = Struct('<6sH')
+"""Struct: The compiled structure of the file header (magic bytes and format version)."""
+
+_RECORD_HEADER_STRUCT: Final[Struct] = Struct('<QBH')
+"""Struct: The compiled structure of a record header (timestamp, direction and frame size)."""
+
+class FrameRecord(NamedTuple):
+    """
+    Represents a single recorded frame.
+
+    Attributes
+    ----------
+    timestamp : int
+        The `time.monotonic_ns` value at which the frame was sent or received.
+    direction : int
+        `DIRECTION_SENT` or `DIRECTION_RECEIVED`.
+    frame : bytes
+        The raw frame, including the header and the checksum.
+    """
+    timestamp: int
+
+    direction: int
+
+    frame: bytes
+
+class FrameRecorder(object):
+    """
+    Appends raw MSP frames to a compact binary recording on a background thread.
+
+    Assign an instance to `MultiWii.recorder` to record every frame that is sent to or
+    received from the FC. Frames are timestamped and copied in the calling thread, which is
+    cheap, and written to the file by a dedicated writer thread, so disk I/O never blocks
+    the polling thread.
+
+    The recording is append-only and uses the following little-endian format:
+
+    ======  ====  ===========================================================
+    Offset  Size  Field
+    ======  ====  ===========================================================
+    0       6     Magic bytes `MSPREC`.
+    6       2     Format version (uint16), currently 1.
+    ======  ====  ===========================================================
+
+    The file header is followed by any number of records:
+
+    ======  ====  ===========================================================
+    Offset  Size  Field
+    ======  ====  ===========================================================
+    0       8     `time.monotonic_ns` timestamp (uint64).
+    8       1     Direction (uint8), 0 for sent and 1 for received frames.
+    9       2     Frame size in bytes (uint16).
+    11      n     Raw frame, including the header and the checksum.
+    ======  ====  ===========================================================
+
+    The file header is only written to empty files, so recordings of several sessions can be
+    appended to the same file. Timestamps are only comparable within a single boot of the
+    host. Use `read_records` to read a recording.
+    """
+    _exception: Exception | None
+
+    _file: Final[BinaryIO]
+
+    _is_closed: bool
+
+    _owns_file: Final[bool]
+
+    _queue: Final[SimpleQueue]
+
+    _record_count: int
+
+    _thread: Final[Thread]
+
+    def __init__(self, file: str | os.PathLike | BinaryIO) -> NoReturn:
+        """
+        Initializes an instance and starts its writer thread.
+
+        Parameters
+        ----------
+        file : str | os.PathLike | BinaryIO
+            The path of the recording file, which is created or appended to, or a binary file
+            object opened for writing.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            self._file = open(file, 'ab')
+
+            self._owns_file = True
+        else:
+            self._file = file
+
+            self._owns_file = False
+
+        if self._file.tell() == 0:
+            self._file.write(_FILE_HEADER_STRUCT.pack(RECORD_FILE_MAGIC, RECORD_FILE_VERSION))
+
+        self._exception = None
+
+        self._is_closed = False
+
+        self._queue = SimpleQueue()
+
+        self._record_count = 0
+
+        self._thread = Thread(target=self._run, name='MultiWiiRecorder', daemon=True)
+
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        """
+        Returns the instance itself.
+
+        Returns
+        -------
+        FrameRecorder
+            The instance itself.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> NoReturn:
+        """
+        Closes the recorder.
+        """
+        self.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Gets a value indicative whether the recorder has been closed.
+
+        Returns
+        -------
+        bool
+            True if the recorder is closed, False otherwise.
+        """
+        return self._is_closed
+
+    @property
+    def record_count(self) -> int:
+        """
+        Gets the number of frames that have been written to the file.
+
+        The count is only updated by the writer thread, so frames that are still queued are
+        not included until they have been written, e.g. after `close`.
+
+        Returns
+        -------
+        int
+            The number of recorded frames.
+        """
+        return self._record_count
+
+    def _run(self) -> NoReturn:
+        """
+        Writes queued records to the file until the recorder is closed.
+
+        All records that are queued at the time of a write are joined into a single write,
+        and the file is flushed whenever the queue has been drained.
+        """
+        file = self._file
+
+        queue = self._queue
+
+        is_closing = False
+
+        while not is_closing:
+            records = [queue.get()]
+
+            while not queue.empty():
+                records.append(queue.get_nowait())
+
+            if None in records:
+                is_closing = True
+
+                del records[records.index(None):]
+
+            if self._exception is not None:
+                continue
+
+            try:
+                file.write(b''.join(records))
+
+                file.flush()
+            except Exception as exception:
+                self._exception = exception
+            else:
+                self._record_count += len(records)
+
+    def close(self) -> NoReturn:
+        """
+        Writes all queued records, stops the writer thread and closes the file if it was
+        opened by the recorder.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the writer thread from writing, if a write failed.
+        """
+        if self._is_closed:
+            return
+
+        self._is_closed = True
+
+        self._queue.put(None)
+
+        self._thread.join()
+
+        if self._owns_file:
+            self._file.close()
+
+        if self._exception is not None:
+            raise self._exception
+
+    def record(self, direction: int, frame: bytes | bytearray | memoryview) -> NoReturn:
+        """
+        Queues a single frame for recording, timestamped with the current monotonic time.
+
+        Frames that are recorded after the recorder has been closed are discarded.
+
+        Parameters
+        ----------
+        direction : int
+            `DIRECTION_SENT` or `DIRECTION_RECEIVED`.
+        frame : bytes | bytearray | memoryview
+            The raw frame, which is copied before this method returns.
+        """
+        if self._is_closed:
+            return
+
+        self._queue.put(_RECORD_HEADER_STRUCT.pack(monotonic_ns(), direction, len(frame)) + frame)
+
+    def record_received(self, frame: bytes | bytearray | memoryview) -> NoReturn:
+        """
+        Queues a single frame that was received from the FC for recording.
+
+        Parameters
+        ----------
+        frame : bytes | bytearray | memoryview
+            The raw frame, which is copied before this method returns.
+        """
+        self.record(DIRECTION_RECEIVED, frame)
+
+    def record_sent(self, message: bytes | bytearray | memoryview) -> NoReturn:
+        """
+        Queues the frames of a message that was sent to the FC for recording.
+
+        Parameters
+        ----------
+        message : bytes | bytearray | memoryview
+            One or more raw frames written back-to-back, which are recorded separately.
+        """
+        timestamp = monotonic_ns()
+
+        view = memoryview(message)
+
+        offset = 0
+
+        while offset + MESSAGE_HEADER_SIZE < len(view) and not self._is_closed:
+            size = MESSAGE_OVERHEAD_SIZE + view[offset + MESSAGE_HEADER_SIZE]
+
+            self._queue.put(
+                _RECORD_HEADER_STRUCT.pack(timestamp, DIRECTION_SENT, size) +
+                view[offset:offset + size]
+            )
+
+            offset += size
+
+def read_records(file: str | os.PathLike | BinaryIO) -> Iterator[FrameRecord]:
+    """
+    Reads the records of a recording written by `FrameRecorder`.
+
+    A truncated record at the end of the file, e.g. after a power loss, is ignored.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | BinaryIO
+        The path of the recording file, or a binary file object opened for reading.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a recording, or uses an unsupported format version.
+
+    Returns
+    -------
+    Iterator[FrameRecord]
+        An iterator of the records, in the order they were recorded.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as opened_file:
+            yield from read_records(opened_file)
+
+        return
+
+    try:
+        magic, version = _FILE_HEADER_STRUCT.unpack(file.read(_FILE_HEADER_STRUCT.size))
+    except StructError:
+        raise ValueError('The file is not a frame recording.')
+
+    if magic != RECORD_FILE_MAGIC:
+        raise ValueError('The file is not a frame recording.')
+
+    if version != RECORD_FILE_VERSION:
+        raise ValueError(f'Unsupported recording format version {version}.')
+
+    header_size = _RECORD_HEADER_STRUCT.size
+
+    while len(header := file.read(header_size)) == header_size:
+        timestamp, direction, size = _RECORD_HEADER_STRUCT.unpack(header)
+
+        frame = file.read(size)
+
+        if len(frame) != size:
+            break
+
+        yield FrameRecord(timestamp, direction, frame)
@@ -0,0 +1,333 @@
+from ._command  import _MspCommand
+from ._registry import _CODE_TO_COMMAND_MAP, _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+from .messaging import _MspFrameDecoder, _parse_response_message
+
+from .recorder import DIRECTION_RECEIVED, FrameRecord, read_records
+
+from .transport import Transport
+
+from io     import UnsupportedOperation
+from time   import perf_counter, sleep
+from typing import Any, BinaryIO, Final, Generator, Iterator, NamedTuple, NoReturn
+
+import os
+
+class ReplayedMessage(NamedTuple):
+    """
+    Represents a single response message decoded from a recording.
+
+    Attributes
+    ----------
+    timestamp : int
+        The recorded `time.monotonic_ns` value at which the frame was received.
+    command : _MspCommand
+        The command of the response message.
+    value : Any
+        An instance of the corresponding data structure type, e.g. `MspAttitude`.
+    """
+    timestamp: int
+
+    command: _MspCommand
+
+    value: Any
+
+class _ReplayClock(object):
+    """
+    Represents the mapping of recorded timestamps to `perf_counter` values for a replay.
+
+    The clock starts when the due time of the first record is requested, so that the time
+    spent before the replay starts is not counted.
+    """
+    _origin_time: float | None
+
+    _origin_timestamp: int
+
+    _speed: Final[float | None]
+
+    def __init__(self, speed: float | None) -> NoReturn:
+        """
+        Initializes an instance using the provided replay speed.
+
+        Parameters
+        ----------
+        speed : float | None
+            The multiple of real time to replay at, or None to replay as fast as possible.
+
+        Raises
+        ------
+        ValueError
+            If the speed is not a positive number.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError('Speed must be a positive number or None.')
+
+        self._origin_time = None
+
+        self._origin_timestamp = 0
+
+        self._speed = speed
+
+    @property
+    def is_started(self) -> bool:
+        """
+        Gets a value indicative whether the replay clock has been started.
+
+        Returns
+        -------
+        bool
+            True if the clock has been started or runs as fast as possible, False otherwise.
+        """
+        return self._speed is None or self._origin_time is not None
+
+    def get_due_time(self, timestamp: int) -> float:
+        """
+        Gets the `perf_counter` value at which a record is due.
+
+        Parameters
+        ----------
+        timestamp : int
+            The recorded timestamp in nanoseconds.
+
+        Returns
+        -------
+        float
+            The due time, which is always in the past when replaying as fast as possible.
+        """
+        if self._speed is None:
+            return 0.0
+
+        if self._origin_time is None:
+            self._origin_time = perf_counter()
+
+            self._origin_timestamp = timestamp
+
+        return self._origin_time + (timestamp - self._origin_timestamp) / 1e9 / self._speed
+
+class ReplayTransport(Transport):
+    """
+    Represents a transport that plays back the received frames of a recording.
+
+    The frames that were received from the FC are made available for reading at the times
+    they were recorded, scaled by the replay speed, while anything written to the transport
+    is discarded. A `MultiWii` instance that uses this transport decodes and parses the
+    recorded frames exactly like those of a live link, so any downstream code can be run
+    against a recording unchanged.
+
+    Note
+    ----
+    Enable `MultiWii.uses_persistent_stream` or the background reader when replaying, as
+    resetting the input buffer discards frames that have been replayed but not read yet.
+    Reads raise `EOFError` once all recorded frames have been read, so that pending requests
+    fail immediately instead of waiting for their timeout.
+    """
+    MAX_PENDING_SIZE: Final[int] = 4096
+    """int: The maximum number of replayed bytes that are buffered ahead of the reader."""
+
+    _clock: Final[_ReplayClock]
+
+    _next_record: FrameRecord | None
+
+    _pending: Final[bytearray]
+
+    _records: Final[Generator[FrameRecord, None, None]]
+
+    _timeout: float | None
+
+    def __init__(
+        self,
+        file:    str | os.PathLike | BinaryIO,
+        speed:   float | None = None,
+        timeout: float | None = None
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided recording and replay speed.
+
+        Parameters
+        ----------
+        file : str | os.PathLike | BinaryIO
+            The path of a recording written by `FrameRecorder`, or a binary file object opened
+            for reading.
+        speed : float | None
+            The multiple of real time to replay at, e.g. 1.0 for real time or 10.0 for ten
+            times as fast, or None to replay as fast as possible.
+        timeout : float | None
+            The read timeout in seconds, or None to block until data is available.
+
+        Raises
+        ------
+        ValueError
+            If the speed is not a positive number.
+        """
+        self._clock = _ReplayClock(speed)
+
+        self._next_record = None
+
+        self._pending = bytearray()
+
+        self._records = (
+            record for record in read_records(file) if record.direction == DIRECTION_RECEIVED
+        )
+
+        self._timeout = timeout
+
+        self._advance()
+
+    @property
+    def byte_time(self) -> float:
+        return 0.0
+
+    @property
+    def in_waiting(self) -> int:
+        # Records are only released, and the clock is only started, by reads, as this property
+        # is also evaluated by `isinstance` checks against the `Transport` protocol.
+        next_record = self._next_record
+
+        if (
+            next_record is None or
+            not self._clock.is_started or
+            self._clock.get_due_time(next_record.timestamp) > perf_counter()
+        ):
+            return len(self._pending)
+
+        return len(self._pending) + len(next_record.frame)
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        Gets a value indicative whether all recorded frames have been read.
+
+        Returns
+        -------
+        bool
+            True if the replay has finished, False otherwise.
+        """
+        return self._next_record is None and not self._pending
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._timeout = value
+
+    def _advance(self) -> NoReturn:
+        """
+        Loads the next received record of the recording, if any.
+        """
+        self._next_record = next(self._records, None)
+
+    def _release_due_records(self) -> NoReturn:
+        """
+        Makes all records that are due available for reading, up to the maximum pending size.
+        """
+        now = perf_counter()
+
+        while (
+            self._next_record is not None and
+            len(self._pending) < self.MAX_PENDING_SIZE and
+            self._clock.get_due_time(self._next_record.timestamp) <= now
+        ):
+            self._pending += self._next_record.frame
+
+            self._advance()
+
+    def close(self) -> NoReturn:
+        self._records.close()
+
+        self._next_record = None
+
+        self._pending.clear()
+
+    def fileno(self) -> int:
+        raise UnsupportedOperation('The replay transport has no file descriptor.')
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        if self.is_finished and len(buffer):
+            raise EOFError('All recorded frames have been replayed.')
+
+        deadline = None if self._timeout is None else perf_counter() + self._timeout
+
+        self._release_due_records()
+
+        while not self._pending and self._next_record is not None:
+            due_time = self._clock.get_due_time(self._next_record.timestamp)
+
+            if deadline is not None and deadline < due_time:
+                sleep(max(deadline - perf_counter(), 0))
+
+                return 0
+
+            sleep(max(due_time - perf_counter(), 0))
+
+            self._release_due_records()
+
+        count = min(len(buffer), len(self._pending))
+
+        buffer[:count] = self._pending[:count]
+
+        del self._pending[:count]
+
+        return count
+
+    def reset_input_buffer(self) -> NoReturn:
+        self._pending.clear()
+
+    def reset_output_buffer(self) -> NoReturn:
+        pass
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        return len(data)
+
+def replay_messages(
+    file:  str | os.PathLike | BinaryIO,
+    speed: float | None = None
+) -> Iterator[ReplayedMessage]:
+    """
+    Decodes and parses the received frames of a recording into data structures.
+
+    The frames are run through the same frame decoder, response message parser and data
+    structure types as those of a live link. Frames of commands without data values, such as
+    acknowledgements of set-commands, and error frames are skipped.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | BinaryIO
+        The path of a recording written by `FrameRecorder`, or a binary file object opened for
+        reading.
+    speed : float | None
+        The multiple of real time to replay at, or None to replay as fast as possible.
+
+    Raises
+    ------
+    ValueError
+        If the speed is not a positive number, or the file is not a recording.
+
+    Returns
+    -------
+    Iterator[ReplayedMessage]
+        An iterator of the replayed messages, in the order they were received.
+    """
+    clock = _ReplayClock(speed)
+
+    frame_decoder = _MspFrameDecoder()
+
+    for record in read_records(file):
+        if record.direction != DIRECTION_RECEIVED:
+            continue
+
+        if speed is not None:
+            sleep(max(clock.get_due_time(record.timestamp) - perf_counter(), 0))
+
+        for frame in frame_decoder.feed(record.frame):
+            command = _CODE_TO_COMMAND_MAP.get(frame.code)
+
+            if command is None or frame.is_error:
+                continue
+
+            data = _parse_response_message(command, frame.payload).data
+
+            value = _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP[command].parse(data)
+
+            yield ReplayedMessage(record.timestamp, command, value)
@@ -0,0 +1,325 @@
+from ._command import _MspCommand
+
+from .messaging import MESSAGE_OVERHEAD_SIZE, MspMessageTimeoutError
+
+from time   import perf_counter, sleep
+from typing import Any, Callable, Final, NoReturn, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import MultiWii
+
+class TelemetryScheduler(object):
+    """
+    Polls MSP commands at individual rates while staying within the byte budget of the link.
+
+    The scheduler takes a plan that maps each command to a polling rate in hertz. Commands
+    that are due are polled in earliest-deadline-first order and batched into a single
+    `MultiWii.get_many` call. A token bucket that refills at the byte rate of the link limits
+    how many response bytes can be requested at once, so an oversubscribed plan degrades the
+    achieved rates instead of flooding the link.
+
+    Note
+    ----
+    The byte cost of a command is the size of its response message. Request messages of
+    read commands carry no data, so the response direction is always the bottleneck. The
+    response size of variable-size commands (e.g. `MSP_BOXNAMES`) depends on the FC, so their
+    expected data size must be provided explicitly.
+    """
+    DEFAULT_BAUDRATE: Final[int] = 115200
+    """int: The default baudrate of the link."""
+
+    DEFAULT_BURST_DURATION: Final[float] = 0.05
+    """float: The default time in seconds worth of link bytes that can be requested at once."""
+
+    DEFAULT_LINK_UTILIZATION: Final[float] = 0.9
+    """float: The default fraction of the link byte rate that may be used for polling."""
+
+    _burst_size: Final[float]
+
+    _byte_budget: Final[float]
+
+    _costs: Final[dict[_MspCommand, int]]
+
+    _is_running: bool
+
+    _last_refill_time: float | None
+
+    _multiwii: Final['MultiWii']
+
+    _next_due_times: Final[dict[_MspCommand, float]]
+
+    _periods: Final[dict[_MspCommand, float]]
+
+    _poll_counts: Final[dict[_MspCommand, int]]
+
+    _start_time: float | None
+
+    _timeout_count: int
+
+    _tokens: float
+
+    def __init__(
+        self,
+        multiwii:         'MultiWii',
+        plan:             dict[_MspCommand, float],
+        baudrate:         int   = DEFAULT_BAUDRATE,
+        link_utilization: float = DEFAULT_LINK_UTILIZATION,
+        burst_duration:   float = DEFAULT_BURST_DURATION,
+        data_sizes:       dict[_MspCommand, int] | None = None
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided polling plan.
+
+        Parameters
+        ----------
+        multiwii : MultiWii
+            The `MultiWii` instance used for polling.
+        plan : dict[_MspCommand, float]
+            A dictionary that maps each command to its polling rate in hertz.
+        baudrate : int
+            The baudrate of the link, used to calculate the byte budget (8N1 framing).
+        link_utilization : float
+            The fraction of the link byte rate that may be used for polling.
+        burst_duration : float
+            The time in seconds worth of link bytes that can be requested at once.
+        data_sizes : dict[_MspCommand, int] | None
+            A dictionary that maps commands to their expected response data size in bytes.
+            Required for variable-size commands, and overrides the fixed data size of others.
+
+        Raises
+        ------
+        ValueError
+            If the plan is empty, if any rate or link parameter is not a positive number, if any
+            expected data size is negative, or if a variable-size command in the plan has no
+            expected data size.
+        """
+        if not plan:
+            raise ValueError('Plan must contain at least one command.')
+
+        if any(rate <= 0 for rate in plan.values()):
+            raise ValueError('Polling rates must be positive numbers.')
+
+        if baudrate <= 0 or burst_duration <= 0 or not 0 < link_utilization <= 1:
+            raise ValueError('Link parameters must be positive numbers.')
+
+        if data_sizes is None:
+            data_sizes = {}
+
+        if any(size < 0 for size in data_sizes.values()):
+            raise ValueError('Expected data sizes must not be negative.')
+
+        for command in plan:
+            if command.has_variable_size and command not in data_sizes:
+                raise ValueError(
+                    f'Variable-size command {command} requires an expected data size.'
+                )
+
+        self._byte_budget = baudrate / 10 * link_utilization
+
+        self._costs = {
+            command: MESSAGE_OVERHEAD_SIZE + data_sizes.get(command, command.data_size)
+            for command in plan
+        }
+
+        self._burst_size = max(self._byte_budget * burst_duration, max(self._costs.values()))
+
+        self._is_running = False
+
+        self._last_refill_time = None
+
+        self._multiwii = multiwii
+
+        self._next_due_times = dict.fromkeys(plan, 0.0)
+
+        self._periods = {command: 1 / rate for command, rate in plan.items()}
+
+        self._poll_counts = dict.fromkeys(plan, 0)
+
+        self._start_time = None
+
+        self._timeout_count = 0
+
+        self._tokens = self._burst_size
+
+    @property
+    def achieved_rates(self) -> dict[_MspCommand, float]:
+        """
+        Gets the rate at which each command has actually been polled since the first poll.
+
+        Returns
+        -------
+        dict[_MspCommand, float]
+            A dictionary that maps each command to its achieved rate in hertz.
+        """
+        if self._start_time is None:
+            return dict.fromkeys(self._poll_counts, 0.0)
+
+        elapsed_time = max(perf_counter() - self._start_time, 1e-9)
+
+        return {command: count / elapsed_time for command, count in self._poll_counts.items()}
+
+    @property
+    def byte_budget(self) -> float:
+        """
+        Gets the number of response bytes per second that may be requested.
+
+        Returns
+        -------
+        float
+            The byte budget in bytes per second.
+        """
+        return self._byte_budget
+
+    @property
+    def planned_byte_rate(self) -> float:
+        """
+        Gets the number of response bytes per second that the plan requires.
+
+        Returns
+        -------
+        float
+            The planned byte rate in bytes per second. A value greater than `byte_budget`
+            means that the plan cannot be achieved on the link.
+        """
+        return sum(self._costs[command] / period for command, period in self._periods.items())
+
+    @property
+    def timeout_count(self) -> int:
+        """
+        Gets the number of polls that timed out.
+
+        Returns
+        -------
+        int
+            The number of timed out polls.
+        """
+        return self._timeout_count
+
+    def _get_idle_time(self) -> float:
+        """
+        Gets the time until the next command is due and its byte cost is affordable.
+
+        Returns
+        -------
+        float
+            The time in seconds, or zero if a command can be polled immediately.
+        """
+        now = perf_counter()
+
+        command = min(self._next_due_times, key=self._next_due_times.get)
+
+        token_deficit = self._costs[command] - self._tokens
+
+        return max(
+            self._next_due_times[command] - now,
+            token_deficit / self._byte_budget,
+            0.0
+        )
+
+    def run(
+        self,
+        callback: Callable[[_MspCommand, Any], Any],
+        duration: float | None = None
+    ) -> NoReturn:
+        """
+        Polls the commands according to the plan until stopped or the duration has elapsed.
+
+        Parameters
+        ----------
+        callback : Callable[[_MspCommand, Any], Any]
+            A function that is invoked with each polled command and its parsed data values.
+        duration : float | None
+            The time in seconds to run for, or None to run until `stop` is called.
+        """
+        end_time = None if duration is None else perf_counter() + duration
+
+        self._is_running = True
+
+        while self._is_running:
+            for command, value in self.run_once():
+                callback(command, value)
+
+            idle_time = self._get_idle_time()
+
+            if end_time is not None:
+                remaining_time = end_time - perf_counter()
+
+                if remaining_time <= 0:
+                    break
+
+                idle_time = min(idle_time, remaining_time)
+
+            if idle_time > 0:
+                sleep(idle_time)
+
+        self._is_running = False
+
+    def run_once(self) -> list[tuple[_MspCommand, Any]]:
+        """
+        Polls all commands that are due and fit within the available byte budget.
+
+        Returns
+        -------
+        list[tuple[_MspCommand, Any]]
+            A list of the polled commands and their parsed data values, which is empty if no
+            command was due or the poll timed out.
+        """
+        now = perf_counter()
+
+        if self._start_time is None:
+            self._start_time = now
+
+            self._last_refill_time = now
+
+            self._next_due_times.update(dict.fromkeys(self._next_due_times, now))
+
+        self._tokens = min(
+            self._tokens + (now - self._last_refill_time) * self._byte_budget,
+            self._burst_size
+        )
+
+        self._last_refill_time = now
+
+        due_commands = sorted(
+            (command for command, due_time in self._next_due_times.items() if due_time <= now),
+            key=self._next_due_times.get
+        )
+
+        batch = []
+
+        for command in due_commands:
+            cost = self._costs[command]
+
+            if cost > self._tokens:
+                break
+
+            self._tokens -= cost
+
+            batch.append(command)
+
+        if not batch:
+            return []
+
+        for command in batch:
+            self._next_due_times[command] = max(
+                self._next_due_times[command] + self._periods[command],
+                now
+            )
+
+        try:
+            values = self._multiwii.get_many(batch)
+        except MspMessageTimeoutError:
+            self._timeout_count += 1
+
+            return []
+
+        for command in batch:
+            self._poll_counts[command] += 1
+
+        return list(zip(batch, values))
+
+    def stop(self) -> NoReturn:
+        """
+        Stops a running `run` loop after the current poll.
+        """
+        self._is_running = False
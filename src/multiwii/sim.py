@@ -0,0 +1,636 @@
+from ._command import _MspCommand
+
+from . import commands
+
+from .commands import (
+    MSP_ALTITUDE,
+    MSP_ANALOG,
+    MSP_ATTITUDE,
+    MSP_BOX,
+    MSP_BOXIDS,
+    MSP_BOXNAMES,
+    MSP_COMP_GPS,
+    MSP_IDENT,
+    MSP_MISC,
+    MSP_MOTOR,
+    MSP_MOTOR_PINS,
+    MSP_PID,
+    MSP_PIDNAMES,
+    MSP_RAW_GPS,
+    MSP_RAW_IMU,
+    MSP_RC,
+    MSP_RC_TUNING,
+    MSP_RESET_CONF,
+    MSP_SELECT_SETTING,
+    MSP_SERVO,
+    MSP_SERVO_CONF,
+    MSP_SET_BOX,
+    MSP_SET_HEAD,
+    MSP_SET_MISC,
+    MSP_SET_MOTOR,
+    MSP_SET_PID,
+    MSP_SET_RAW_GPS,
+    MSP_SET_RAW_RC,
+    MSP_SET_RC_TUNING,
+    MSP_SET_SERVO_CONF,
+    MSP_SET_WP,
+    MSP_STATUS,
+    MSP_WP
+)
+
+from .config import MultiWiiCapability, MultiWiiMultitype, MultiWiiSensor
+
+from .messaging import (
+    _crc8_xor,
+    _MspFrame,
+    _MspFrameDecoder,
+    MESSAGE_ERROR_HEADER,
+    MESSAGE_INCOMING_HEADER,
+    MESSAGE_OUTGOING_HEADER
+)
+
+from .transport import FdTransport, Transport
+
+from math      import cos, sin
+from struct    import error as StructError
+from threading import Event, Lock, Thread
+from time      import perf_counter, sleep
+from typing    import Any, Final, NoReturn, Self
+
+_BOX_NAMES: Final[tuple[str]] = (
+    'ARM',
+    'ANGLE',
+    'HORIZON',
+    'BARO',
+    'MAG',
+    'HEADFREE',
+    'HEADADJ',
+    'GPS HOME',
+    'GPS HOLD',
+    'BEEPER'
+)
+
+_BOX_IDS: Final[tuple[int]] = (0, 1, 2, 3, 5, 6, 7, 10, 11, 13)
+
+_PID_NAMES: Final[tuple[str]] = (
+    'ROLL',
+    'PITCH',
+    'YAW',
+    'ALT',
+    'Pos',
+    'PosR',
+    'NavR',
+    'LEVEL',
+    'MAG',
+    'VEL'
+)
+
+_DEFAULT_VALUES: Final[dict[_MspCommand, tuple]] = {
+    MSP_BOX: (0,) * len(_BOX_NAMES),
+    MSP_COMP_GPS: (10, 90, 1),
+    MSP_IDENT: (
+        240,
+        MultiWiiMultitype.QuadX,
+        MultiWiiCapability.Bind | MultiWiiCapability.Nav,
+        0
+    ),
+    MSP_MISC: (0, 1000, 1150, 1150, 1850, 0, 0, 0, 131, 107, 99, 93),
+    MSP_MOTOR: (1000,) * 4 + (0,) * 4,
+    MSP_MOTOR_PINS: (9, 10, 11, 3, 0, 0, 0, 0),
+    MSP_PID: (
+        33, 30, 23,
+        33, 30, 23,
+        68, 45, 0,
+        64, 25, 24,
+        11, 0, 0,
+        20, 8, 45,
+        14, 20, 80,
+        90, 10, 100,
+        40, 0, 0,
+        0, 0, 0
+    ),
+    MSP_RAW_GPS: (1, 9, 593293000, 180686000, 25, 0, 0),
+    MSP_RC: (1500, 1500, 1500, 1000, 1000, 1000, 1000, 1000),
+    MSP_RC_TUNING: (90, 65, 0, 0, 0, 50, 0),
+    MSP_SERVO: (1500,) * 8,
+    MSP_SERVO_CONF: (1020, 2000, 1500, 100) * 8
+}
+
+_SET_COMMAND_TO_COMMAND_MAP: Final[dict[_MspCommand, _MspCommand]] = {
+    MSP_SET_BOX: MSP_BOX,
+    MSP_SET_MISC: MSP_MISC,
+    MSP_SET_MOTOR: MSP_MOTOR,
+    MSP_SET_PID: MSP_PID,
+    MSP_SET_RAW_RC: MSP_RC,
+    MSP_SET_RC_TUNING: MSP_RC_TUNING,
+    MSP_SET_SERVO_CONF: MSP_SERVO_CONF
+}
+
+class SimulatedFlightController(object):
+    """
+    Represents a simulated MultiWii flight controller that answers MSP v1 requests.
+
+    The simulator runs a thread that decodes request messages from a transport and answers
+    every command in `multiwii.commands` with a plausible payload. Telemetry values such as
+    the attitude, altitude and raw IMU readings change slowly over time, and values written
+    with set-commands are reflected in subsequent reads of the corresponding commands.
+
+    By default, the simulator opens a pseudo-terminal whose slave device can be opened with
+    `serial.Serial`, so that a `MultiWii` instance talks to it through the same code path as
+    it would to a physical flight controller.
+
+    Note
+    ----
+    Set-commands are acknowledged with an empty response message, like the firmware does.
+    Commands with unknown codes or data of an unexpected size are answered with an error
+    message.
+    """
+    DEFAULT_READ_TIMEOUT: Final[float] = 0.05
+    """float: The default read timeout in seconds of a transport opened by the simulator."""
+
+    _baudrate: Final[int | None]
+
+    _commands: Final[dict[int, _MspCommand]]
+
+    _device_path: Final[str | None]
+
+    _exception: Exception | None
+
+    _frame_decoder: Final[_MspFrameDecoder]
+
+    _heading: int
+
+    _link_free_time: float
+
+    _lock: Final[Lock]
+
+    _request_count: int
+
+    _selected_setting: int
+
+    _start_time: Final[float]
+
+    _stop_event: Final[Event]
+
+    _thread: Thread | None
+
+    _transport: Final[Transport]
+
+    _values: Final[dict[_MspCommand, tuple]]
+
+    _waypoints: Final[dict[int, tuple]]
+
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        baudrate:  int | None       = None
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided transport or a new pseudo-terminal.
+
+        Parameters
+        ----------
+        transport : Transport | None
+            The transport to answer requests on, or None to open a pseudo-terminal.
+        baudrate : int | None
+            The baudrate to pace responses at (8N1 framing), or None to respond as fast as
+            the transport allows.
+        """
+        device_path = None
+
+        if transport is None:
+            transport, device_path = FdTransport.open_pty(timeout=self.DEFAULT_READ_TIMEOUT)
+
+        self._baudrate = baudrate
+
+        self._commands = {
+            value.code: value for value in vars(commands).values()
+            if isinstance(value, _MspCommand)
+        }
+
+        self._device_path = device_path
+
+        self._exception = None
+
+        self._frame_decoder = _MspFrameDecoder(MESSAGE_OUTGOING_HEADER)
+
+        self._link_free_time = 0.0
+
+        self._lock = Lock()
+
+        self._request_count = 0
+
+        self._start_time = perf_counter()
+
+        self._stop_event = Event()
+
+        self._thread = None
+
+        self._transport = transport
+
+        self._values = {}
+
+        self._waypoints = {}
+
+        self._reset_values()
+
+    def __enter__(self) -> Self:
+        """
+        Starts the simulator.
+
+        Returns
+        -------
+        SimulatedFlightController
+            The instance itself.
+        """
+        self.start()
+
+        return self
+
+    def __exit__(self, *args: Any) -> NoReturn:
+        """
+        Stops the simulator and closes the transport.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the simulator thread early, if handling a request
+            failed.
+        """
+        self.close()
+
+    @property
+    def device_path(self) -> str | None:
+        """
+        Gets the path of the pseudo-terminal device to connect to.
+
+        Returns
+        -------
+        str | None
+            The device path, or None if the simulator was created with a transport.
+        """
+        return self._device_path
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Gets a value indicative whether the simulator is answering requests.
+
+        Returns
+        -------
+        bool
+            True if the simulator thread is running, False otherwise.
+        """
+        return self._thread is not None
+
+    @property
+    def request_count(self) -> int:
+        """
+        Gets the number of request messages that have been answered.
+
+        Returns
+        -------
+        int
+            The number of answered requests.
+        """
+        return self._request_count
+
+    @property
+    def transport(self) -> Transport:
+        """
+        Gets the transport that requests are answered on.
+
+        Returns
+        -------
+        Transport
+            The transport instance.
+        """
+        return self._transport
+
+    def _apply_set_command(self, command: _MspCommand, data: tuple) -> NoReturn:
+        """
+        Updates the simulated state with the data values of a set-command.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The set-command that was received.
+        data : tuple
+            The unpacked data values of the set-command.
+        """
+        if command in _SET_COMMAND_TO_COMMAND_MAP:
+            self._values[_SET_COMMAND_TO_COMMAND_MAP[command]] = data
+        elif command == MSP_SET_RAW_GPS:
+            self._values[MSP_RAW_GPS] = data + self._values[MSP_RAW_GPS][len(data):]
+        elif command == MSP_SET_WP:
+            self._waypoints[data[0]] = data
+        elif command == MSP_SELECT_SETTING:
+            self._selected_setting = data[0]
+        elif command == MSP_SET_HEAD:
+            self._heading = data[0]
+        elif command == MSP_RESET_CONF:
+            self._reset_values()
+
+    def _get_response_data(self, command: _MspCommand, request_data: bytes) -> bytes:
+        """
+        Serializes the current data values of a command for a response message.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The command to respond to.
+        request_data : bytes
+            The data of the request message, e.g. the waypoint number of `MSP_WP`.
+
+        Returns
+        -------
+        bytes
+            The serialized data values.
+        """
+        if command == MSP_BOXNAMES:
+            return ';'.join(_BOX_NAMES).encode('ascii')
+
+        if command == MSP_PIDNAMES:
+            return ';'.join(_PID_NAMES).encode('ascii')
+
+        if command == MSP_BOXIDS:
+            return bytes(_BOX_IDS)
+
+        if command == MSP_BOX:
+            values = self._values[MSP_BOX]
+
+            return command.get_data_struct(len(values)).pack(*values)
+
+        return command.data_struct.pack(*self.get_values(command, request_data))
+
+    def _handle_frame(self, frame: _MspFrame) -> bytes:
+        """
+        Handles a request frame and creates the response message for it.
+
+        Parameters
+        ----------
+        frame : _MspFrame
+            The decoded request frame.
+
+        Returns
+        -------
+        bytes
+            The full response message in bytes.
+        """
+        command = self._commands.get(frame.code)
+
+        request_data = frame.payload[2:]
+
+        if command is None or frame.is_error:
+            return create_response_message(frame.code, is_error=True)
+
+        if not command.is_set_command:
+            with self._lock:
+                data = self._get_response_data(command, request_data)
+
+            return create_response_message(command.code, data)
+
+        try:
+            data = _unpack_request_data(command, request_data)
+        except StructError:
+            return create_response_message(command.code, is_error=True)
+
+        with self._lock:
+            self._apply_set_command(command, data)
+
+        return create_response_message(command.code)
+
+    def _reset_values(self) -> NoReturn:
+        """
+        Resets the simulated state to the default values.
+        """
+        self._heading = 0
+
+        self._selected_setting = 0
+
+        self._values.clear()
+
+        self._values.update(_DEFAULT_VALUES)
+
+        self._waypoints.clear()
+
+    def _run(self) -> NoReturn:
+        """
+        Reads and answers request messages until the simulator is stopped.
+
+        A read error ends the thread quietly, as it means that the transport was closed. Any
+        other exception is kept and raised by `stop`.
+        """
+        transport = self._transport
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    frames = self._frame_decoder.read_from(transport)
+                except OSError:
+                    break
+
+                for frame in frames:
+                    message = self._handle_frame(frame)
+
+                    self._request_count += 1
+
+                    self._write_response_message(message)
+        except Exception as exception:
+            self._exception = exception
+
+    def _write_response_message(self, message: bytes) -> NoReturn:
+        """
+        Writes a response message, pacing it at the simulated baudrate if one is set.
+
+        Parameters
+        ----------
+        message : bytes
+            The full response message in bytes.
+        """
+        if self._baudrate:
+            now = perf_counter()
+
+            transfer_time = len(message) * 10 / self._baudrate
+
+            self._link_free_time = max(self._link_free_time, now) + transfer_time
+
+            sleep(self._link_free_time - now)
+
+        self._transport.write(message)
+
+    def close(self) -> NoReturn:
+        """
+        Stops the simulator and closes the transport.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the simulator thread early, if handling a request
+            failed. The transport is closed regardless.
+        """
+        try:
+            self.stop()
+        finally:
+            self._transport.close()
+
+    def get_values(self, command: _MspCommand, request_data: bytes = b'') -> tuple:
+        """
+        Gets the data values the simulator currently responds with for a command.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            An instance of `_MspCommand` representing a fixed-size read command.
+        request_data : bytes
+            The data of the request message, e.g. the waypoint number of `MSP_WP`.
+
+        Returns
+        -------
+        tuple
+            The data values in the order of the command's data structure format.
+        """
+        t = perf_counter() - self._start_time
+
+        if command == MSP_STATUS:
+            sensors = sum(
+                1 << sensor for sensor in (
+                    MultiWiiSensor.Acc,
+                    MultiWiiSensor.Baro,
+                    MultiWiiSensor.Mag,
+                    MultiWiiSensor.Gps
+                )
+            )
+
+            return (2800 + int(20 * sin(t * 7)), 0, sensors, 0, self._selected_setting)
+
+        if command == MSP_RAW_IMU:
+            return (
+                int(20 * sin(t)),
+                int(20 * cos(t)),
+                512,
+                int(5 * sin(t * 3)),
+                int(5 * cos(t * 3)),
+                int(2 * sin(t * 5)),
+                120,
+                -40,
+                380
+            )
+
+        if command == MSP_ATTITUDE:
+            return (int(50 * sin(t)), int(30 * cos(t)), self._heading)
+
+        if command == MSP_ALTITUDE:
+            return (150 + int(10 * sin(t / 2)), int(10 * cos(t / 2)))
+
+        if command == MSP_ANALOG:
+            return (max(126 - int(t / 60), 105), int(t * 10) & 0xffff, 1023, 120)
+
+        if command == MSP_WP:
+            number = request_data[0] if request_data else 0
+
+            home = self._values[MSP_RAW_GPS]
+
+            return self._waypoints.get(number, (number, home[2], home[3], 0, 0, 0, 0))
+
+        return self._values[command]
+
+    def start(self) -> NoReturn:
+        """
+        Starts answering requests on a background thread.
+
+        Raises
+        ------
+        RuntimeError
+            If the simulator is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The simulator is already running.')
+
+        self._exception = None
+
+        self._stop_event.clear()
+
+        self._thread = Thread(target=self._run, name='SimulatedFlightController', daemon=True)
+
+        self._thread.start()
+
+    def stop(self) -> NoReturn:
+        """
+        Stops answering requests and waits for the thread to finish.
+
+        Stopping takes up to the read timeout of the transport.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the thread early, if handling a request failed, e.g. a
+            `struct.error` for data values that do not match the format of a command.
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+
+        self._thread.join()
+
+        self._thread = None
+
+        if self._exception is not None:
+            raise self._exception
+
+def _unpack_request_data(command: _MspCommand, data: bytes) -> tuple:
+    """
+    Unpacks the data of a set-command request message.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        The set-command of the request message.
+    data : bytes
+        The serialized data values.
+
+    Raises
+    ------
+    struct.error
+        If the size of the data does not match the data structure format of the command.
+
+    Returns
+    -------
+    tuple
+        The unpacked data values.
+    """
+    if not command.data_struct:
+        if data:
+            raise StructError(f'Unexpected data for {command!r}.')
+
+        return ()
+
+    return command.get_data_struct(len(data) // command.data_size).unpack(data)
+
+def create_response_message(code: int, data: bytes = b'', is_error: bool = False) -> bytes:
+    """
+    Constructs a serialized response message for a command code and serialized data.
+
+    The simulator answers requests with these messages, and they can be written to a transport
+    directly to feed a `MultiWii` instance with canned responses.
+
+    Parameters
+    ----------
+    code : int
+        The command code of the response message.
+    data : bytes
+        The serialized data values to include in the payload.
+    is_error : bool
+        True to create an error message, False otherwise.
+
+    Returns
+    -------
+    bytes
+        The full message in bytes.
+    """
+    payload = bytes((len(data), code)) + data
+
+    header = MESSAGE_ERROR_HEADER if is_error else MESSAGE_INCOMING_HEADER
+
+    return header + payload + bytes((_crc8_xor(payload),))
@@ -0,0 +1,395 @@
+from ._command import _MspCommand
+
+from .bulk import _require_numpy, get_data_dtype, np
+
+from .messaging import MESSAGE_HEADER_SIZE, MESSAGE_INCOMING_HEADER
+
+from typing import Final, Iterable, NoReturn, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy import dtype, ndarray
+
+class ColumnRingBuffer(object):
+    """
+    Represents the last N samples of the data values of a single command, stored in
+    preallocated NumPy column arrays.
+
+    Each data value of the command is stored in its own contiguous column, using the same
+    integer type as on the wire, alongside a column of `time.monotonic_ns` timestamps. New
+    samples overwrite the oldest ones in place, so appending never allocates memory or
+    creates data structure instances.
+
+    Note
+    ----
+    The columns hold the raw data values, e.g. tenths of degrees for the attitude angles,
+    exactly as they are unpacked from response messages. This class requires NumPy.
+    """
+    _capacity: Final[int]
+
+    _column_arrays: Final[tuple['ndarray', ...]]
+
+    _columns: Final[dict[str, 'ndarray']]
+
+    _command: Final[_MspCommand]
+
+    _index: int
+
+    _timestamps: Final['ndarray']
+
+    _total_count: int
+
+    _wire_dtype: Final['dtype']
+
+    def __init__(
+        self,
+        command:      _MspCommand,
+        capacity:     int,
+        column_names: Sequence[str] | None = None
+    ) -> NoReturn:
+        """
+        Initializes an instance with preallocated columns for the command.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            A command with fixed-size, numeric data values.
+        capacity : int
+            The number of samples that are kept.
+        column_names : Sequence[str] | None
+            The names of the columns, in the order of the data values, or None to use the
+            names derived from the schema of the data structure type, e.g. `yaw_angle`, and
+            `value_<index>` for commands without a schema.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If the capacity is not a positive number, the data values of the command cannot be
+            stored in columns, or the number of column names does not match.
+        """
+        _require_numpy()
+
+        if capacity <= 0:
+            raise ValueError('Capacity must be a positive number.')
+
+        self._wire_dtype = get_data_dtype(command, column_names)
+
+        self._capacity = capacity
+
+        self._columns = {
+            name: np.zeros(capacity, self._wire_dtype[name].newbyteorder('='))
+            for name in self._wire_dtype.names
+        }
+
+        self._column_arrays = tuple(self._columns.values())
+
+        self._command = command
+
+        self._index = 0
+
+        self._timestamps = np.zeros(capacity, np.int64)
+
+        self._total_count = 0
+
+    def __len__(self) -> int:
+        """
+        Gets the number of samples that are stored.
+
+        Returns
+        -------
+        int
+            The number of stored samples, which is at most the capacity.
+        """
+        return min(self._total_count, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the number of samples that are kept.
+
+        Returns
+        -------
+        int
+            The capacity.
+        """
+        return self._capacity
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """
+        Gets the names of the columns.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The column names, in the order of the data values.
+        """
+        return self._wire_dtype.names
+
+    @property
+    def command(self) -> _MspCommand:
+        """
+        Gets the command of which the data values are stored.
+
+        Returns
+        -------
+        _MspCommand
+            The command.
+        """
+        return self._command
+
+    @property
+    def total_count(self) -> int:
+        """
+        Gets the number of samples that have been appended, including overwritten samples.
+
+        Returns
+        -------
+        int
+            The number of appended samples.
+        """
+        return self._total_count
+
+    def _get_ordered(self, array: 'ndarray') -> 'ndarray':
+        """
+        Gets the stored samples of a column from the oldest to the newest.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A column array.
+
+        Returns
+        -------
+        numpy.ndarray
+            A view of the column if it has not wrapped around yet, or an ordered copy.
+        """
+        if self._total_count <= self._capacity:
+            return array[:self._total_count]
+
+        return np.concatenate((array[self._index:], array[:self._index]))
+
+    def append(self, timestamp: int, data: Sequence[int]) -> NoReturn:
+        """
+        Appends a sample of unpacked data values, overwriting the oldest sample if full.
+
+        Parameters
+        ----------
+        timestamp : int
+            The `time.monotonic_ns` value of the sample.
+        data : Sequence[int]
+            The data values, e.g. as returned by `struct.unpack`.
+        """
+        index = self._index
+
+        for column, value in zip(self._column_arrays, data):
+            column[index] = value
+
+        self._timestamps[index] = timestamp
+
+        self._index = (index + 1) % self._capacity
+
+        self._total_count += 1
+
+    def append_raw(self, timestamp: int, data: bytes | bytearray | memoryview) -> NoReturn:
+        """
+        Appends a sample of serialized data values, overwriting the oldest sample if full.
+
+        The data values are converted by NumPy directly from the bytes, without unpacking
+        them to Python objects first.
+
+        Parameters
+        ----------
+        timestamp : int
+            The `time.monotonic_ns` value of the sample.
+        data : bytes | bytearray | memoryview
+            The data values as on the wire, without the data size and command code.
+        """
+        record = np.frombuffer(data, self._wire_dtype, 1)[0]
+
+        index = self._index
+
+        for name, column in self._columns.items():
+            column[index] = record[name]
+
+        self._timestamps[index] = timestamp
+
+        self._index = (index + 1) % self._capacity
+
+        self._total_count += 1
+
+    def clear(self) -> NoReturn:
+        """
+        Removes all samples.
+        """
+        self._index = 0
+
+        self._total_count = 0
+
+    def get_column(self, name: str) -> 'ndarray':
+        """
+        Gets the stored values of a column from the oldest to the newest sample.
+
+        Parameters
+        ----------
+        name : str
+            The name of the column.
+
+        Raises
+        ------
+        KeyError
+            If no column with the name exists.
+
+        Returns
+        -------
+        numpy.ndarray
+            A one-dimensional array, which is a view of the column until the buffer wraps
+            around for the first time, and a copy afterwards.
+        """
+        return self._get_ordered(self._columns[name])
+
+    def get_columns(self) -> dict[str, 'ndarray']:
+        """
+        Gets the stored values of all columns from the oldest to the newest sample.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            A dictionary that maps each column name to its values.
+        """
+        return {name: self._get_ordered(column) for name, column in self._columns.items()}
+
+    def get_timestamps(self) -> 'ndarray':
+        """
+        Gets the timestamps from the oldest to the newest sample.
+
+        Returns
+        -------
+        numpy.ndarray
+            A one-dimensional array of `time.monotonic_ns` values.
+        """
+        return self._get_ordered(self._timestamps)
+
+class TelemetryStore(object):
+    """
+    Represents a set of column ring buffers, one per telemetry command.
+
+    Assign an instance to `MultiWii.telemetry_store` to store the data values of every
+    received response message of the stored commands as it is decoded, or feed it with the
+    frames of a recording through `append_frame`.
+
+    Note
+    ----
+    This class requires NumPy.
+    """
+    DEFAULT_CAPACITY: Final[int] = 1024
+    """int: The default number of samples that are kept per command."""
+
+    _buffers: Final[dict[int, ColumnRingBuffer]]
+
+    def __init__(
+        self,
+        commands: Iterable[_MspCommand],
+        capacity: int = DEFAULT_CAPACITY
+    ) -> NoReturn:
+        """
+        Initializes an instance with a column ring buffer for each command.
+
+        Parameters
+        ----------
+        commands : Iterable[_MspCommand]
+            The commands with fixed-size, numeric data values to store.
+        capacity : int
+            The number of samples that are kept per command.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If the capacity is not a positive number, or the data values of a command cannot
+            be stored in columns.
+        """
+        self._buffers = {
+            command.code: ColumnRingBuffer(command, capacity) for command in commands
+        }
+
+    def __contains__(self, command: _MspCommand) -> bool:
+        """
+        Gets a value indicative whether the data values of a command are stored.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The command.
+
+        Returns
+        -------
+        bool
+            True if the command is stored, False otherwise.
+        """
+        return command.code in self._buffers
+
+    def __getitem__(self, command: _MspCommand) -> ColumnRingBuffer:
+        """
+        Gets the column ring buffer of a command.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The command.
+
+        Raises
+        ------
+        KeyError
+            If the command is not stored.
+
+        Returns
+        -------
+        ColumnRingBuffer
+            The column ring buffer.
+        """
+        return self._buffers[command.code]
+
+    @property
+    def commands(self) -> tuple[_MspCommand, ...]:
+        """
+        Gets the commands of which the data values are stored.
+
+        Returns
+        -------
+        tuple[_MspCommand, ...]
+            The stored commands.
+        """
+        return tuple(buffer.command for buffer in self._buffers.values())
+
+    def append_frame(self, timestamp: int, frame: bytes | bytearray | memoryview) -> bool:
+        """
+        Appends the data values of a raw response frame, if its command is stored.
+
+        Parameters
+        ----------
+        timestamp : int
+            The `time.monotonic_ns` value at which the frame was received.
+        frame : bytes | bytearray | memoryview
+            The checksum-verified frame, including the header and the checksum.
+
+        Returns
+        -------
+        bool
+            True if the data values were stored, False if the command is not stored, or the
+            frame is an error frame or does not have the expected size.
+        """
+        buffer = self._buffers.get(frame[MESSAGE_HEADER_SIZE + 1])
+
+        if (
+            buffer is None or
+            frame[MESSAGE_HEADER_SIZE - 1] != MESSAGE_INCOMING_HEADER[-1] or
+            frame[MESSAGE_HEADER_SIZE] != buffer.command.data_size
+        ):
+            return False
+
+        buffer.append_raw(timestamp, frame[MESSAGE_HEADER_SIZE + 2:-1])
+
+        return True
@@ -0,0 +1,342 @@
+from .commands import MSP_SET_RAW_RC
+
+from .data import MspRc
+
+from .messaging import (
+    _crc8_xor,
+    _PAYLOAD_HEADER_STRUCT,
+    MESSAGE_HEADER_SIZE,
+    MESSAGE_OUTGOING_HEADER,
+    MESSAGE_OVERHEAD_SIZE
+)
+
+from threading import Event, Lock, Thread
+from time      import perf_counter
+from typing    import Any, Final, NoReturn, Self, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import MultiWii
+
+class RcStreamer(object):
+    """
+    Sends the latest RC setpoint to the FC at a fixed rate on a background thread.
+
+    The streamer keeps a preallocated MSP_SET_RAW_RC message that is re-encoded only when
+    the setpoint changes, so every send is a single write of an existing buffer. Sends are
+    scheduled on a fixed grid of `1 / rate` seconds from the start time, which prevents the
+    drift of sleep-based loops. The thread sleeps until shortly before each send and spins
+    for the remaining time, which keeps the send jitter well below a millisecond.
+
+    Note
+    ----
+    If a send is late by more than a full period, e.g. because the transport blocked, the
+    missed sends are skipped instead of being sent in a burst, and counted as overruns.
+    """
+    DEFAULT_RATE: Final[float] = 50.0
+    """float: The default send rate in hertz."""
+
+    DEFAULT_SPIN_DURATION: Final[float] = 0.001
+    """float: The default time in seconds to busy-wait before each send."""
+
+    _exception: Exception | None
+
+    _frame: bytes
+
+    _frame_buffer: Final[bytearray]
+
+    _lock: Final[Lock]
+
+    _max_lateness: float
+
+    _multiwii: Final['MultiWii']
+
+    _overrun_count: int
+
+    _period: Final[float]
+
+    _send_count: int
+
+    _setpoint: MspRc
+
+    _spin_duration: Final[float]
+
+    _stop_event: Final[Event]
+
+    _thread: Thread | None
+
+    def __init__(
+        self,
+        multiwii:      'MultiWii',
+        setpoint:      MspRc,
+        rate:          float = DEFAULT_RATE,
+        spin_duration: float = DEFAULT_SPIN_DURATION
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided initial setpoint and send rate.
+
+        Parameters
+        ----------
+        multiwii : MultiWii
+            The `MultiWii` instance used for sending.
+        setpoint : MspRc
+            The initial RC setpoint.
+        rate : float
+            The send rate in hertz.
+        spin_duration : float
+            The time in seconds to busy-wait before each send instead of sleeping. Longer
+            durations reduce the jitter at the cost of CPU time.
+
+        Raises
+        ------
+        ValueError
+            If the rate is not a positive number, or the spin duration is negative.
+        """
+        if rate <= 0:
+            raise ValueError('Rate must be a positive number.')
+
+        if spin_duration < 0:
+            raise ValueError('Spin duration must not be negative.')
+
+        data_size = MSP_SET_RAW_RC.data_size
+
+        self._exception = None
+
+        self._frame_buffer = bytearray(MESSAGE_OVERHEAD_SIZE + data_size)
+
+        self._frame_buffer[:MESSAGE_HEADER_SIZE] = MESSAGE_OUTGOING_HEADER
+
+        _PAYLOAD_HEADER_STRUCT.pack_into(
+            self._frame_buffer,
+            MESSAGE_HEADER_SIZE,
+            data_size,
+            MSP_SET_RAW_RC.code
+        )
+
+        self._lock = Lock()
+
+        self._max_lateness = 0.0
+
+        self._multiwii = multiwii
+
+        self._overrun_count = 0
+
+        self._period = 1 / rate
+
+        self._send_count = 0
+
+        self._spin_duration = spin_duration
+
+        self._stop_event = Event()
+
+        self._thread = None
+
+        self.setpoint = setpoint
+
+    def __enter__(self) -> Self:
+        """
+        Starts the streamer.
+
+        Returns
+        -------
+        RcStreamer
+            The instance itself.
+        """
+        self.start()
+
+        return self
+
+    def __exit__(self, *args: Any) -> NoReturn:
+        """
+        Stops the streamer.
+        """
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Gets a value indicative whether the streamer is sending.
+
+        Returns
+        -------
+        bool
+            True if the streamer thread is running, False otherwise.
+        """
+        return self._thread is not None
+
+    @property
+    def max_lateness(self) -> float:
+        """
+        Gets the largest delay of a send behind its scheduled time.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        return self._max_lateness
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        Gets the number of sends that were skipped because the streamer fell behind.
+
+        Returns
+        -------
+        int
+            The number of skipped sends.
+        """
+        return self._overrun_count
+
+    @property
+    def rate(self) -> float:
+        """
+        Gets the send rate.
+
+        Returns
+        -------
+        float
+            The send rate in hertz.
+        """
+        return 1 / self._period
+
+    @property
+    def send_count(self) -> int:
+        """
+        Gets the number of messages that have been sent.
+
+        Returns
+        -------
+        int
+            The number of sent messages.
+        """
+        return self._send_count
+
+    @property
+    def setpoint(self) -> MspRc:
+        """
+        Gets the RC setpoint that is being sent.
+
+        Returns
+        -------
+        MspRc
+            The current setpoint.
+        """
+        return self._setpoint
+
+    @setpoint.setter
+    def setpoint(self, value: MspRc) -> NoReturn:
+        """
+        Sets the RC setpoint that is sent from the next send on.
+
+        The message is encoded in the calling thread, and the sending thread picks it up with
+        a single reference swap, so updating the setpoint never waits for a send.
+
+        Parameters
+        ----------
+        value : MspRc
+            The new setpoint.
+        """
+        frame_buffer = self._frame_buffer
+
+        with self._lock:
+            MSP_SET_RAW_RC.data_struct.pack_into(
+                frame_buffer,
+                MESSAGE_HEADER_SIZE + 2,
+                *value.as_serializable()
+            )
+
+            frame_buffer[-1] = _crc8_xor(memoryview(frame_buffer)[MESSAGE_HEADER_SIZE:-1])
+
+            self._frame = bytes(frame_buffer)
+
+            self._setpoint = value
+
+    def _run(self) -> NoReturn:
+        """
+        Sends the current message on a fixed time grid until the streamer is stopped.
+        """
+        period = self._period
+
+        spin_duration = self._spin_duration
+
+        stop_event = self._stop_event
+
+        send_message = self._multiwii.send_message
+
+        send_time = perf_counter()
+
+        while True:
+            remaining_time = send_time - perf_counter() - spin_duration
+
+            if remaining_time > 0 and stop_event.wait(remaining_time):
+                break
+
+            if stop_event.is_set():
+                break
+
+            while (now := perf_counter()) < send_time:
+                pass
+
+            if now - send_time > self._max_lateness:
+                self._max_lateness = now - send_time
+
+            try:
+                send_message(self._frame)
+            except Exception as exception:
+                self._exception = exception
+
+                break
+
+            self._send_count += 1
+
+            send_time += period
+
+            delay = perf_counter() - send_time
+
+            if delay >= period:
+                skipped_count = int(delay // period)
+
+                self._overrun_count += skipped_count
+
+                send_time += skipped_count * period
+
+    def start(self) -> NoReturn:
+        """
+        Starts sending on a background thread.
+
+        Raises
+        ------
+        RuntimeError
+            If the streamer is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The streamer is already running.')
+
+        self._exception = None
+
+        self._stop_event.clear()
+
+        self._thread = Thread(target=self._run, name='MultiWiiRcStreamer', daemon=True)
+
+        self._thread.start()
+
+    def stop(self) -> NoReturn:
+        """
+        Stops sending and waits for the thread to finish.
+
+        Raises
+        ------
+        Exception
+            The exception that stopped the thread early, if a write failed.
+        """
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+
+        self._thread.join()
+
+        self._thread = None
+
+        if self._exception is not None:
+            raise self._exception
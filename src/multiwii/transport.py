@@ -0,0 +1,795 @@
+from errno     import EAGAIN, EWOULDBLOCK
+from io        import UnsupportedOperation
+from select    import select
+from serial    import PARITY_NONE, Serial
+from struct    import unpack
+from threading import Condition
+from typing    import Final, NoReturn, Protocol, Self, Sequence, runtime_checkable
+
+import os
+import socket
+
+try:
+    import fcntl
+    import termios
+    import tty
+except ImportError:
+    # The file descriptor based transports are only available on POSIX systems.
+    fcntl = termios = tty = None
+
+_IOV_MAX: Final[int] = 1024
+"""int: The maximum number of buffers passed to a single `os.writev` call on Linux and macOS."""
+
+@runtime_checkable
+class Transport(Protocol):
+    """
+    Represents a byte stream connection to a MultiWii flight controller.
+
+    Any object that implements the members of this protocol can be passed to `MultiWii` in
+    place of a serial port. The read timeout follows the conventions of `pyserial`: None
+    blocks until data is available, zero never blocks, and a positive number is the maximum
+    time in seconds that a read waits for data.
+    """
+    @property
+    def byte_time(self) -> float:
+        """
+        Gets the time (in seconds) it takes to transfer a single byte over the link.
+
+        Returns
+        -------
+        float
+            The time in seconds, or zero if the link speed is unknown or unbounded.
+        """
+        ...
+
+    @property
+    def in_waiting(self) -> int:
+        """
+        Gets the number of bytes that can be read without blocking.
+
+        Returns
+        -------
+        int
+            The number of waiting bytes.
+        """
+        ...
+
+    @property
+    def timeout(self) -> float | None:
+        """
+        Gets the read timeout (in seconds).
+
+        Returns
+        -------
+        float | None
+            The read timeout in seconds, or None if reads block until data is available.
+        """
+        ...
+
+    def close(self) -> NoReturn:
+        """
+        Closes the connection.
+        """
+        ...
+
+    def fileno(self) -> int:
+        """
+        Gets the file descriptor of the connection, for use with `select` or event loops.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            If the connection is not backed by a file descriptor.
+
+        Returns
+        -------
+        int
+            The file descriptor.
+        """
+        ...
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        """
+        Reads bytes into the given buffer.
+
+        The read returns once the buffer is full, or when the read timeout expires with fewer
+        bytes (possibly none) read. Transports that receive data in packets may also return as
+        soon as some bytes have been read.
+
+        Parameters
+        ----------
+        buffer : bytearray | memoryview
+            A writable buffer to read into.
+
+        Returns
+        -------
+        int
+            The number of bytes read.
+        """
+        ...
+
+    def reset_input_buffer(self) -> NoReturn:
+        """
+        Discards all bytes that have been received but not read.
+        """
+        ...
+
+    def reset_output_buffer(self) -> NoReturn:
+        """
+        Discards all bytes that have been written but not transmitted, where supported.
+        """
+        ...
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """
+        Writes all of the given bytes.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            The bytes to write.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        ...
+
+def _create_transport(value: Serial | Transport) -> Transport:
+    """
+    Gets a transport for a serial port or an object that implements the `Transport` protocol.
+
+    Parameters
+    ----------
+    value : Serial | Transport
+        A serial port instance, which is wrapped in a `SerialTransport`, or a transport.
+
+    Raises
+    ------
+    TypeError
+        If the value is neither a serial port nor a transport.
+
+    Returns
+    -------
+    Transport
+        The transport instance.
+    """
+    if isinstance(value, Serial):
+        return SerialTransport(value)
+
+    if isinstance(value, Transport):
+        return value
+
+    raise TypeError('The serial port must be an instance of "Serial" or "Transport".')
+
+def _get_waiting_size(fd: int) -> int:
+    """
+    Gets the number of bytes that can be read from a file descriptor without blocking.
+
+    Parameters
+    ----------
+    fd : int
+        The file descriptor of a terminal, pipe or socket.
+
+    Returns
+    -------
+    int
+        The number of waiting bytes.
+    """
+    return unpack('i', fcntl.ioctl(fd, termios.FIONREAD, b'\x00' * 4))[0]
+
+def _write_buffers(transport: Transport, buffers: Sequence[bytes]) -> int:
+    """
+    Writes the given buffers back-to-back with as few system calls as the transport allows.
+
+    Transports that implement a `write_many` method, such as `FdTransport`, write the buffers
+    with a single gathered write. The buffers are joined and written with a single `write`
+    call for any other transport.
+
+    Parameters
+    ----------
+    transport : Transport
+        The transport to write to.
+    buffers : Sequence[bytes]
+        The buffers to write, in order.
+
+    Returns
+    -------
+    int
+        The number of bytes written.
+    """
+    write_many = getattr(transport, 'write_many', None)
+
+    if write_many is not None:
+        return write_many(buffers)
+
+    return transport.write(b''.join(buffers))
+
+def _wait_readable(fd: int, timeout: float | None) -> bool:
+    """
+    Waits until a file descriptor is readable or the timeout expires.
+
+    Parameters
+    ----------
+    fd : int
+        The file descriptor to wait for.
+    timeout : float | None
+        The time in seconds to wait, or None to wait indefinitely.
+
+    Returns
+    -------
+    bool
+        True if the file descriptor is readable, False otherwise.
+    """
+    return bool(select((fd,), (), (), timeout)[0])
+
+class FdTransport(Transport):
+    """
+    Represents a transport over a raw POSIX file descriptor, such as a pseudo-terminal.
+
+    Note
+    ----
+    This transport is only available on POSIX systems.
+    """
+    _baudrate: Final[int | None]
+
+    _fd: Final[int]
+
+    _is_terminal: Final[bool]
+
+    _owns_fd: Final[bool]
+
+    _slave_fd: int | None
+
+    _timeout: float | None
+
+    def __init__(
+        self,
+        fd:       int,
+        timeout:  float | None = None,
+        baudrate: int | None   = None,
+        owns_fd:  bool         = False
+    ) -> NoReturn:
+        """
+        Initializes an instance using the provided file descriptor.
+
+        Parameters
+        ----------
+        fd : int
+            An open file descriptor.
+        timeout : float | None
+            The read timeout in seconds, or None to block until data is available.
+        baudrate : int | None
+            The baudrate of the underlying link (8N1 framing), if known.
+        owns_fd : bool
+            True if the file descriptor should be closed when the transport is closed.
+        """
+        self._baudrate = baudrate
+
+        self._fd = fd
+
+        self._is_terminal = os.isatty(fd)
+
+        self._owns_fd = owns_fd
+
+        self._slave_fd = None
+
+        self._timeout = timeout
+
+    @classmethod
+    def open_pty(cls, timeout: float | None = None) -> tuple[Self, str]:
+        """
+        Opens a pseudo-terminal in raw mode and returns a transport for its master side.
+
+        The slave side can be opened by path, e.g. with `serial.Serial`, by the other party.
+        The transport keeps its own descriptor of the slave side open until it is closed, so
+        that reads from the master side do not fail while the other party is disconnected.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The read timeout of the master transport in seconds.
+
+        Returns
+        -------
+        tuple[FdTransport, str]
+            A tuple with the master transport and the path of the slave device.
+        """
+        master_fd, slave_fd = os.openpty()
+
+        tty.setraw(slave_fd)
+
+        transport = cls(master_fd, timeout=timeout, owns_fd=True)
+
+        transport._slave_fd = slave_fd
+
+        return transport, os.ttyname(slave_fd)
+
+    @property
+    def byte_time(self) -> float:
+        return 10 / self._baudrate if self._baudrate else 0.0
+
+    @property
+    def in_waiting(self) -> int:
+        return _get_waiting_size(self._fd)
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._timeout = value
+
+    def close(self) -> NoReturn:
+        if self._slave_fd is not None:
+            os.close(self._slave_fd)
+
+            self._slave_fd = None
+
+        if self._owns_fd:
+            os.close(self._fd)
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        if not _wait_readable(self._fd, self._timeout):
+            return 0
+
+        try:
+            return os.readv(self._fd, (buffer,))
+        except BlockingIOError:
+            return 0
+
+    def reset_input_buffer(self) -> NoReturn:
+        if self._is_terminal:
+            termios.tcflush(self._fd, termios.TCIFLUSH)
+
+            return
+
+        while _wait_readable(self._fd, 0):
+            if not os.read(self._fd, 4096):
+                break
+
+    def reset_output_buffer(self) -> NoReturn:
+        if self._is_terminal:
+            termios.tcflush(self._fd, termios.TCOFLUSH)
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        view = memoryview(data)
+
+        while view:
+            view = view[os.write(self._fd, view):]
+
+        return len(data)
+
+    def write_many(self, buffers: Sequence[bytes | bytearray | memoryview]) -> int:
+        """
+        Writes all of the given buffers back-to-back using gathered writes.
+
+        Parameters
+        ----------
+        buffers : Sequence[bytes | bytearray | memoryview]
+            The buffers to write, in order.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        views = [memoryview(buffer) for buffer in buffers]
+
+        index = 0
+
+        while index < len(views):
+            count = os.writev(self._fd, views[index:index + _IOV_MAX])
+
+            while index < len(views) and count >= len(views[index]):
+                count -= len(views[index])
+
+                index += 1
+
+            if count:
+                views[index] = views[index][count:]
+
+        return sum(len(buffer) for buffer in buffers)
+
+class LoopbackTransport(Transport):
+    """
+    Represents one end of an in-memory transport pair.
+
+    Bytes written to one end can be read from the other end. This allows the message codec
+    and the `MultiWii` class to be exercised and benchmarked without any I/O.
+    """
+    _condition: Final[Condition]
+
+    _peer: Self | None
+
+    _received: Final[bytearray]
+
+    _timeout: float | None
+
+    def __init__(self, timeout: float | None = None) -> NoReturn:
+        """
+        Initializes an unconnected instance. Use `create_pair` to create connected ends.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The read timeout in seconds, or None to block until data is available.
+        """
+        self._condition = Condition()
+
+        self._peer = None
+
+        self._received = bytearray()
+
+        self._timeout = timeout
+
+    @classmethod
+    def create_pair(cls, timeout: float | None = None) -> tuple[Self, Self]:
+        """
+        Creates two connected ends of an in-memory transport.
+
+        Parameters
+        ----------
+        timeout : float | None
+            The read timeout of both ends in seconds.
+
+        Returns
+        -------
+        tuple[LoopbackTransport, LoopbackTransport]
+            A tuple with the two ends.
+        """
+        first, second = cls(timeout), cls(timeout)
+
+        first._peer, second._peer = second, first
+
+        return first, second
+
+    @property
+    def byte_time(self) -> float:
+        return 0.0
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._received)
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._timeout = value
+
+    def close(self) -> NoReturn:
+        self._peer = None
+
+    def fileno(self) -> int:
+        raise UnsupportedOperation('The loopback transport has no file descriptor.')
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        with self._condition:
+            if not self._received and self._timeout != 0:
+                self._condition.wait_for(lambda: self._received, self._timeout)
+
+            count = min(len(buffer), len(self._received))
+
+            buffer[:count] = self._received[:count]
+
+            del self._received[:count]
+
+            return count
+
+    def reset_input_buffer(self) -> NoReturn:
+        with self._condition:
+            self._received.clear()
+
+    def reset_output_buffer(self) -> NoReturn:
+        pass
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        peer = self._peer
+
+        if peer is None:
+            raise ConnectionError('The loopback transport is not connected.')
+
+        with peer._condition:
+            peer._received += data
+
+            peer._condition.notify_all()
+
+        return len(data)
+
+class SerialTransport(Transport):
+    """
+    Represents a transport over a `pyserial` serial port.
+    """
+    _serial_port: Final[Serial]
+
+    def __init__(self, serial_port: Serial) -> NoReturn:
+        """
+        Initializes an instance using the provided serial port.
+
+        Parameters
+        ----------
+        serial_port : Serial
+            An open serial port instance.
+        """
+        self._serial_port = serial_port
+
+    @property
+    def byte_time(self) -> float:
+        serial_port = self._serial_port
+
+        bit_count = 1 + serial_port.bytesize + serial_port.stopbits
+
+        if serial_port.parity != PARITY_NONE:
+            bit_count += 1
+
+        return bit_count / serial_port.baudrate
+
+    @property
+    def in_waiting(self) -> int:
+        return self._serial_port.in_waiting
+
+    @property
+    def serial_port(self) -> Serial:
+        """
+        Gets the serial port instance.
+
+        Returns
+        -------
+        Serial
+            The serial port instance.
+        """
+        return self._serial_port
+
+    @property
+    def timeout(self) -> float | None:
+        return self._serial_port.timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._serial_port.timeout = value
+
+    def cancel_read(self) -> NoReturn:
+        """
+        Cancels a blocking read from another thread, where supported by the platform.
+        """
+        cancel_read = getattr(self._serial_port, 'cancel_read', None)
+
+        if cancel_read is not None:
+            cancel_read()
+
+    def close(self) -> NoReturn:
+        self._serial_port.close()
+
+    def fileno(self) -> int:
+        return self._serial_port.fileno()
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        data = self._serial_port.read(len(buffer))
+
+        count = len(data)
+
+        buffer[:count] = data
+
+        return count
+
+    def reset_input_buffer(self) -> NoReturn:
+        self._serial_port.reset_input_buffer()
+
+    def reset_output_buffer(self) -> NoReturn:
+        self._serial_port.reset_output_buffer()
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        return self._serial_port.write(data)
+
+class TcpTransport(Transport):
+    """
+    Represents a transport over a TCP connection, such as a ser2net or ESP8266 MSP bridge.
+    """
+    _socket: Final[socket.socket]
+
+    _timeout: float | None
+
+    def __init__(
+        self,
+        host:            str,
+        port:            int,
+        timeout:         float | None = None,
+        connect_timeout: float | None = None
+    ) -> NoReturn:
+        """
+        Initializes an instance by connecting to the given address.
+
+        Nagle's algorithm is disabled, as MSP messages are small and latency sensitive.
+
+        Parameters
+        ----------
+        host : str
+            The host name or address of the bridge.
+        port : int
+            The TCP port of the bridge.
+        timeout : float | None
+            The read timeout in seconds, or None to block until data is available.
+        connect_timeout : float | None
+            The time in seconds to wait for the connection to be established.
+        """
+        self._socket = socket.create_connection((host, port), connect_timeout)
+
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self._socket.settimeout(None)
+
+        self._timeout = timeout
+
+    @property
+    def byte_time(self) -> float:
+        return 0.0
+
+    @property
+    def in_waiting(self) -> int:
+        return _get_waiting_size(self._socket.fileno())
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._timeout = value
+
+    def close(self) -> NoReturn:
+        self._socket.close()
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        if not _wait_readable(self._socket.fileno(), self._timeout):
+            return 0
+
+        count = self._socket.recv_into(buffer)
+
+        if not count and len(buffer):
+            raise ConnectionError('The TCP connection was closed by the remote host.')
+
+        return count
+
+    def reset_input_buffer(self) -> NoReturn:
+        while _wait_readable(self._socket.fileno(), 0):
+            if not self._socket.recv(4096):
+                break
+
+    def reset_output_buffer(self) -> NoReturn:
+        pass
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        self._socket.sendall(data)
+
+        return len(data)
+
+class UdpTransport(Transport):
+    """
+    Represents a transport over UDP datagrams, such as a Wi-Fi MSP bridge.
+
+    Received datagrams are treated as a contiguous byte stream. Bytes of a datagram that do
+    not fit in the buffer of a read are returned by the next reads.
+    """
+    MAX_DATAGRAM_SIZE: Final[int] = 65535
+    """int: The maximum size of a received datagram."""
+
+    _datagram: Final[bytearray]
+
+    _remainder: memoryview
+
+    _socket: Final[socket.socket]
+
+    _timeout: float | None
+
+    def __init__(
+        self,
+        host:       str,
+        port:       int,
+        local_port: int          = 0,
+        timeout:    float | None = None
+    ) -> NoReturn:
+        """
+        Initializes an instance that exchanges datagrams with the given address.
+
+        Parameters
+        ----------
+        host : str
+            The host name or address of the bridge.
+        port : int
+            The UDP port of the bridge.
+        local_port : int
+            The local UDP port to bind to, or zero for an ephemeral port.
+        timeout : float | None
+            The read timeout in seconds, or None to block until data is available.
+        """
+        self._datagram = bytearray(self.MAX_DATAGRAM_SIZE)
+
+        self._remainder = memoryview(self._datagram)[:0]
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        self._socket.bind(('', local_port))
+
+        self._socket.connect((host, port))
+
+        self._timeout = timeout
+
+    @property
+    def byte_time(self) -> float:
+        return 0.0
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._remainder) + _get_waiting_size(self._socket.fileno())
+
+    @property
+    def local_address(self) -> tuple[str, int]:
+        """
+        Gets the local address the socket is bound to.
+
+        Returns
+        -------
+        tuple[str, int]
+            The local host address and port.
+        """
+        return self._socket.getsockname()
+
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float | None) -> NoReturn:
+        self._timeout = value
+
+    def close(self) -> NoReturn:
+        self._socket.close()
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        if not self._remainder:
+            if not _wait_readable(self._socket.fileno(), self._timeout):
+                return 0
+
+            try:
+                datagram_size = self._socket.recv_into(self._datagram)
+            except OSError as error:
+                if error.errno in (EAGAIN, EWOULDBLOCK):
+                    return 0
+
+                raise
+
+            self._remainder = memoryview(self._datagram)[:datagram_size]
+
+        count = min(len(buffer), len(self._remainder))
+
+        buffer[:count] = self._remainder[:count]
+
+        self._remainder = self._remainder[count:]
+
+        return count
+
+    def reset_input_buffer(self) -> NoReturn:
+        self._remainder = self._remainder[:0]
+
+        while _wait_readable(self._socket.fileno(), 0):
+            self._socket.recv_into(self._datagram)
+
+    def reset_output_buffer(self) -> NoReturn:
+        pass
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        return self._socket.send(data)
@@ -0,0 +1,296 @@
+from ._command  import _MspCommand
+from ._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+from .data._schema import _compile_field_function, _Field, _get_value_count
+
+from .messaging import _parse_response_message
+
+from re     import findall
+from struct import error as StructError, Struct
+from typing import Any, Final, NoReturn, Type
+
+_UNDECODED: Final[object] = object()
+"""object: The sentinel of field values that have not been decoded yet."""
+
+_VIEW_TYPE_CACHE: Final[dict[int, Type['MspResponseView'] | None]] = {}
+"""dict[int, Type[MspResponseView] | None]: The view types that have been created, mapped by
+command code. Commands that cannot be viewed are mapped to None."""
+
+class MspResponseView(object):
+    """
+    Represents a lightweight, read-only view over the payload of a response message.
+
+    A view exposes the same fields as the data structure type of its command, but decodes
+    and scales each field only when it is first read, after which the value is cached. Only
+    the data values of that field are unpacked, so reading a single field of a large response,
+    such as `voltage` of MSP_ANALOG or `fix` of MSP_RAW_GPS, costs a single `unpack_from`
+    call.
+
+    Instances are created by `create_response_view` or `MultiWii.get_data` with `lazy=True`,
+    using a subclass with one property per field for each command.
+    """
+    __slots__ = ('_command', '_payload', '_values')
+
+    _FIELDS: tuple[_Field, ...] = ()
+    """tuple[_Field, ...]: The schema fields of the data structure type."""
+
+    _command: Final[_MspCommand]
+
+    _payload: Final[bytes]
+
+    _values: Final[list]
+
+    def __init__(self, command: _MspCommand, payload: bytes) -> NoReturn:
+        """
+        Initializes an instance using the provided command and payload.
+
+        Parameters
+        ----------
+        command : _MspCommand
+            The command of the response message.
+        payload : bytes
+            The payload of the response message, including the data size and command code.
+
+        Raises
+        ------
+        struct.error
+            If the size of the payload data does not match the data structure format of the
+            command.
+        """
+        if len(payload) - 2 != command.data_size:
+            raise StructError(
+                f'Payload data of {len(payload) - 2} bytes does not match {command!r}.'
+            )
+
+        self._command = command
+
+        self._payload = payload
+
+        self._values = [_UNDECODED] * len(self._FIELDS)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compares the field values with those of another view or a data structure instance.
+
+        Parameters
+        ----------
+        other : Any
+            A view or an instance of the data structure type of the command.
+
+        Returns
+        -------
+        bool
+            True if all field values are equal, False otherwise.
+        """
+        if isinstance(other, MspResponseView):
+            return self._command is other._command and self._payload == other._payload
+
+        if type(other) is not self.data_structure_type:
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.field_names)
+
+    def __repr__(self) -> str:
+        """
+        Gets the string representation of the view, decoding all fields.
+
+        Returns
+        -------
+        str
+            The string representation.
+        """
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.field_names)
+
+        return f'{type(self).__name__}({fields})'
+
+    @property
+    def command(self) -> _MspCommand:
+        """
+        Gets the command of the response message.
+
+        Returns
+        -------
+        _MspCommand
+            The command.
+        """
+        return self._command
+
+    @property
+    def data_structure_type(self) -> Type:
+        """
+        Gets the data structure type of the command.
+
+        Returns
+        -------
+        Type
+            The data structure type, e.g. `MspAnalog`.
+        """
+        return _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP[self._command]
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """
+        Gets the names of the fields.
+
+        Returns
+        -------
+        tuple[str, ...]
+            The field names, in the order of the data values.
+        """
+        return tuple(field.name for field in self._FIELDS)
+
+    @property
+    def payload(self) -> bytes:
+        """
+        Gets the payload of the response message.
+
+        Returns
+        -------
+        bytes
+            The payload, including the data size and command code.
+        """
+        return self._payload
+
+    def materialize(self) -> Any:
+        """
+        Decodes all fields into a new instance of the data structure type.
+
+        Returns
+        -------
+        Any
+            An instance of the data structure type of the command, e.g. `MspAnalog`.
+        """
+        return self.data_structure_type(
+            **{name: getattr(self, name) for name in self.field_names}
+        )
+
+def _create_field_property(index: int, field: _Field, struct: Struct) -> property:
+    """
+    Creates the property of a view field that decodes and caches the field value.
+
+    Parameters
+    ----------
+    index : int
+        The index of the field.
+    field : _Field
+        The schema field.
+    struct : Struct
+        The compiled structure of the data values of the field, padded with the preceding
+        bytes of the payload.
+
+    Returns
+    -------
+    property
+        The property.
+    """
+    if field.scale is None and field.type is None and _get_value_count(field.format) == 1:
+        decode = None
+    else:
+        decode = _compile_field_function(field)
+
+    def get_value(view: MspResponseView) -> Any:
+        value = view._values[index]
+
+        if value is _UNDECODED:
+            if decode is None:
+                value = struct.unpack_from(view._payload)[0]
+            else:
+                value = decode(*struct.unpack_from(view._payload))
+
+            view._values[index] = value
+
+        return value
+
+    return property(get_value, doc=f'Gets the decoded `{field.name}` field value.')
+
+def _create_view_type(command: _MspCommand) -> Type[MspResponseView] | None:
+    """
+    Creates the view type of a command, with one property per field.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        The command.
+
+    Returns
+    -------
+    Type[MspResponseView] | None
+        The view type, or None if the command has no data values, a variable size or a data
+        structure type without a schema.
+    """
+    data_structure_type = _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP.get(command)
+
+    fields = getattr(data_structure_type, '_FIELDS', None)
+
+    if fields is None or command.data_struct is None or command.has_variable_size:
+        return None
+
+    value_chars = ''
+
+    for count, char in findall(r'(\d*)(\D)', command.data_struct_format.lstrip('<')):
+        value_chars += char * int(count or 1)
+
+    namespace = {'__slots__': (), '_FIELDS': fields}
+
+    start = 0
+
+    for index, field in enumerate(fields):
+        end = start + _get_value_count(field.format)
+
+        # The preceding bytes are skipped with pad bytes, so that the field is unpacked from
+        # the start of the payload without calculating its offset on every read.
+        struct = Struct(f'<{Struct("<" + value_chars[:start]).size + 2}x{value_chars[start:end]}')
+
+        namespace[field.name] = _create_field_property(index, field, struct)
+
+        start = end
+
+    return type(f'{data_structure_type.__name__}View', (MspResponseView,), namespace)
+
+def create_response_view(command: _MspCommand, payload: bytes) -> MspResponseView | Any:
+    """
+    Creates a lazy view over the payload of a response message.
+
+    Commands with a variable size, such as MSP_BOX or MSP_BOXNAMES, cannot be viewed and are
+    parsed eagerly into their data structure type instead.
+
+    Parameters
+    ----------
+    command : _MspCommand
+        The command of the response message.
+    payload : bytes
+        The payload of the response message, including the data size and command code.
+
+    Raises
+    ------
+    struct.error
+        If the size of the payload data does not match the data structure format of the
+        command.
+    ValueError
+        If the command code in the payload does not match the code of the command.
+
+    Returns
+    -------
+    MspResponseView | Any
+        A view with the fields of the data structure type, or an instance of the data structure
+        type for commands that cannot be viewed.
+    """
+    if payload[1] != command.code:
+        raise ValueError(
+            'Payload with an invalid command code detected. ({}, {})'.format(
+                command.code,
+                payload[1]
+            )
+        )
+
+    if command.code not in _VIEW_TYPE_CACHE:
+        _VIEW_TYPE_CACHE[command.code] = _create_view_type(command)
+
+    view_type = _VIEW_TYPE_CACHE[command.code]
+
+    if view_type is None:
+        data = _parse_response_message(command, payload).data
+
+        return _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP[command].parse(data)
+
+    return view_type(command, payload)
@@ -0,0 +1,212 @@
+from multiwii.aio import AsyncMultiWii
+
+from multiwii.commands import MSP_COMP_GPS, MSP_MOTOR_PINS, MSP_SET_HEAD
+
+from multiwii.data import MspCompGps, MspMotorPins
+
+from multiwii.messaging import (
+    _MspFrameDecoder,
+    MESSAGE_OUTGOING_HEADER,
+    MspMessageError,
+    MspMessageTimeoutError
+)
+
+from multiwii.sim import create_response_message
+
+from multiwii.transport import FdTransport
+
+from asyncio import gather, get_running_loop, run, sleep
+from serial  import Serial
+
+import os
+import pytest
+import socket
+
+RESPONSES = {
+    MSP_COMP_GPS.code:   b'\x0a\x00\x5a\x00\x01',
+    MSP_MOTOR_PINS.code: bytes(range(8))
+}
+
+class FakeFlightController:
+    def __init__(self, master_fd, error_codes=(), silent_codes=()):
+        self.master_fd = master_fd
+
+        self.error_codes = error_codes
+
+        self.silent_codes = silent_codes
+
+        self.requests = []
+
+        self.buffer = b''
+
+    def on_readable(self):
+        self.buffer += os.read(self.master_fd, 1024)
+
+        while len(self.buffer) >= 6:
+            assert self.buffer.startswith(MESSAGE_OUTGOING_HEADER)
+
+            size = self.buffer[3]
+            code = self.buffer[4]
+
+            self.requests.append(code)
+
+            self.buffer = self.buffer[6 + size:]
+
+            if code in self.silent_codes or code not in RESPONSES:
+                continue
+
+            if code in self.error_codes:
+                os.write(self.master_fd, create_response_message(code, b'', is_error=True))
+            else:
+                os.write(self.master_fd, create_response_message(code, RESPONSES[code]))
+
+@pytest.fixture
+def pty():
+    master_fd, slave_fd = os.openpty()
+
+    serial_port = Serial(os.ttyname(slave_fd), baudrate=115200, timeout=0)
+
+    yield master_fd, serial_port
+
+    serial_port.close()
+
+    os.close(slave_fd)
+    os.close(master_fd)
+
+def run_with_fc(pty, coroutine_function, **kwargs):
+    master_fd, serial_port = pty
+
+    fc = FakeFlightController(master_fd, **kwargs)
+
+    async def main():
+        get_running_loop().add_reader(master_fd, fc.on_readable)
+
+        try:
+            async with AsyncMultiWii(serial_port) as multiwii:
+                return await coroutine_function(multiwii)
+        finally:
+            get_running_loop().remove_reader(master_fd)
+
+    return fc, run(main())
+
+def test_init_with_invalid_serial_port():
+    with pytest.raises(TypeError):
+        AsyncMultiWii('invalid_serial_port')
+
+def test_get_data(pty):
+    _, data = run_with_fc(pty, lambda multiwii: multiwii.get_data(MSP_COMP_GPS))
+
+    assert data == MspCompGps(10, 90, 1)
+
+def test_get_data_concurrently(pty):
+    async def get_concurrently(multiwii):
+        return await gather(
+            multiwii.get_data(MSP_MOTOR_PINS),
+            multiwii.get_data(MSP_COMP_GPS),
+            multiwii.get_data(MSP_MOTOR_PINS)
+        )
+
+    _, data = run_with_fc(pty, get_concurrently)
+
+    assert data == [MspMotorPins(*range(8)), MspCompGps(10, 90, 1), MspMotorPins(*range(8))]
+
+def test_get_data_error_response(pty):
+    with pytest.raises(MspMessageError):
+        run_with_fc(
+            pty,
+            lambda multiwii: multiwii.get_data(MSP_COMP_GPS),
+            error_codes=(MSP_COMP_GPS.code,)
+        )
+
+def test_get_data_timeout(pty):
+    with pytest.raises(MspMessageTimeoutError):
+        run_with_fc(
+            pty,
+            lambda multiwii: multiwii.get_data(MSP_COMP_GPS, timeout=0.05),
+            silent_codes=(MSP_COMP_GPS.code,)
+        )
+
+def test_get_data_without_open():
+    master_fd, slave_fd = os.openpty()
+
+    try:
+        with Serial(os.ttyname(slave_fd)) as serial_port:
+            with pytest.raises(RuntimeError):
+                run(AsyncMultiWii(serial_port).get_data(MSP_COMP_GPS))
+    finally:
+        os.close(slave_fd)
+        os.close(master_fd)
+
+def test_connection_closed_by_fc():
+    client_socket, fc_socket = socket.socketpair()
+
+    async def main():
+        async with AsyncMultiWii(FdTransport(client_socket.fileno())) as multiwii:
+            task = get_running_loop().create_task(multiwii.get_data(MSP_COMP_GPS, timeout=1))
+
+            await sleep(0.01)
+
+            fc_socket.close()
+
+            with pytest.raises(MspMessageError):
+                await task
+
+            assert not multiwii.is_open
+
+    try:
+        run(main())
+    finally:
+        client_socket.close()
+
+def test_get_data_write_error(pty):
+    async def get_data(multiwii):
+        def write(message):
+            raise OSError('Write failed.')
+
+        multiwii._transport.write = write
+
+        with pytest.raises(OSError):
+            await multiwii.get_data(MSP_COMP_GPS)
+
+        return multiwii._pending_futures.get(MSP_COMP_GPS.code)
+
+    _, futures = run_with_fc(pty, get_data)
+
+    assert not futures
+
+def test_set_head(pty):
+    async def set_head(multiwii):
+        await multiwii.set_head(90)
+
+        # Give the event loop a chance to dispatch the request to the fake FC.
+        await multiwii.get_data(MSP_COMP_GPS)
+
+    fc, _ = run_with_fc(pty, set_head)
+
+    assert fc.requests == [MSP_SET_HEAD.code, MSP_COMP_GPS.code]
+
+@pytest.mark.parametrize("count", [5])
+def test_stream(pty, count):
+    async def collect(multiwii):
+        values = []
+
+        async for value in multiwii.stream(MSP_COMP_GPS, hz=200):
+            values.append(value)
+
+            if len(values) == count:
+                break
+
+        return values
+
+    _, values = run_with_fc(pty, collect)
+
+    assert values == [MspCompGps(10, 90, 1)] * count
+
+@pytest.mark.parametrize("hz, maxsize", [(0, 1), (10, 0)])
+def test_stream_invalid_arguments(pty, hz, maxsize):
+    async def iterate(multiwii):
+        async for _ in multiwii.stream(MSP_COMP_GPS, hz=hz, maxsize=maxsize):
+            pass
+
+    with pytest.raises(ValueError):
+        run_with_fc(pty, iterate)
@@ -0,0 +1,198 @@
+from multiwii._command  import _MspCommand
+from multiwii._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+from multiwii.commands import MSP_ATTITUDE, MSP_BOXNAMES, MSP_RAW_GPS, MSP_RAW_IMU, MSP_SERVO_CONF
+
+from multiwii.data import MspRawGps, MspRawImu
+
+from multiwii.messaging import _create_request_message, MspMessageError
+
+from multiwii.data._schema import _Flags, _get_value_count
+
+from multiwii.recorder import FrameRecorder
+
+from multiwii.sim import create_response_message
+
+from enum   import IntEnum
+
+from io     import BytesIO
+from random import Random
+from struct import pack
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from multiwii.bulk import decode_frames, decode_recording, get_data_dtype
+
+def create_response_frame(command, data):
+    return create_response_message(command.code, command.data_struct.pack(*data))
+
+def create_raw_gps_data(random):
+    return (
+        random.randint(0, 1),
+        random.randint(0, 20),
+        random.randint(0, 900000000),
+        random.randint(0, 1800000000),
+        random.randint(0, 5000),
+        random.randint(0, 3000),
+        random.randint(0, 3600)
+    )
+
+def test_get_data_dtype():
+    dtype = get_data_dtype(MSP_RAW_GPS)
+
+    assert dtype.itemsize == MSP_RAW_GPS.data_size
+    assert dtype.names == (
+        'fix',
+        'satellites',
+        'coordinates_latitude',
+        'coordinates_longitude',
+        'altitude',
+        'speed',
+        'ground_course'
+    )
+    assert dtype['coordinates_latitude'] == np.dtype('<u4')
+
+    assert get_data_dtype(MSP_SERVO_CONF).itemsize == MSP_SERVO_CONF.data_size
+
+def test_get_data_dtype_standard_sizes():
+    dtype = get_data_dtype(_MspCommand(150, 'lL:2:!'))
+
+    assert dtype.itemsize == 8
+    assert dtype['value_0'] == np.dtype('<i4')
+    assert dtype['value_1'] == np.dtype('<u4')
+
+@pytest.mark.parametrize("command, column_names", [
+    (MSP_BOXNAMES, None),
+    (MSP_ATTITUDE, ('pitch', 'roll'))
+])
+def test_get_data_dtype_invalid_command(command, column_names):
+    with pytest.raises(ValueError):
+        get_data_dtype(command, column_names)
+
+def test_decode_frames_matches_parse():
+    random = Random(7)
+
+    data = [create_raw_gps_data(random) for _ in range(100)]
+
+    columns = decode_frames(MSP_RAW_GPS, b''.join(create_response_frame(MSP_RAW_GPS, values) for values in data))
+
+    for index, values in enumerate(data):
+        expected = MspRawGps.parse(values)
+
+        assert columns['fix'][index] == expected.fix
+        assert columns['coordinates_latitude'][index] == expected.coordinates.latitude
+        assert columns['coordinates_longitude'][index] == expected.coordinates.longitude
+        assert columns['ground_course'][index] == expected.ground_course
+
+    assert columns['coordinates_latitude'].dtype == np.float64
+    assert columns['satellites'].flags.c_contiguous
+
+def create_random_data(command, data_structure_type, random):
+    values = list(command.data_struct.unpack(random.randbytes(command.data_size)))
+
+    index = 0
+
+    # Enumeration and flag fields only accept the values of their members.
+    for field in getattr(data_structure_type, '_FIELDS', ()):
+        if isinstance(field.type, _Flags):
+            values[index] = field.type.encode(
+                tuple(member for member in field.type._enum_type if random.random() < 0.5)
+            )
+        elif isinstance(field.type, type) and issubclass(field.type, IntEnum):
+            values[index] = int(random.choice(list(field.type)))
+
+        index += _get_value_count(field.format)
+
+    return tuple(values)
+
+def flatten_field_values(instance):
+    values = []
+
+    for field in type(instance)._FIELDS:
+        value = getattr(instance, field.name)
+
+        if isinstance(field.type, _Flags):
+            values.append(field.type.encode(value))
+        elif isinstance(value, IntEnum):
+            values.append(int(value))
+        elif isinstance(value, tuple):
+            for item in value:
+                values.extend(item if isinstance(item, tuple) else (item,))
+        else:
+            values.append(value)
+
+    return values
+
+@pytest.mark.parametrize("command, data_structure_type", [
+    (command, data_structure_type)
+    for command, data_structure_type in _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP.items()
+    if command.data_struct is not None and not command.has_variable_size
+])
+def test_decode_frames_scaled_matches_parse(command, data_structure_type):
+    random = Random(command.code)
+
+    data = [create_random_data(command, data_structure_type, random) for _ in range(10)]
+
+    columns = decode_frames(
+        command,
+        b''.join(create_response_frame(command, values) for values in data)
+    )
+
+    if not hasattr(data_structure_type, '_FIELDS'):
+        assert list(zip(*columns.values())) == data
+
+        return
+
+    for index, values in enumerate(data):
+        expected = flatten_field_values(data_structure_type.parse(values))
+
+        assert [column[index] for column in columns.values()] == expected
+
+def test_decode_frames_raw_values():
+    frames = create_response_frame(MSP_ATTITUDE, (-123, 45, 270)) * 3
+
+    columns = decode_frames(MSP_ATTITUDE, frames, scaled=False)
+
+    assert columns['pitch_angle'].tolist() == [-123] * 3
+    assert columns['pitch_angle'].dtype == np.int16
+
+    assert decode_frames(MSP_ATTITUDE, frames)['pitch_angle'].tolist() == [-12.3] * 3
+
+@pytest.mark.parametrize("corrupt", [
+    lambda frame: frame[:-1],
+    lambda frame: frame[:-1] + bytes((frame[-1] ^ 1,)),
+    lambda frame: b'$M!' + frame[3:],
+    lambda frame: frame[:4] + bytes((MSP_RAW_IMU.code,)) + frame[5:]
+])
+def test_decode_frames_invalid_frames(corrupt):
+    frame = create_response_frame(MSP_ATTITUDE, (1, 2, 3))
+
+    with pytest.raises(MspMessageError):
+        decode_frames(MSP_ATTITUDE, frame + corrupt(frame))
+
+def test_decode_recording():
+    file = BytesIO()
+
+    imu_data = [tuple(range(index, index + 9)) for index in range(5)]
+
+    with FrameRecorder(file) as recorder:
+        for values in imu_data:
+            recorder.record_sent(_create_request_message(MSP_RAW_IMU, ()))
+            recorder.record_received(create_response_frame(MSP_RAW_IMU, values))
+            recorder.record_received(create_response_frame(MSP_ATTITUDE, (1, 2, 3)))
+
+    file.seek(0)
+
+    columns = decode_recording(file, MSP_RAW_IMU)
+
+    assert len(columns['timestamp']) == 5
+    assert columns['timestamp'].dtype == np.int64
+    assert np.all(np.diff(columns['timestamp']) >= 0)
+
+    for index, values in enumerate(imu_data):
+        expected = MspRawImu.parse(values)
+
+        assert columns['gyroscope_y'][index] == expected.gyroscope.y
+        assert columns['magnetometer_z'][index] == expected.magnetometer.z
@@ -190,3 +190,42 @@ def test_constructor_no_format(data_format):
 
     assert command.data_field_count == 0
     assert command.data_size == 0
+
+@pytest.mark.parametrize("data_format, expected_data_size", [
+    ('B3I2HB:7:!', 18),
+    ('3HB:4:!', 7),
+    ('2B2I3H:7:!', 16)
+])
+def test_data_struct_has_no_padding(data_format, expected_data_size):
+    command = _MspCommand(150, data_format)
+
+    assert command.data_struct.size == expected_data_size
+    assert command.payload_struct.size == expected_data_size + 2
+
+def test_data_struct_is_little_endian():
+    command = _MspCommand(150, 'HI:2:!')
+
+    assert command.data_struct.pack(1, 2) == b'\x01\x00\x02\x00\x00\x00'
+
+@pytest.mark.parametrize("data_format, count, expected_size", [
+    ('H:1:?', 4, 8),
+    ('s:1:?', 12, 12),
+    ('HB:2:!', 4, 3)
+])
+def test_get_data_struct(data_format, count, expected_size):
+    command = _MspCommand(150, data_format)
+
+    data_struct = command.get_data_struct(count)
+
+    assert data_struct.size == expected_size
+    assert command.get_data_struct(count) is data_struct
+
+@pytest.mark.parametrize("data_format, expected_data_struct_field_count", [
+    (None, 0),
+    ('s:1:?', 1),
+    ('3HB:4:?', 4)
+])
+def test_data_struct_field_count_property(data_format, expected_data_struct_field_count):
+    command = _MspCommand(150, data_format)
+
+    assert command.data_struct_field_count == expected_data_struct_field_count
@@ -8,21 +8,32 @@ correct functionality for each component.
 """
 
 from multiwii.messaging import (
+    _MspFrameDecoder,
     _MspResponseMessage,
     _crc8_xor,
     _create_request_message,
     _decode_names,
     _parse_response_message,
+    _validate_checksums,
     MESSAGE_ERROR_HEADER,
     MESSAGE_INCOMING_HEADER,
     MESSAGE_OUTGOING_HEADER,
     MspMessageError
 )
 
+from multiwii.sim import create_response_message
+
 from multiwii import _MspCommand
 from struct   import error as StructError
 
+from functools     import reduce
+from operator      import xor
+from random        import Random
+from unittest.mock import MagicMock
+
+import os
 import pytest
+import sys
 
 @pytest.mark.parametrize("payload,expected_checksum", [
     (b'\x01\x02\x03\x04', 0x00),
@@ -144,6 +155,37 @@ def test_parse_response_message_invalid_format(command, payload):
     with pytest.raises(StructError):
         _parse_response_message(command, payload)
 
+@pytest.mark.parametrize("command,data,expected_message", [
+    (
+        _MspCommand(209, 'B3I2HB:7:!'),
+        (1, 2, 3, 4, 5, 6, 7),
+        b'$M>\x12\xd1\x01\x02\x00\x00\x00\x03\x00\x00\x00\x04\x00\x00\x00'
+        b'\x05\x00\x06\x00\x07\xc3'
+    ),
+    (_MspCommand(203, 'H:1:?'), (1, 2, 3), b'$M>\x06\xcb\x01\x00\x02\x00\x03\x00\xcd'),
+])
+def test_create_request_message_serializes_data(command, data, expected_message):
+    """
+    Test `_create_request_message` with little-endian data.
+
+    This test verifies that the data is packed without alignment padding and
+    that the size of variable-size data is the number of packed bytes.
+    """
+    assert _create_request_message(command, data) == expected_message
+
+def test_parse_response_message_variable_size():
+    """
+    Test `_parse_response_message` with variable-size data.
+
+    This test verifies that the data is unpacked as repetitions of the data
+    structure format of the command.
+    """
+    command = _MspCommand(116, 's:1:?')
+
+    response = _parse_response_message(command, b'\x09\x74ARM;ANGLE')
+
+    assert _decode_names(response.data) == ('ARM', 'ANGLE')
+
 def test_msp_message_error():
     """
     Test the `MspMessageError` exception.
@@ -198,3 +240,237 @@ def test_crc8_xor_checksum(data, expected_checksum):
     This test checks the checksum calculation using different data payloads.
     """
     assert _crc8_xor(data) == expected_checksum
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64])
+def test_frame_decoder_resumes_across_chunks(chunk_size):
+    """
+    Test `_MspFrameDecoder.feed` with frames split across chunks.
+
+    This test verifies that the decoder keeps partial frames between calls and
+    yields every frame once it is complete, regardless of the chunk size.
+    """
+    stream = (
+        create_response_message(108, b'\x01\x00\x02\x00\x03\x00') +
+        create_response_message(101, b'') +
+        create_response_message(105, bytes(range(16)))
+    )
+
+    decoder = _MspFrameDecoder()
+
+    frames = []
+
+    for index in range(0, len(stream), chunk_size):
+        frames += decoder.feed(stream[index:index + chunk_size])
+
+    assert [frame.code for frame in frames] == [108, 101, 105]
+    assert frames[0].payload == b'\x06\x6c\x01\x00\x02\x00\x03\x00'
+    assert frames[2].payload[2:] == bytes(range(16))
+    assert not any(frame.is_error for frame in frames)
+    assert decoder.buffered_size == 0
+
+def test_frame_decoder_error_frame():
+    """
+    Test `_MspFrameDecoder.feed` with an error frame.
+
+    This test verifies that frames sent with the error header are flagged.
+    """
+    frames = _MspFrameDecoder().feed(create_response_message(108, b'', is_error=True))
+
+    assert len(frames) == 1
+    assert frames[0].is_error
+
+@pytest.mark.parametrize("stream", [
+    b'$X<\x00\x6c\x6c',
+    b'$M<\x00\x6c\x00',
+])
+def test_frame_decoder_invalid_frame(stream):
+    """
+    Test `_MspFrameDecoder.feed` with an invalid preamble or checksum.
+
+    This test verifies that the invalid bytes are discarded and counted as a
+    resynchronization, and that the frame that follows them is decoded.
+    """
+    decoder = _MspFrameDecoder()
+
+    frames = decoder.feed(stream + create_response_message(101, b''))
+
+    assert [frame.code for frame in frames] == [101]
+    assert decoder.resync_count > 0
+    assert decoder.buffered_size == 0
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_frame_decoder_resyncs_in_noisy_stream(chunk_size):
+    """
+    Test `_MspFrameDecoder.feed` with noise between and inside frames.
+
+    This test verifies that only the damaged frame is lost, and that a
+    partial preamble at the end of a chunk is kept.
+    """
+    corrupted = bytearray(create_response_message(105, bytes(range(16))))
+
+    corrupted[8] ^= 0x01
+
+    stream = (
+        b'\x00\xff$' +
+        create_response_message(108, b'\x01\x00\x02\x00\x03\x00') +
+        b'M$M' +
+        bytes(corrupted) +
+        create_response_message(101, b'') +
+        b'$'
+    )
+
+    decoder = _MspFrameDecoder()
+
+    frames = []
+
+    for index in range(0, len(stream), chunk_size):
+        frames += decoder.feed(stream[index:index + chunk_size])
+
+    assert [frame.code for frame in frames] == [108, 101]
+    assert decoder.buffered_size == 1
+
+def test_frame_decoder_read_from_reuses_buffer():
+    """
+    Test `_MspFrameDecoder.read_from` with a transport.
+
+    This test verifies that bytes are read straight into the receive buffer
+    of the decoder and that the same buffer is reused for consecutive reads.
+    """
+    frame = create_response_message(107, b'\x0a\x00\x5a\x00\x01')
+
+    buffers = []
+
+    def read_into(buffer):
+        buffers.append(buffer.obj)
+
+        buffer[:len(frame)] = frame
+
+        return len(frame)
+
+    transport = MagicMock(in_waiting=len(frame), read_into=read_into)
+
+    decoder = _MspFrameDecoder()
+
+    for _ in range(3):
+        frames = decoder.read_from(transport)
+
+        assert [frame.payload for frame in frames] == [frame[3:-1]]
+
+    assert buffers[0] is buffers[1] is buffers[2]
+    assert decoder.buffered_size == 0
+
+def test_frame_decoder_grows_buffer():
+    """
+    Test `_MspFrameDecoder.feed` with more bytes than the initial buffer size.
+
+    This test verifies that the buffer grows and that a buffered partial
+    frame is kept when it does.
+    """
+    stream = b''.join(create_response_message(105, bytes(range(16))) for _ in range(4))
+
+    decoder = _MspFrameDecoder(buffer_size=8)
+
+    frames = decoder.feed(stream[:5]) + decoder.feed(stream[5:])
+
+    assert len(frames) == 4
+    assert all(frame.payload[2:] == bytes(range(16)) for frame in frames)
+
+def test_parse_response_message_unpacks_in_place():
+    """
+    Test `_parse_response_message` with a memoryview payload.
+
+    This test verifies that the data is unpacked at an offset of the payload
+    buffer without slicing it first.
+    """
+    payload = memoryview(b'\x05\x6b\x0a\x00\x5a\x00\x01')
+
+    response = _parse_response_message(_MspCommand(107, '2HB:3:!'), payload)
+
+    assert response.data == (10, 90, 1)
+    assert response.data_size == 5
+
+@pytest.mark.parametrize("size", [0, 1, 7, 31, 32, 33, 64, 255, 4096])
+def test_crc8_xor_matches_bytewise_xor(size):
+    """
+    Test `_crc8_xor` with empty, telemetry-sized and large payloads.
+
+    This test verifies that the checksum equals the XOR of all bytes for
+    every payload size.
+    """
+    payload = os.urandom(size)
+
+    assert _crc8_xor(payload) == reduce(xor, payload, 0)
+    assert _crc8_xor(memoryview(payload)) == reduce(xor, payload, 0)
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'fallback'])
+def uses_numpy(request, monkeypatch):
+    """
+    Run a test with and without NumPy, by hiding it from imports in the latter case.
+    """
+    if request.param:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    return request.param
+
+def test_validate_checksums(uses_numpy):
+    """
+    Test `_validate_checksums` with a buffer of recorded messages.
+
+    This test verifies that messages in both directions are validated, that
+    a corrupted message is reported and that a truncated message is ignored.
+    """
+    corrupted = bytearray(create_response_message(105, bytes(range(16))))
+
+    corrupted[-1] ^= 0xff
+
+    buffer = (
+        _create_request_message(_MspCommand(108), ()) +
+        create_response_message(108, b'\x01\x00\x02\x00\x03\x00') +
+        bytes(corrupted) +
+        create_response_message(101, is_error=True) +
+        create_response_message(107, b'\x0a\x00\x5a\x00\x01')[:-2]
+    )
+
+    assert _validate_checksums(buffer) == [True, True, False, True]
+
+def test_validate_checksums_invalid_preamble(uses_numpy):
+    """
+    Test `_validate_checksums` with an invalid message preamble.
+
+    This test verifies that an `MspMessageError` is raised.
+    """
+    with pytest.raises(MspMessageError):
+        _validate_checksums(b'$X<\x00\x6c\x6c')
+
+    with pytest.raises(MspMessageError, match='offset 6'):
+        _validate_checksums(create_response_message(101, b'') + b'$X<\x00\x6c\x6c')
+
+def test_validate_checksums_random_messages(uses_numpy):
+    """
+    Test `_validate_checksums` with many random messages.
+
+    This test verifies that every message with a flipped checksum, and only those, is
+    reported, regardless of whether NumPy is used.
+    """
+    random = Random(12)
+
+    buffer = b''
+
+    expected = []
+
+    for _ in range(500):
+        frame = bytearray(create_response_message(101, random.randbytes(random.randint(0, 64))))
+
+        is_valid = random.random() < 0.9
+
+        if not is_valid:
+            frame[-1] ^= 1
+
+        buffer += frame
+
+        expected.append(is_valid)
+
+    assert _validate_checksums(buffer) == expected
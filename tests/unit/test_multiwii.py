@@ -1,29 +1,60 @@
 from multiwii import MultiWii
 
-from multiwii.messaging import _MspResponseMessage, MspMessageError
+from multiwii._command import _MspCommand
+
+from multiwii._registry import _get_request_message, _get_request_messages
+
+from multiwii.messaging import (
+    _create_request_message,
+    _MspResponseMessage,
+    MspMessageError,
+    MspMessageTimeoutError
+)
 
 from multiwii.commands import (
     MSP_ACC_CALIBRATION,
     MSP_ALTITUDE,
     MSP_BIND,
+    MSP_COMP_GPS,
     MSP_EEPROM_WRITE,
+    MSP_MOTOR_PINS,
+    MSP_RC_TUNING,
     MSP_SELECT_SETTING,
     MSP_SET_BOX,
     MSP_SET_HEAD,
-    MSP_SET_PID
+    MSP_SET_PID,
+    MSP_SET_RAW_RC
+)
+
+from multiwii.data import (
+    MspAltitude,
+    MspAttitude,
+    MspCompGps,
+    MspMotorPins,
+    MspRc,
+    MspRcTuning
 )
 
-from multiwii.data import MspAltitude, MspRc
+from multiwii.sim import create_response_message
 
-from serial        import Serial
-from time          import sleep
-from unittest.mock import MagicMock
+from multiwii.views import MspResponseView
 
+from concurrent.futures import ThreadPoolExecutor
+from serial             import Serial
+from threading          import Thread
+from time               import perf_counter, sleep
+from unittest.mock      import MagicMock
+
+import os
 import pytest
 
 @pytest.fixture
 def mock_serial():
-    return MagicMock(spec=Serial)
+    mock_serial = MagicMock(spec=Serial)
+
+    mock_serial.in_waiting = 0
+
+    return mock_serial
 
 @pytest.fixture
 def multiwii(mock_serial):
@@ -64,23 +95,103 @@ def test_set_message_write_read_delay_negative_value(multiwii, negative_delay):
     with pytest.raises(ValueError):
         multiwii.message_write_read_delay = negative_delay
 
+@pytest.mark.parametrize("valid_timeout", [0.25])
+def test_set_response_timeout_valid(multiwii, valid_timeout):
+    multiwii.response_timeout = valid_timeout
+
+    assert multiwii.response_timeout == valid_timeout
+
+@pytest.mark.parametrize("invalid_timeout", [0.0, -1.0])
+def test_set_response_timeout_invalid_value(multiwii, invalid_timeout):
+    with pytest.raises(ValueError):
+        multiwii.response_timeout = invalid_timeout
+
+def test_read_response_message_returns_without_delay(multiwii, mock_serial):
+    frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    mock_serial.read.side_effect = [frame[:4], frame[4:]]
+
+    message = multiwii._read_response_message(MSP_COMP_GPS)
+
+    assert message.data == (10, 90, 1)
+
+    # The second read must request exactly the bytes still missing from the frame.
+    mock_serial.read.assert_called_with(len(frame) - 4)
+
+def test_set_uses_persistent_stream(multiwii, mock_serial):
+    multiwii.uses_persistent_stream = True
+
+    assert multiwii.uses_persistent_stream
+
+    mock_serial.reset_input_buffer.assert_called_once()
+
+@pytest.mark.parametrize("invalid_value", [1, None, 'yes'])
+def test_set_uses_persistent_stream_invalid_type(multiwii, invalid_value):
+    with pytest.raises(TypeError):
+        multiwii.uses_persistent_stream = invalid_value
+
+def test_persistent_stream_does_not_reset_buffers(multiwii, mock_serial):
+    multiwii.uses_persistent_stream = True
+
+    mock_serial.reset_input_buffer.reset_mock()
+
+    first_frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    second_frame = create_response_message(MSP_RC_TUNING.code, bytes(range(7)))
+
+    mock_serial.in_waiting = len(first_frame) + 4
+
+    mock_serial.read.side_effect = [first_frame + second_frame[:4], second_frame[4:]]
+
+    assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+
+    # The start of the second frame was received along with the first and is kept.
+    mock_serial.in_waiting = 0
+
+    assert multiwii.get_data(MSP_RC_TUNING) == MspRcTuning(*range(7))
+
+    mock_serial.reset_input_buffer.assert_not_called()
+    mock_serial.reset_output_buffer.assert_not_called()
+
+@pytest.mark.parametrize("timeout", [0.01])
+def test_get_data_timeout(multiwii, mock_serial, timeout):
+    mock_serial.read.return_value = b''
+
+    with pytest.raises(MspMessageTimeoutError):
+        multiwii.get_data(MSP_COMP_GPS, timeout=timeout)
+
 def test_read_response_message_invalid_header(multiwii, mock_serial):
     mock_serial.read.return_value = b'123'
 
     with pytest.raises(MspMessageError):
-        multiwii._read_response_message(MSP_ALTITUDE)
+        multiwii._read_response_message(MSP_ALTITUDE, timeout=0.05)
 
 def test_read_response_message_invalid_command_code(multiwii, mock_serial):
     mock_serial.read.return_value = b'\x01\x01\x01'
 
     with pytest.raises(MspMessageError):
-        multiwii._read_response_message(MSP_ALTITUDE)
+        multiwii._read_response_message(MSP_ALTITUDE, timeout=0.05)
 
 def test_read_response_message_invalid_checksum(multiwii, mock_serial):
     mock_serial.read.return_value = b'\x01\x01\x01\x02'
 
     with pytest.raises(MspMessageError):
-        multiwii._read_response_message(MSP_ALTITUDE)
+        multiwii._read_response_message(MSP_ALTITUDE, timeout=0.05)
+
+@pytest.mark.parametrize("corrupt_bytes", [
+    b'\x01\x01\x01',
+    b'$M<\x05\x6b\x0a\x00\x5a\x00\x01\x00',
+    b'$M>\x00\x6b\x6b$'
+])
+def test_read_response_message_resyncs_after_corrupt_bytes(multiwii, mock_serial, corrupt_bytes):
+    stream = corrupt_bytes + create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    mock_serial.in_waiting = len(stream)
+
+    mock_serial.read.side_effect = [stream]
+
+    assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+    assert multiwii.resync_count > 0
 
 def test_get_data_valid(multiwii, mock_serial):
     response_message = _MspResponseMessage(
@@ -205,3 +316,294 @@ def test_set_pid_values(multiwii, mock_serial):
         MSP_SET_PID,
         ('serializable_data',)
     )
+
+def test_get_many_matches_responses_by_command_code(multiwii, mock_serial):
+    stream = (
+        create_response_message(MSP_RC_TUNING.code, bytes(range(7))) +
+        create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01') +
+        create_response_message(MSP_MOTOR_PINS.code, bytes(range(8)))
+    )
+
+    mock_serial.in_waiting = len(stream)
+
+    mock_serial.read.side_effect = [stream[:10], stream[10:]]
+
+    results = multiwii.get_many([MSP_COMP_GPS, MSP_MOTOR_PINS, MSP_RC_TUNING])
+
+    mock_serial.write.assert_called_once()
+
+    assert results == (
+        MspCompGps(10, 90, 1),
+        MspMotorPins(*range(8)),
+        MspRcTuning(*range(7))
+    )
+
+def test_get_many_ignores_unrequested_responses(multiwii, mock_serial):
+    mock_serial.read.return_value = (
+        create_response_message(MSP_MOTOR_PINS.code, bytes(range(8))) +
+        create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+    )
+
+    mock_serial.in_waiting = len(mock_serial.read.return_value)
+
+    assert multiwii.get_many([MSP_COMP_GPS]) == (MspCompGps(10, 90, 1),)
+
+def test_get_many_error_response(multiwii, mock_serial):
+    mock_serial.read.return_value = create_response_message(MSP_COMP_GPS.code, is_error=True)
+
+    with pytest.raises(MspMessageError):
+        multiwii.get_many([MSP_COMP_GPS])
+
+@pytest.fixture
+def pty_multiwii():
+    master_fd, slave_fd = os.openpty()
+
+    serial_port = Serial(os.ttyname(slave_fd), baudrate=115200, timeout=0.1)
+
+    responses = {
+        MSP_COMP_GPS.code:   b'\x0a\x00\x5a\x00\x01',
+        MSP_RC_TUNING.code:  bytes(range(7))
+    }
+
+    def respond():
+        buffer = b''
+
+        while True:
+            try:
+                buffer += os.read(master_fd, 1024)
+            except OSError:
+                return
+
+            while len(buffer) >= 6:
+                code = buffer[4]
+
+                buffer = buffer[6 + buffer[3]:]
+
+                if code in responses:
+                    os.write(master_fd, create_response_message(code, responses[code]))
+
+    Thread(target=respond, daemon=True).start()
+
+    multiwii = MultiWii(serial_port)
+
+    multiwii.start_background_reader()
+
+    yield multiwii
+
+    multiwii.stop_background_reader()
+
+    serial_port.close()
+
+    os.close(slave_fd)
+    os.close(master_fd)
+
+def test_background_reader_concurrent_get_data(pty_multiwii):
+    assert pty_multiwii.uses_background_reader
+
+    commands = [MSP_COMP_GPS, MSP_RC_TUNING] * 50
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(pty_multiwii.get_data, commands))
+
+    for command, result in zip(commands, results):
+        if command is MSP_COMP_GPS:
+            assert result == MspCompGps(10, 90, 1)
+        else:
+            assert result == MspRcTuning(*range(7))
+
+def test_background_reader_get_many(pty_multiwii):
+    assert pty_multiwii.get_many([MSP_RC_TUNING, MSP_COMP_GPS]) == (
+        MspRcTuning(*range(7)),
+        MspCompGps(10, 90, 1)
+    )
+
+def test_background_reader_timeout(pty_multiwii):
+    with pytest.raises(MspMessageTimeoutError):
+        pty_multiwii.get_data(MSP_MOTOR_PINS, timeout=0.05)
+
+def test_background_reader_transport_closed():
+    master_fd, slave_fd = os.openpty()
+
+    serial_port = Serial(os.ttyname(slave_fd), baudrate=115200, timeout=0.1)
+
+    multiwii = MultiWii(serial_port)
+
+    multiwii.start_background_reader()
+
+    reader_thread = multiwii._reader_thread
+
+    try:
+        # Closing the master side makes reads from the slave side fail with EIO.
+        os.close(master_fd)
+
+        reader_thread.join(1)
+
+        assert not multiwii.uses_background_reader
+
+        start_time = perf_counter()
+
+        with pytest.raises(OSError):
+            multiwii.get_data(MSP_COMP_GPS)
+
+        assert perf_counter() - start_time < multiwii.response_timeout / 2
+    finally:
+        multiwii.stop_background_reader()
+
+        serial_port.close()
+
+        os.close(slave_fd)
+
+def test_stop_background_reader(pty_multiwii):
+    pty_multiwii.stop_background_reader()
+
+    assert not pty_multiwii.uses_background_reader
+
+@pytest.fixture
+def coalescing_multiwii(multiwii):
+    multiwii.start_write_coalescing(batch_size=1024, max_delay=60.0)
+
+    yield multiwii
+
+    multiwii.stop_write_coalescing()
+
+def test_write_coalescing_queues_until_response_is_awaited(coalescing_multiwii, mock_serial):
+    assert coalescing_multiwii.uses_write_coalescing
+
+    coalescing_multiwii.set_head(90)
+    coalescing_multiwii.set_raw_rc(MspRc(1500, 1500, 1500, 1000, 1000, 1000, 1000, 1000))
+
+    mock_serial.write.assert_not_called()
+
+    frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    mock_serial.in_waiting = len(frame)
+
+    mock_serial.read.side_effect = [frame]
+
+    assert coalescing_multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+
+    mock_serial.write.assert_called_once_with(
+        _create_request_message(MSP_SET_HEAD, (90,)) +
+        _create_request_message(MSP_SET_RAW_RC, (1500, 1500, 1500, 1000, 1000, 1000, 1000, 1000)) +
+        _get_request_message(MSP_COMP_GPS)
+    )
+
+    mock_serial.reset_output_buffer.assert_not_called()
+
+def test_write_coalescing_flush_writes(coalescing_multiwii, mock_serial):
+    coalescing_multiwii.set_head(90)
+    coalescing_multiwii.set_head(180)
+
+    coalescing_multiwii.flush_writes()
+
+    mock_serial.write.assert_called_once_with(
+        _create_request_message(MSP_SET_HEAD, (90,)) +
+        _create_request_message(MSP_SET_HEAD, (180,))
+    )
+
+def test_write_coalescing_batch_size(multiwii, mock_serial):
+    multiwii.start_write_coalescing(batch_size=16, max_delay=60.0)
+
+    try:
+        for value in range(3):
+            multiwii.set_head(value)
+
+        # Each MSP_SET_HEAD message is 8 bytes, so the first two are written together.
+        mock_serial.write.assert_called_once()
+    finally:
+        multiwii.stop_write_coalescing()
+
+    assert mock_serial.write.call_count == 2
+    assert not multiwii.uses_write_coalescing
+
+def test_write_coalescing_max_delay(multiwii, mock_serial):
+    multiwii.start_write_coalescing(max_delay=0.01)
+
+    try:
+        multiwii.set_head(90)
+
+        for _ in range(100):
+            if mock_serial.write.called:
+                break
+
+            sleep(0.01)
+
+        mock_serial.write.assert_called_once_with(_create_request_message(MSP_SET_HEAD, (90,)))
+    finally:
+        multiwii.stop_write_coalescing()
+
+@pytest.mark.parametrize("batch_size, max_delay", [(0, 0.01), (16, -1.0)])
+def test_start_write_coalescing_invalid_value(multiwii, batch_size, max_delay):
+    with pytest.raises(ValueError):
+        multiwii.start_write_coalescing(batch_size, max_delay)
+
+@pytest.mark.parametrize("command", [MSP_ALTITUDE, MSP_COMP_GPS, _MspCommand(150, 'B:1:!')])
+def test_get_request_message_is_cached(command):
+    message = _get_request_message(command)
+
+    assert message == _create_request_message(command, ())
+    assert _get_request_message(command) is message
+
+def test_send_request_message_writes_cached_message(multiwii, mock_serial):
+    multiwii._send_request_message(MSP_ALTITUDE)
+
+    mock_serial.write.assert_called_once_with(_get_request_message(MSP_ALTITUDE))
+
+    assert mock_serial.write.call_args.args[0] is _get_request_message(MSP_ALTITUDE)
+
+def test_get_many_writes_cached_request_messages(multiwii, mock_serial):
+    commands = [MSP_COMP_GPS, MSP_MOTOR_PINS]
+
+    mock_serial.read.return_value = b''
+
+    for _ in range(2):
+        with pytest.raises(MspMessageTimeoutError):
+            multiwii.get_many(commands, timeout=0.01)
+
+    first_write, second_write = (call.args[0] for call in mock_serial.write.call_args_list)
+
+    assert first_write == _get_request_message(MSP_COMP_GPS) + _get_request_message(MSP_MOTOR_PINS)
+    assert first_write is second_write is _get_request_messages(tuple(commands))
+
+def test_get_data_lazy(multiwii, mock_serial):
+    frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    mock_serial.read.side_effect = [frame[:4], frame[4:]]
+
+    data = multiwii.get_data(MSP_COMP_GPS, lazy=True)
+
+    assert isinstance(data, MspResponseView)
+
+    assert data.direction_to_home == 90
+
+    assert data.materialize() == MspCompGps(10, 90, 1)
+
+def test_get_data_out(multiwii, mock_serial):
+    frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    mock_serial.read.side_effect = [frame[:4], frame[4:]]
+
+    out = MspCompGps(0, 0, 0)
+
+    data = multiwii.get_data(MSP_COMP_GPS, out=out)
+
+    assert data is out
+
+    assert data == MspCompGps(10, 90, 1)
+
+def test_get_data_out_invalid_type(multiwii):
+    with pytest.raises(TypeError):
+        multiwii.get_data(MSP_COMP_GPS, out=MspAttitude(0, 0, 0))
+
+def test_get_data_out_lazy(multiwii):
+    with pytest.raises(ValueError):
+        multiwii.get_data(MSP_COMP_GPS, lazy=True, out=MspCompGps(0, 0, 0))
+
+def test_send_message_keeps_output_buffer(multiwii, mock_serial):
+    message = _create_request_message(MSP_SET_RAW_RC, (1500,) * 8)
+
+    multiwii.send_message(message)
+
+    mock_serial.write.assert_called_once_with(message)
+
+    mock_serial.reset_output_buffer.assert_not_called()
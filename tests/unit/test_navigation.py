@@ -39,7 +39,7 @@ def test_msp_comp_gps_parse_invalid_data(data):
     [
         (
             (1, 6, 123456789, 987654321, 100, 150, 270),
-            (1, 6, 12.3456789, 98.7654321, 100, [5], 27.0)
+            (1, 6, 12.3456789, 98.7654321, 100, 150, 27.0)
         ),
     ]
 )
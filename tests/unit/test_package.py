@@ -0,0 +1,86 @@
+from multiwii import commands, data
+
+from pathlib    import Path
+from subprocess import run
+
+import multiwii
+import os
+import pytest
+import sys
+
+def run_python(source):
+    env = dict(os.environ)
+
+    env['PYTHONPATH'] = os.pathsep.join(
+        (str(Path(multiwii.__file__).parents[1]), env.get('PYTHONPATH', ''))
+    )
+
+    return run(
+        (sys.executable, '-c', source),
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True
+    )
+
+@pytest.mark.parametrize("statement, excluded_modules", [
+    (
+        'import multiwii',
+        ('asyncio', 'multiwii.commands', 'multiwii.data', 'serial', 'typing')
+    ),
+    (
+        'from multiwii import MultiWii',
+        (
+            'asyncio',
+            'concurrent.futures',
+            'multiwii._reader',
+            'multiwii._registry',
+            'multiwii.data',
+            'multiwii.transport',
+            'serial',
+            'socket'
+        )
+    ),
+    (
+        'from multiwii import MSP_ATTITUDE, MspAttitude',
+        ('multiwii.data.box', 'multiwii.data.info', 'serial')
+    )
+])
+def test_import_does_not_import_modules(statement, excluded_modules):
+    result = run_python(f'{statement}; import sys; print(*sorted(sys.modules))')
+
+    modules = result.stdout.split()
+
+    assert 'multiwii' in modules
+
+    for name in excluded_modules:
+        assert name not in modules
+
+def test_lazy_attributes():
+    assert multiwii.MSP_ATTITUDE is commands.MSP_ATTITUDE
+
+    assert multiwii.MspAttitude is data.MspAttitude
+
+    assert multiwii.MultiWii.__name__ == 'MultiWii'
+
+@pytest.mark.parametrize("name", multiwii.__all__)
+def test_all_attributes(name):
+    assert getattr(multiwii, name) is not None
+
+def test_submodule_attributes():
+    assert multiwii.commands is commands
+
+    assert multiwii.data is data
+
+def test_invalid_attribute():
+    with pytest.raises(AttributeError):
+        multiwii.MSP_INVALID
+
+def test_dir():
+    names = dir(multiwii)
+
+    assert 'MultiWii' in names
+
+    assert 'MSP_ATTITUDE' in names
+
+    assert 'commands' in names
@@ -0,0 +1,147 @@
+from multiwii import MultiWii
+
+from multiwii.commands import MSP_COMP_GPS, MSP_SET_HEAD
+
+from multiwii.data import MspCompGps
+
+from multiwii.messaging import _create_request_message
+
+from multiwii.recorder import (
+    DIRECTION_RECEIVED,
+    DIRECTION_SENT,
+    FrameRecorder,
+    read_records
+)
+
+from multiwii.sim import create_response_message
+
+from multiwii.transport import LoopbackTransport
+
+from io        import BytesIO
+from threading import Thread
+
+import pytest
+
+def test_recorder_round_trip(tmp_path):
+    path = tmp_path / 'flight.msprec'
+
+    frames = [b'$M>\x00\x6a\x6a', b'$M<\x01\x6a\x05\x6e']
+
+    with FrameRecorder(path) as recorder:
+        recorder.record_sent(frames[0])
+        recorder.record_received(memoryview(frames[1]))
+
+    assert recorder.is_closed
+    assert recorder.record_count == 2
+
+    records = list(read_records(path))
+
+    assert [(record.direction, record.frame) for record in records] == [
+        (DIRECTION_SENT, frames[0]),
+        (DIRECTION_RECEIVED, frames[1])
+    ]
+    assert records[0].timestamp <= records[1].timestamp
+
+def test_recorder_appends_to_existing_file(tmp_path):
+    path = tmp_path / 'flight.msprec'
+
+    for _ in range(2):
+        with FrameRecorder(path) as recorder:
+            recorder.record_sent(b'$M>\x00\x6a\x6a')
+
+    assert len(list(read_records(path))) == 2
+
+def test_recorder_counts_concurrent_records():
+    file = BytesIO()
+
+    message = _create_request_message(MSP_SET_HEAD, (90,)) * 2
+
+    frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    with FrameRecorder(file) as recorder:
+        def record_sent():
+            for _ in range(1000):
+                recorder.record_sent(message)
+
+        def record_received():
+            for _ in range(1000):
+                recorder.record_received(frame)
+
+        threads = [Thread(target=target) for target in (record_sent, record_received) * 2]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    assert recorder.record_count == 6000
+
+    file.seek(0)
+
+    assert len(list(read_records(file))) == 6000
+
+def test_recorder_splits_sent_messages():
+    file = BytesIO()
+
+    message = _create_request_message(MSP_SET_HEAD, (90,)) + _create_request_message(MSP_COMP_GPS, ())
+
+    recorder = FrameRecorder(file)
+
+    recorder.record_sent(message)
+
+    recorder.close()
+
+    file.seek(0)
+
+    frames = [record.frame for record in read_records(file)]
+
+    assert frames == [message[:8], message[8:]]
+
+def test_read_records_ignores_truncated_record(tmp_path):
+    path = tmp_path / 'flight.msprec'
+
+    with FrameRecorder(path) as recorder:
+        recorder.record_sent(b'$M>\x00\x6a\x6a')
+
+    with open(path, 'ab') as file:
+        file.write(b'\x01\x02\x03')
+
+    records = list(read_records(path))
+
+    assert len(records) == 1
+    assert records[0].frame == b'$M>\x00\x6a\x6a'
+
+@pytest.mark.parametrize("content", [b'', b'MSP', b'NOTREC\x01\x00', b'MSPREC\x02\x00'])
+def test_read_records_invalid_file(content):
+    with pytest.raises(ValueError):
+        list(read_records(BytesIO(content)))
+
+def test_multiwii_records_sent_and_received_frames():
+    host_transport, fc_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    response_frame = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+    file = BytesIO()
+
+    multiwii = MultiWii(host_transport)
+
+    multiwii.uses_persistent_stream = True
+
+    fc_transport.write(response_frame)
+
+    with FrameRecorder(file) as recorder:
+        multiwii.recorder = recorder
+
+        assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+
+        multiwii.recorder = None
+
+        multiwii.set_head(90)
+
+    file.seek(0)
+
+    assert [(record.direction, record.frame) for record in read_records(file)] == [
+        (DIRECTION_SENT, _create_request_message(MSP_COMP_GPS, ())),
+        (DIRECTION_RECEIVED, response_frame)
+    ]
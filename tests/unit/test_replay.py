@@ -0,0 +1,133 @@
+from multiwii import MultiWii
+
+from multiwii.commands import MSP_COMP_GPS, MSP_RC_TUNING, MSP_SET_HEAD
+
+from multiwii.data import MspCompGps, MspRcTuning
+
+from multiwii.messaging import MESSAGE_INCOMING_HEADER
+
+from multiwii.recorder import (
+    _FILE_HEADER_STRUCT,
+    _RECORD_HEADER_STRUCT,
+    DIRECTION_RECEIVED,
+    DIRECTION_SENT,
+    RECORD_FILE_MAGIC,
+    RECORD_FILE_VERSION
+)
+
+from multiwii.replay import ReplayedMessage, ReplayTransport, replay_messages
+
+from multiwii.sim import create_response_message
+
+from io   import BytesIO
+from time import perf_counter
+
+import pytest
+
+COMP_GPS_FRAME = MESSAGE_INCOMING_HEADER + b'\x05\x6a\x0a\x00\x5a\x00\x01\x3a'
+
+def create_recording(*records):
+    content = _FILE_HEADER_STRUCT.pack(RECORD_FILE_MAGIC, RECORD_FILE_VERSION)
+
+    for timestamp, direction, frame in records:
+        content += _RECORD_HEADER_STRUCT.pack(timestamp, direction, len(frame)) + frame
+
+    return BytesIO(content)
+
+@pytest.fixture
+def recording():
+    return create_recording(
+        (1_000_000, DIRECTION_SENT, b'$M>\x00\x6a\x6a'),
+        (
+            2_000_000,
+            DIRECTION_RECEIVED,
+            create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+        ),
+        (3_000_000, DIRECTION_RECEIVED, create_response_message(MSP_SET_HEAD.code)),
+        (
+            4_000_000,
+            DIRECTION_RECEIVED,
+            create_response_message(MSP_RC_TUNING.code, bytes(range(7)))
+        )
+    )
+
+def test_replay_messages(recording):
+    assert list(replay_messages(recording)) == [
+        ReplayedMessage(2_000_000, MSP_COMP_GPS, MspCompGps(10, 90, 1)),
+        ReplayedMessage(4_000_000, MSP_RC_TUNING, MspRcTuning(*range(7)))
+    ]
+
+def test_replay_messages_speed():
+    recording = create_recording(*(
+        (
+            index * 50_000_000,
+            DIRECTION_RECEIVED,
+            create_response_message(MSP_RC_TUNING.code, bytes(7))
+        )
+        for index in range(3)
+    ))
+
+    start_time = perf_counter()
+
+    assert len(list(replay_messages(recording, speed=5.0))) == 3
+
+    # The last frame was recorded 100 ms after the first, which is 20 ms at five times speed.
+    assert 0.019 <= perf_counter() - start_time < 0.1
+
+@pytest.mark.parametrize("speed", [0.0, -1.0])
+def test_replay_invalid_speed(recording, speed):
+    with pytest.raises(ValueError):
+        ReplayTransport(recording, speed)
+
+    with pytest.raises(ValueError):
+        list(replay_messages(recording, speed))
+
+def test_replay_transport_with_multiwii(recording):
+    transport = ReplayTransport(recording)
+
+    multiwii = MultiWii(transport)
+
+    multiwii.uses_persistent_stream = True
+
+    assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+    assert multiwii.get_data(MSP_RC_TUNING) == MspRcTuning(*range(7))
+    assert transport.is_finished
+
+def test_replay_transport_waits_for_recorded_time():
+    recording = create_recording(
+        (0, DIRECTION_RECEIVED, COMP_GPS_FRAME),
+        (30_000_000, DIRECTION_RECEIVED, COMP_GPS_FRAME)
+    )
+
+    transport = ReplayTransport(recording, speed=1.0, timeout=0.005)
+
+    buffer = bytearray(64)
+
+    assert transport.read_into(buffer) == len(COMP_GPS_FRAME)
+
+    # The second frame is due 30 ms after the first, so a read with a 5 ms timeout is empty.
+    assert transport.read_into(buffer) == 0
+    assert transport.in_waiting == 0
+
+    transport.timeout = None
+
+    assert transport.read_into(buffer) == len(COMP_GPS_FRAME)
+    assert transport.is_finished
+
+    with pytest.raises(EOFError):
+        transport.read_into(buffer)
+
+def test_replay_transport_finished_with_multiwii(recording):
+    multiwii = MultiWii(ReplayTransport(recording))
+
+    multiwii.uses_persistent_stream = True
+
+    multiwii.get_data(MSP_COMP_GPS)
+    multiwii.get_data(MSP_RC_TUNING)
+
+    start_time = perf_counter()
+
+    with pytest.raises(EOFError):
+        multiwii.get_data(MSP_COMP_GPS)
+
+    assert perf_counter() - start_time < multiwii.response_timeout
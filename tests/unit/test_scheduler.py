@@ -0,0 +1,107 @@
+from multiwii.commands import MSP_ATTITUDE, MSP_BOXNAMES, MSP_RAW_GPS, MSP_STATUS
+
+from multiwii.messaging import MESSAGE_OVERHEAD_SIZE, MspMessageTimeoutError
+
+from multiwii.scheduler import TelemetryScheduler
+
+from unittest.mock import MagicMock
+
+import pytest
+
+@pytest.fixture
+def multiwii():
+    multiwii = MagicMock()
+
+    multiwii.get_many.side_effect = lambda commands: tuple(command.code for command in commands)
+
+    return multiwii
+
+@pytest.mark.parametrize("plan", [{}, {MSP_ATTITUDE: 0}, {MSP_ATTITUDE: -1.0}])
+def test_invalid_plan(multiwii, plan):
+    with pytest.raises(ValueError):
+        TelemetryScheduler(multiwii, plan)
+
+@pytest.mark.parametrize("baudrate, expected_byte_budget", [(115200, 10368.0), (9600, 864.0)])
+def test_byte_budget(multiwii, baudrate, expected_byte_budget):
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 50}, baudrate=baudrate)
+
+    assert scheduler.byte_budget == pytest.approx(expected_byte_budget)
+
+def test_planned_byte_rate(multiwii):
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 50, MSP_STATUS: 2})
+
+    assert scheduler.planned_byte_rate == pytest.approx(
+        50 * (MESSAGE_OVERHEAD_SIZE + MSP_ATTITUDE.data_size) +
+        2 * (MESSAGE_OVERHEAD_SIZE + MSP_STATUS.data_size)
+    )
+
+def test_variable_size_command_requires_data_size(multiwii):
+    with pytest.raises(ValueError):
+        TelemetryScheduler(multiwii, {MSP_BOXNAMES: 1})
+
+    with pytest.raises(ValueError):
+        TelemetryScheduler(multiwii, {MSP_BOXNAMES: 1}, data_sizes={MSP_BOXNAMES: -1})
+
+def test_planned_byte_rate_with_data_sizes(multiwii):
+    scheduler = TelemetryScheduler(
+        multiwii,
+        {MSP_ATTITUDE: 50, MSP_BOXNAMES: 1},
+        data_sizes={MSP_ATTITUDE: 10, MSP_BOXNAMES: 200}
+    )
+
+    assert scheduler.planned_byte_rate == pytest.approx(
+        50 * (MESSAGE_OVERHEAD_SIZE + 10) + (MESSAGE_OVERHEAD_SIZE + 200)
+    )
+
+def test_run_once_polls_all_due_commands_in_one_batch(multiwii):
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 50, MSP_STATUS: 1})
+
+    polled = scheduler.run_once()
+
+    multiwii.get_many.assert_called_once()
+
+    assert dict(polled) == {MSP_ATTITUDE: MSP_ATTITUDE.code, MSP_STATUS: MSP_STATUS.code}
+
+    # Neither command is due again immediately after being polled.
+    assert scheduler.run_once() == []
+
+def test_run_once_respects_byte_budget(multiwii):
+    scheduler = TelemetryScheduler(
+        multiwii,
+        {MSP_ATTITUDE: 50, MSP_RAW_GPS: 50},
+        baudrate=10,
+        burst_duration=0.001
+    )
+
+    assert len(scheduler.run_once()) == 1
+
+def test_run_once_counts_timeouts(multiwii):
+    multiwii.get_many.side_effect = MspMessageTimeoutError()
+
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 50})
+
+    assert scheduler.run_once() == []
+    assert scheduler.timeout_count == 1
+    assert scheduler.achieved_rates[MSP_ATTITUDE] == 0
+
+def test_run_achieves_planned_rates(multiwii):
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 100, MSP_STATUS: 10})
+
+    polled = []
+
+    scheduler.run(lambda command, value: polled.append(command), duration=0.5)
+
+    assert 45 <= polled.count(MSP_ATTITUDE) <= 52
+    assert 4 <= polled.count(MSP_STATUS) <= 6
+
+    rates = scheduler.achieved_rates
+
+    assert rates[MSP_ATTITUDE] == pytest.approx(100, rel=0.2)
+    assert rates[MSP_STATUS] == pytest.approx(10, rel=0.3)
+
+def test_stop(multiwii):
+    scheduler = TelemetryScheduler(multiwii, {MSP_ATTITUDE: 100})
+
+    scheduler.run(lambda command, value: scheduler.stop())
+
+    assert multiwii.get_many.call_count == 1
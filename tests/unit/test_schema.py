@@ -0,0 +1,150 @@
+from multiwii._registry import _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP
+
+from multiwii.commands import (
+    MSP_SET_MISC,
+    MSP_SET_MOTOR,
+    MSP_SET_PID,
+    MSP_SET_RAW_RC,
+    MSP_SET_RC_TUNING,
+    MSP_SET_WP
+)
+
+from multiwii.config import MultiWiiCapability, MultiWiiSensor
+
+from multiwii.data import (
+    MspAttitude,
+    MspBoxIds,
+    MspMotor,
+    MspPid,
+    MspRawGps,
+    MspRawImu,
+    MspRc,
+    MspRcTuning,
+    MspSetMisc,
+    MspWaypoint
+)
+
+from multiwii.data._schema import _Field, _Flags, _get_value_count, _schema
+
+from dataclasses import dataclass
+
+from struct import calcsize
+
+import pytest
+
+SCHEMA_COMMANDS = [
+    (command, data_structure_type)
+    for command, data_structure_type in _COMMAND_TO_DATA_STRUCTURE_TYPE_MAP.items()
+    if hasattr(data_structure_type, '_FIELDS')
+] + [
+    (MSP_SET_MISC, MspSetMisc),
+    (MSP_SET_MOTOR, MspMotor),
+    (MSP_SET_PID, MspPid),
+    (MSP_SET_RAW_RC, MspRc),
+    (MSP_SET_RC_TUNING, MspRcTuning),
+    (MSP_SET_WP, MspWaypoint)
+]
+
+def get_schema_format(data_structure_type):
+    return '<' + ''.join(field.format for field in data_structure_type._FIELDS)
+
+@pytest.mark.parametrize("command, data_structure_type", SCHEMA_COMMANDS)
+def test_schema_matches_command_format(command, data_structure_type):
+    schema_format = get_schema_format(data_structure_type)
+
+    assert calcsize(schema_format) == command.data_size
+
+    assert _get_value_count(schema_format[1:]) == command.data_struct_field_count
+
+@pytest.mark.parametrize("command, data_structure_type", SCHEMA_COMMANDS)
+def test_schema_round_trip(command, data_structure_type):
+    value_count = _get_value_count(get_schema_format(data_structure_type)[1:])
+
+    data = tuple((index % 8) * 10 for index in range(value_count))
+
+    assert data_structure_type.parse(data).as_serializable() == data
+
+@pytest.mark.parametrize("data_structure_type", [MspAttitude, MspRawGps, MspSetMisc])
+def test_schema_parse_invalid_length(data_structure_type):
+    with pytest.raises(TypeError):
+        data_structure_type.parse((1, 2))
+
+def test_schema_scaled_fields():
+    data = MspRawGps.parse((1, 6, 123456789, 987654321, 100, 150, 270))
+
+    assert data.coordinates.latitude == 12.3456789
+    assert data.speed == 150
+    assert data.ground_course == 27.0
+
+    data.ground_course = 27.06
+
+    assert data.as_serializable()[-1] == 271
+
+@pytest.mark.parametrize("value, members", [
+    (0b00000, ()),
+    (0b00101, (MultiWiiCapability.Bind, MultiWiiCapability.Flap)),
+    (0b11111, tuple(MultiWiiCapability))
+])
+def test_flags_bit_masks(value, members):
+    flags = _Flags(MultiWiiCapability)
+
+    assert flags.decode(value) == members
+
+    assert flags.encode(members) == value
+
+@pytest.mark.parametrize("value, members", [
+    (0b00000, ()),
+    (0b00011, (MultiWiiSensor.Acc, MultiWiiSensor.Baro)),
+    (0b11000, (MultiWiiSensor.Gps, MultiWiiSensor.Sonar))
+])
+def test_flags_bit_positions(value, members):
+    flags = _Flags(MultiWiiSensor, uses_bit_positions=True)
+
+    assert flags.decode(value) == members
+
+    assert flags.encode(members) == value
+
+@pytest.mark.parametrize("command, data_structure_type", SCHEMA_COMMANDS)
+def test_schema_parse_into(command, data_structure_type):
+    value_count = _get_value_count(get_schema_format(data_structure_type)[1:])
+
+    instance = data_structure_type.parse((0,) * value_count)
+
+    data = tuple((index % 8) * 10 for index in range(value_count))
+
+    assert data_structure_type.parse_into(instance, data) is instance
+
+    assert instance == data_structure_type.parse(data)
+
+def test_parse_into_by_copy():
+    instance = MspBoxIds.parse((0, 1))
+
+    assert MspBoxIds.parse_into(instance, (2, 3, 5)) is instance
+
+    assert instance == MspBoxIds.parse((2, 3, 5))
+
+def test_raw_imu_parse_into_units():
+    instance = MspRawImu.parse((0,) * 9)
+
+    MspRawImu.parse_into(instance, tuple(range(9)), accelerometer_unit=2.0)
+
+    assert instance == MspRawImu.parse(tuple(range(9)), accelerometer_unit=2.0)
+
+def test_schema_compiles_methods_on_first_call():
+    @_schema(_Field('value', 'H', 10))
+    @dataclass(slots=True)
+    class Example:
+        value: float
+
+    def get_code_filename(name):
+        return Example.__dict__[name].__func__.__code__.co_filename
+
+    assert get_code_filename('parse') != '<Example.parse>'
+
+    assert Example.parse((15,)) == Example(1.5)
+
+    assert get_code_filename('parse') == '<Example.parse>'
+
+    assert Example.parse.__doc__.startswith('Parses a tuple of data values')
+
+    assert Example(1.5).as_serializable() == (15,)
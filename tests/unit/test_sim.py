@@ -0,0 +1,168 @@
+from multiwii import MultiWii
+
+from multiwii._command import _MspCommand
+
+from multiwii import commands
+
+from multiwii.commands import (
+    MSP_ATTITUDE,
+    MSP_MOTOR_PINS,
+    MSP_RC_TUNING,
+    MSP_SET_RC_TUNING,
+    MSP_SET_WP,
+    MSP_WP
+)
+
+from multiwii.data import MspMotorPins, MspRcTuning
+
+from multiwii.messaging import (
+    _create_request_message,
+    _MspFrameDecoder,
+    _crc8_xor,
+    MspMessageTimeoutError
+)
+
+from multiwii.sim import SimulatedFlightController
+
+from multiwii.transport import LoopbackTransport
+
+from serial import Serial
+from struct import error as StructError
+
+import pytest
+
+READ_COMMANDS = [
+    value for value in vars(commands).values()
+    if isinstance(value, _MspCommand) and not value.is_set_command
+]
+
+@pytest.fixture
+def simulator_transport():
+    host_transport, simulator_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    with SimulatedFlightController(simulator_transport):
+        yield host_transport
+
+def create_request_message(code, data):
+    payload = bytes((len(data), code)) + data
+
+    return b'$M>' + payload + bytes((_crc8_xor(payload),))
+
+def request_frame(transport, message):
+    transport.write(message)
+
+    decoder = _MspFrameDecoder()
+
+    buffer = bytearray(256)
+
+    while True:
+        count = transport.read_into(buffer)
+
+        assert count, 'No response message was received from the simulator.'
+
+        frames = decoder.feed(memoryview(buffer)[:count])
+
+        if frames:
+            return frames[0]
+
+@pytest.mark.parametrize("command", READ_COMMANDS)
+def test_simulator_answers_read_command(simulator_transport, command):
+    frame = request_frame(simulator_transport, _create_request_message(command, ()))
+
+    assert not frame.is_error
+    assert frame.code == command.code
+    assert frame.payload[0] == len(frame.payload) - 2
+
+    if not command.has_variable_size:
+        assert frame.payload[0] == command.data_size
+
+def test_simulator_acknowledges_set_command(simulator_transport):
+    message = _create_request_message(MSP_SET_RC_TUNING, (1, 2, 3, 4, 5, 6, 7))
+
+    frame = request_frame(simulator_transport, message)
+
+    assert not frame.is_error
+    assert frame.payload == bytes((0, MSP_SET_RC_TUNING.code))
+
+def test_simulator_rejects_unknown_command(simulator_transport):
+    frame = request_frame(simulator_transport, create_request_message(150, b''))
+
+    assert frame.is_error
+    assert frame.code == 150
+
+def test_simulator_rejects_invalid_data_size(simulator_transport):
+    message = create_request_message(MSP_SET_RC_TUNING.code, b'\x01\x02')
+
+    frame = request_frame(simulator_transport, message)
+
+    assert frame.is_error
+
+def test_simulator_reflects_set_commands(simulator_transport):
+    multiwii = MultiWii(simulator_transport)
+
+    multiwii._send_request_message(MSP_SET_RC_TUNING, (100, 70, 10, 20, 30, 40, 50))
+
+    multiwii.set_head(90)
+
+    assert multiwii.get_data(MSP_RC_TUNING) == MspRcTuning(100, 70, 10, 20, 30, 40, 50)
+    assert multiwii._read_response_message(MSP_ATTITUDE).data[2] == 90
+
+def test_simulator_stores_waypoints():
+    host_transport, simulator_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    waypoint = (3, 100, 200, 300, 45, 10, 0)
+
+    with SimulatedFlightController(simulator_transport) as simulator:
+        request_frame(host_transport, _create_request_message(MSP_SET_WP, waypoint))
+
+        assert simulator.get_values(MSP_WP, bytes((3,))) == waypoint
+        assert simulator.get_values(MSP_WP, bytes((4,)))[0] == 4
+
+def test_simulator_reset_config_restores_defaults(simulator_transport):
+    multiwii = MultiWii(simulator_transport)
+
+    multiwii._send_request_message(MSP_SET_RC_TUNING, (100, 70, 10, 20, 30, 40, 50))
+
+    multiwii.reset_config()
+
+    assert multiwii.get_data(MSP_RC_TUNING) == MspRcTuning(90, 65, 0, 0, 0, 50, 0)
+
+def test_simulator_over_pty():
+    with SimulatedFlightController() as simulator:
+        with Serial(simulator.device_path, 115200, timeout=0.05) as serial_port:
+            multiwii = MultiWii(serial_port)
+
+            multiwii.uses_persistent_stream = True
+
+            motor_pins = multiwii.get_data(MSP_MOTOR_PINS)
+
+        assert motor_pins == MspMotorPins(9, 10, 11, 3, 0, 0, 0, 0)
+        assert simulator.request_count == 1
+
+def test_simulator_start_twice():
+    host_transport, simulator_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    with SimulatedFlightController(simulator_transport) as simulator:
+        assert simulator.is_running
+
+        with pytest.raises(RuntimeError):
+            simulator.start()
+
+    assert not simulator.is_running
+
+def test_simulator_stop_raises_handler_error(monkeypatch):
+    host_transport, simulator_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    simulator = SimulatedFlightController(simulator_transport)
+
+    monkeypatch.setattr(simulator, 'get_values', lambda *args: (1, 2))
+
+    simulator.start()
+
+    with pytest.raises(MspMessageTimeoutError):
+        MultiWii(host_transport).get_data(MSP_ATTITUDE, timeout=0.1)
+
+    with pytest.raises(StructError):
+        simulator.close()
+
+    assert not simulator.is_running
@@ -0,0 +1,96 @@
+from multiwii import MultiWii
+
+from multiwii.commands import MSP_ATTITUDE, MSP_BOXNAMES, MSP_COMP_GPS, MSP_RAW_IMU
+
+from multiwii.data import MspCompGps
+
+from multiwii.sim import create_response_message
+
+from multiwii.transport import LoopbackTransport
+
+from struct import pack
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from multiwii.store import ColumnRingBuffer, TelemetryStore
+
+def test_column_ring_buffer_columns():
+    buffer = ColumnRingBuffer(MSP_RAW_IMU, 4)
+
+    assert buffer.column_names[:3] == ('accelerometer_x', 'accelerometer_y', 'accelerometer_z')
+    assert len(buffer.column_names) == 9
+    assert buffer.get_column('gyroscope_z').dtype == np.int16
+    assert len(buffer) == 0
+
+def test_column_ring_buffer_wraps_around():
+    buffer = ColumnRingBuffer(MSP_ATTITUDE, 3)
+
+    for index in range(5):
+        buffer.append(index * 1000, (index, -index, 360 - index))
+
+    assert len(buffer) == 3
+    assert buffer.total_count == 5
+    assert buffer.get_timestamps().tolist() == [2000, 3000, 4000]
+    assert buffer.get_column('roll_angle').tolist() == [-2, -3, -4]
+    assert buffer.get_columns()['yaw_angle'].tolist() == [358, 357, 356]
+
+    buffer.clear()
+
+    assert len(buffer) == 0
+
+def test_column_ring_buffer_append_raw():
+    buffer = ColumnRingBuffer(MSP_ATTITUDE, 2, ('pitch', 'roll', 'yaw'))
+
+    buffer.append_raw(1, pack('<3h', -15, 20, 270))
+
+    assert [buffer.get_column(name)[0] for name in buffer.column_names] == [-15, 20, 270]
+
+@pytest.mark.parametrize("command, capacity, column_names", [
+    (MSP_BOXNAMES, 4, None),
+    (MSP_ATTITUDE, 0, None),
+    (MSP_ATTITUDE, 4, ('pitch', 'roll'))
+])
+def test_column_ring_buffer_invalid_arguments(command, capacity, column_names):
+    with pytest.raises(ValueError):
+        ColumnRingBuffer(command, capacity, column_names)
+
+def test_telemetry_store_append_frame():
+    store = TelemetryStore([MSP_ATTITUDE], capacity=8)
+
+    assert MSP_ATTITUDE in store
+    assert MSP_COMP_GPS not in store
+
+    data = pack('<3h', 12, -34, 90)
+
+    assert store.append_frame(5, create_response_message(MSP_ATTITUDE.code, data))
+    assert not store.append_frame(6, create_response_message(MSP_ATTITUDE.code, data[:4]))
+    assert not store.append_frame(
+        7,
+        create_response_message(MSP_ATTITUDE.code, data, is_error=True)
+    )
+    assert not store.append_frame(8, create_response_message(MSP_COMP_GPS.code, bytes(5)))
+
+    assert store[MSP_ATTITUDE].get_timestamps().tolist() == [5]
+    assert store[MSP_ATTITUDE].get_column('pitch_angle').tolist() == [12]
+
+def test_multiwii_telemetry_store():
+    host_transport, fc_transport = LoopbackTransport.create_pair(timeout=0.05)
+
+    multiwii = MultiWii(host_transport)
+
+    multiwii.uses_persistent_stream = True
+
+    multiwii.telemetry_store = TelemetryStore([MSP_ATTITUDE, MSP_COMP_GPS])
+
+    fc_transport.write(
+        create_response_message(MSP_ATTITUDE.code, pack('<3h', 1, 2, 3)) +
+        create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+    )
+
+    assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+
+    # The attitude frame is stored although it was not awaited.
+    assert multiwii.telemetry_store[MSP_ATTITUDE].get_column('yaw_angle').tolist() == [3]
+    assert multiwii.telemetry_store[MSP_COMP_GPS].get_column('update_status').tolist() == [1]
@@ -0,0 +1,98 @@
+from multiwii import MultiWii
+
+from multiwii.commands import MSP_SET_RAW_RC
+
+from multiwii.data import MspRc
+
+from multiwii.messaging import _create_request_message, _MspFrameDecoder, MESSAGE_OUTGOING_HEADER
+
+from multiwii.streamer import RcStreamer
+
+from multiwii.transport import LoopbackTransport
+
+from time          import sleep
+from unittest.mock import MagicMock
+
+import pytest
+
+SETPOINT = MspRc(1500, 1500, 1500, 1000, 1000, 1000, 1000, 1000)
+
+@pytest.fixture
+def transports():
+    return LoopbackTransport.create_pair(timeout=0.05)
+
+def receive_frames(transport):
+    decoder = _MspFrameDecoder(MESSAGE_OUTGOING_HEADER)
+
+    return decoder.read_from(transport, transport.in_waiting)
+
+@pytest.mark.parametrize("rate, spin_duration", [(0, 0.0), (-50, 0.0), (50, -0.001)])
+def test_streamer_invalid_parameters(rate, spin_duration):
+    with pytest.raises(ValueError):
+        RcStreamer(MagicMock(), SETPOINT, rate, spin_duration)
+
+def test_streamer_encodes_setpoint():
+    streamer = RcStreamer(MagicMock(), SETPOINT)
+
+    assert streamer._frame == _create_request_message(MSP_SET_RAW_RC, SETPOINT.as_serializable())
+
+def test_streamer_sends_at_rate(transports):
+    host_transport, fc_transport = transports
+
+    with RcStreamer(MultiWii(host_transport), SETPOINT, rate=200) as streamer:
+        sleep(0.25)
+
+    frames = receive_frames(fc_transport)
+
+    assert len(frames) == streamer.send_count
+    assert 40 <= streamer.send_count <= 52
+    assert all(frame.code == MSP_SET_RAW_RC.code for frame in frames)
+
+def test_streamer_sends_updated_setpoint(transports):
+    host_transport, fc_transport = transports
+
+    setpoint = MspRc(1600, 1400, 1500, 1200, 1000, 1000, 1000, 1000)
+
+    with RcStreamer(MultiWii(host_transport), SETPOINT, rate=100) as streamer:
+        sleep(0.05)
+
+        streamer.setpoint = setpoint
+
+        sleep(0.05)
+
+    frames = receive_frames(fc_transport)
+
+    assert MSP_SET_RAW_RC.data_struct.unpack_from(frames[0].payload, 2) == (
+        SETPOINT.as_serializable()
+    )
+    assert MSP_SET_RAW_RC.data_struct.unpack_from(frames[-1].payload, 2) == (
+        setpoint.as_serializable()
+    )
+    assert streamer.setpoint is setpoint
+
+def test_streamer_skips_missed_sends():
+    multiwii = MagicMock()
+
+    multiwii.send_message.side_effect = lambda message: sleep(0.03)
+
+    with RcStreamer(multiwii, SETPOINT, rate=100) as streamer:
+        sleep(0.1)
+
+    assert streamer.overrun_count > 0
+    assert streamer.send_count <= 5
+
+def test_streamer_raises_write_error():
+    multiwii = MagicMock()
+
+    multiwii.send_message.side_effect = ConnectionError
+
+    streamer = RcStreamer(multiwii, SETPOINT)
+
+    streamer.start()
+
+    sleep(0.01)
+
+    with pytest.raises(ConnectionError):
+        streamer.stop()
+
+    assert not streamer.is_running
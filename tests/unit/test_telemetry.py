@@ -1,5 +1,8 @@
 from multiwii.data import MspAltitude, MspAttitude, MspRawImu, Point3D
 
+from dataclasses import is_dataclass
+
+import multiwii.data as data_module
 import pytest
 
 @pytest.mark.parametrize(
@@ -33,7 +36,7 @@ def test_msp_altitude_parse_invalid_data(data):
     "data, expected_pitch, expected_roll, expected_yaw",
     [
         (
-            (2000, 1500, 0, 180),
+            (2000, 1500, 180),
             200.0,
             150.0,
             180
@@ -122,3 +125,12 @@ def test_msp_raw_imu_parse_with_units(data, expected_accelerometer, expected_gyr
 def test_msp_raw_imu_parse_invalid_data(data):
     with pytest.raises(TypeError):
         MspRawImu.parse(data)
+
+@pytest.mark.parametrize("data_structure_type", [
+    getattr(data_module, name)
+    for name in data_module.__all__
+    if is_dataclass(getattr(data_module, name))
+])
+def test_data_structures_are_slotted(data_structure_type):
+    assert '__slots__' in vars(data_structure_type)
+    assert '__dict__' not in vars(data_structure_type)
@@ -0,0 +1,217 @@
+from multiwii import MultiWii
+
+from multiwii.commands import MSP_COMP_GPS
+
+from multiwii.data import MspCompGps
+
+from multiwii.sim import create_response_message
+
+from multiwii.transport import (
+    _create_transport,
+    _write_buffers,
+    FdTransport,
+    LoopbackTransport,
+    SerialTransport,
+    TcpTransport,
+    Transport,
+    UdpTransport
+)
+
+from serial        import Serial
+from threading     import Thread
+from unittest.mock import MagicMock
+
+import os
+import pytest
+import socket
+
+RESPONSE_FRAME = create_response_message(MSP_COMP_GPS.code, b'\x0a\x00\x5a\x00\x01')
+
+def respond_once(read, write):
+    request = b''
+
+    while len(request) < 6:
+        request += read()
+
+    write(RESPONSE_FRAME)
+
+@pytest.mark.parametrize("value", ['invalid_serial_port', None, 42])
+def test_create_transport_invalid_value(value):
+    with pytest.raises(TypeError):
+        _create_transport(value)
+
+def test_create_transport_wraps_serial_port():
+    serial_port = MagicMock(spec=Serial)
+
+    transport = _create_transport(serial_port)
+
+    assert isinstance(transport, SerialTransport)
+    assert transport.serial_port is serial_port
+
+@pytest.mark.parametrize("baudrate, expected_byte_time", [(115200, 10 / 115200), (9600, 10 / 9600)])
+def test_serial_transport_byte_time(baudrate, expected_byte_time):
+    serial_port = MagicMock(spec=Serial)
+
+    serial_port.baudrate = baudrate
+    serial_port.bytesize = 8
+    serial_port.parity = 'N'
+    serial_port.stopbits = 1
+
+    assert SerialTransport(serial_port).byte_time == pytest.approx(expected_byte_time)
+
+def test_serial_transport_read_into():
+    serial_port = MagicMock(spec=Serial)
+
+    serial_port.read.return_value = b'\x01\x02'
+
+    buffer = bytearray(4)
+
+    assert SerialTransport(serial_port).read_into(buffer) == 2
+    assert buffer == b'\x01\x02\x00\x00'
+
+    serial_port.read.assert_called_once_with(4)
+
+def test_loopback_transport_pair():
+    host, fc = LoopbackTransport.create_pair(timeout=0)
+
+    assert isinstance(host, Transport)
+
+    host.write(b'abc')
+
+    buffer = bytearray(2)
+
+    assert fc.in_waiting == 3
+    assert fc.read_into(buffer) == 2
+    assert buffer == b'ab'
+    assert fc.in_waiting == 1
+
+    fc.reset_input_buffer()
+
+    assert fc.read_into(buffer) == 0
+
+def test_loopback_transport_with_multiwii():
+    host, fc = LoopbackTransport.create_pair(timeout=1.0)
+
+    def read():
+        buffer = bytearray(64)
+
+        return bytes(buffer[:fc.read_into(buffer)])
+
+    Thread(target=respond_once, args=(read, fc.write), daemon=True).start()
+
+    multiwii = MultiWii(host)
+
+    assert multiwii.serial_port is None
+    assert multiwii.transport is host
+    assert multiwii.get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+
+def test_fd_transport_open_pty():
+    transport, slave_path = FdTransport.open_pty(timeout=1.0)
+
+    try:
+        with Serial(slave_path, baudrate=115200, timeout=1.0) as serial_port:
+            serial_port.write(b'$M>')
+
+            buffer = bytearray(8)
+
+            assert transport.read_into(buffer) == 3
+            assert buffer[:3] == b'$M>'
+
+            transport.write(RESPONSE_FRAME)
+
+            assert serial_port.read(len(RESPONSE_FRAME)) == RESPONSE_FRAME
+    finally:
+        transport.close()
+
+def test_fd_transport_pipe():
+    read_fd, write_fd = os.pipe()
+
+    reader = FdTransport(read_fd, timeout=0, owns_fd=True)
+    writer = FdTransport(write_fd, owns_fd=True)
+
+    try:
+        buffer = bytearray(8)
+
+        assert reader.read_into(buffer) == 0
+
+        writer.write(b'\x01\x02\x03')
+
+        assert reader.in_waiting == 3
+        assert reader.read_into(buffer) == 3
+        assert buffer[:3] == b'\x01\x02\x03'
+    finally:
+        reader.close()
+        writer.close()
+
+def test_fd_transport_write_many():
+    read_fd, write_fd = os.pipe()
+
+    reader = FdTransport(read_fd, timeout=0, owns_fd=True)
+    writer = FdTransport(write_fd, owns_fd=True)
+
+    buffers = [bytes((index % 256,)) * (index % 3) for index in range(2000)]
+
+    try:
+        expected = b''.join(buffers)
+
+        assert _write_buffers(writer, buffers) == len(expected)
+
+        received = bytearray()
+
+        buffer = bytearray(4096)
+
+        while count := reader.read_into(buffer):
+            received += buffer[:count]
+
+        assert received == expected
+    finally:
+        reader.close()
+        writer.close()
+
+def test_write_buffers_joins_for_other_transports():
+    transport = MagicMock(spec=Transport)
+
+    transport.write.return_value = 4
+
+    assert _write_buffers(transport, [b'\x01', b'\x02\x03', b'\x04']) == 4
+
+    transport.write.assert_called_once_with(b'\x01\x02\x03\x04')
+
+def test_tcp_transport_with_multiwii():
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        def serve():
+            connection, _ = server.accept()
+
+            with connection:
+                respond_once(lambda: connection.recv(64), connection.sendall)
+
+                connection.recv(64)
+
+        Thread(target=serve, daemon=True).start()
+
+        transport = TcpTransport(*server.getsockname(), timeout=1.0)
+
+        try:
+            assert MultiWii(transport).get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+        finally:
+            transport.close()
+
+def test_udp_transport_with_multiwii():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as bridge:
+        bridge.bind(('127.0.0.1', 0))
+
+        transport = UdpTransport(*bridge.getsockname(), timeout=1.0)
+
+        def serve():
+            request, address = bridge.recvfrom(64)
+
+            # Split the response over two datagrams to exercise the stream reassembly.
+            bridge.sendto(RESPONSE_FRAME[:4], address)
+            bridge.sendto(RESPONSE_FRAME[4:], address)
+
+        Thread(target=serve, daemon=True).start()
+
+        try:
+            assert MultiWii(transport).get_data(MSP_COMP_GPS) == MspCompGps(10, 90, 1)
+        finally:
+            transport.close()
@@ -0,0 +1,133 @@
+from multiwii.commands import (
+    MSP_ANALOG,
+    MSP_BOXIDS,
+    MSP_COMP_GPS,
+    MSP_MISC,
+    MSP_PID,
+    MSP_RAW_GPS,
+    MSP_RAW_IMU,
+    MSP_STATUS
+)
+
+from multiwii.config import MultiWiiSensor
+
+from multiwii.data import (
+    Coordinates,
+    MspAnalog,
+    MspBoxIds,
+    MspCompGps,
+    MspRawGps,
+    Pid,
+    Point3D
+)
+
+from multiwii.views import _UNDECODED, create_response_view, MspResponseView
+
+from struct import error as StructError
+
+import pytest
+
+def create_payload(command, *values):
+    data = command.data_struct.pack(*values)
+
+    return bytes((len(data), command.code)) + data
+
+def test_create_response_view_decodes_fields():
+    view = create_response_view(
+        MSP_RAW_GPS,
+        create_payload(MSP_RAW_GPS, 1, 9, 523456789, 12345678, 100, 250, 1234)
+    )
+
+    assert isinstance(view, MspResponseView)
+
+    assert view.fix == 1
+    assert view.satellites == 9
+    assert view.coordinates == Coordinates(52.3456789, 1.2345678)
+    assert view.altitude == 100
+    assert view.speed == 250
+    assert view.ground_course == 123.4
+
+def test_create_response_view_decodes_only_read_fields():
+    view = create_response_view(MSP_ANALOG, create_payload(MSP_ANALOG, 125, 2, 3, 4))
+
+    assert view.voltage == 12.5
+
+    assert view._values[1:] == [_UNDECODED] * 3
+
+def test_create_response_view_caches_fields():
+    view = create_response_view(
+        MSP_RAW_IMU,
+        create_payload(MSP_RAW_IMU, *range(9))
+    )
+
+    assert view.gyroscope == Point3D(3, 4, 5)
+
+    assert view.gyroscope is view.gyroscope
+
+def test_create_response_view_materialize():
+    view = create_response_view(MSP_COMP_GPS, create_payload(MSP_COMP_GPS, 10, 90, 1))
+
+    data = view.materialize()
+
+    assert data == MspCompGps(10, 90, 1)
+
+    assert view == data
+
+def test_create_response_view_equality():
+    payload = create_payload(MSP_ANALOG, 125, 2, 3, 4)
+
+    view = create_response_view(MSP_ANALOG, payload)
+
+    assert view == create_response_view(MSP_ANALOG, payload)
+
+    assert view == MspAnalog(12.5, 2, 3, 4)
+
+    assert view != MspAnalog(12.6, 2, 3, 4)
+
+def test_create_response_view_repr():
+    view = create_response_view(MSP_COMP_GPS, create_payload(MSP_COMP_GPS, 10, 90, 1))
+
+    assert repr(view) == (
+        'MspCompGpsView(distance_to_home=10, direction_to_home=90, update_status=1)'
+    )
+
+def test_create_response_view_grouped_fields():
+    view = create_response_view(MSP_PID, create_payload(MSP_PID, *range(30)))
+
+    assert view.roll == Pid(0, 1, 2)
+
+    assert view.velocity == Pid(27, 28, 29)
+
+def test_create_response_view_scaled_fields():
+    view = create_response_view(
+        MSP_MISC,
+        create_payload(MSP_MISC, 1, 2, 3, 4, 5, 6, 7, 35, 9, 100, 105, 95)
+    )
+
+    assert view.magnetometer_declination == 3.5
+
+    assert view.battery_critical == 9.5
+
+def test_create_response_view_sensors():
+    view = create_response_view(MSP_STATUS, create_payload(MSP_STATUS, 3000, 0, 0b01010, 0, 0))
+
+    assert view.sensors == (MultiWiiSensor.Baro, MultiWiiSensor.Gps)
+
+def test_create_response_view_is_read_only():
+    view = create_response_view(MSP_ANALOG, create_payload(MSP_ANALOG, 125, 2, 3, 4))
+
+    with pytest.raises(AttributeError):
+        view.voltage = 1.0
+
+def test_create_response_view_variable_size_command():
+    assert create_response_view(MSP_BOXIDS, bytes((3, MSP_BOXIDS.code, 0, 1, 2))) == (
+        MspBoxIds.parse((0, 1, 2))
+    )
+
+def test_create_response_view_invalid_size():
+    with pytest.raises(StructError):
+        create_response_view(MSP_ANALOG, bytes((2, MSP_ANALOG.code, 1, 2)))
+
+def test_create_response_view_invalid_command_code():
+    with pytest.raises(ValueError):
+        create_response_view(MSP_ANALOG, bytes((7, MSP_COMP_GPS.code)) + bytes(7))